@@ -4,23 +4,23 @@ Reference: ADR-03 API Design, PRD-02 Agent API
 
 Handles:
 - POST /agent/questions - Create a new question
+- POST /agent/questions/batch - Create several questions at once
 - GET /agent/questions/{question_id} - Poll for responses
+- GET /agent/questions?ids=... - Poll several questions at once
 """
 
-import json
 import logging
 from typing import Any
 
 from ..models.question import (
-    DEFAULT_MIN_RESPONSES,
-    DEFAULT_TIMEOUT_SECONDS,
-    MAX_MIN_RESPONSES,
-    MAX_PROMPT_LENGTH,
-    MAX_TIMEOUT_SECONDS,
+    MAX_POLL_IDS,
     Question,
     get_question_with_responses,
+    get_questions_with_responses,
     save_question,
+    save_questions,
 )
+from ..models.requests import CreateQuestionRequest, CreateQuestionsRequest, RequestValidationError
 from ..utils.api_response import (
     created,
     question_not_found,
@@ -28,6 +28,7 @@ from ..utils.api_response import (
     success,
     validation_error,
 )
+from ..utils.events import get_map, get_route
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -46,12 +47,16 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:  # noqa: ARG
         API Gateway response dictionary.
     """
     try:
-        http_method = event.get("requestContext", {}).get("http", {}).get("method", "")
+        http_method, path = get_route(event)
 
         if http_method == "POST":
+            if path.endswith("/batch"):
+                return handle_create_questions(event)
             return handle_create_question(event)
         elif http_method == "GET":
-            return handle_get_question(event)
+            if get_map(event, "pathParameters").get("question_id"):
+                return handle_get_question(event)
+            return handle_get_questions(event)
         else:
             return validation_error(f"Unsupported method: {http_method}")
 
@@ -60,7 +65,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:  # noqa: ARG
         return server_error(str(e))
 
 
-def handle_create_question(event: dict[str, Any]) -> dict[str, Any]:  # noqa: C901
+def handle_create_question(event: dict[str, Any]) -> dict[str, Any]:
     """Handle POST /agent/questions - Create a new question.
 
     Request body:
@@ -79,96 +84,95 @@ def handle_create_question(event: dict[str, Any]) -> dict[str, Any]:  # noqa: C9
     Returns:
         API Gateway response dictionary.
     """
-    # Parse request body
     try:
-        body = json.loads(event.get("body", "{}"))
-    except json.JSONDecodeError:
-        return validation_error("Invalid JSON in request body")
+        request = CreateQuestionRequest.from_json(event.get("body"))
+    except RequestValidationError as e:
+        return e.response
 
-    # Validate required fields
-    prompt = body.get("prompt")
-    if not prompt:
-        return validation_error(
-            "prompt is required",
-            details={"field": "prompt", "constraint": "required"},
-        )
+    # Extract agent_id from header (optional, for future rate limiting)
+    agent_id = get_map(event, "headers").get("x-agent-id")
 
-    if len(prompt) > MAX_PROMPT_LENGTH:
-        return validation_error(
-            f"prompt must be at most {MAX_PROMPT_LENGTH} characters",
-            details={"field": "prompt", "constraint": "length", "max": MAX_PROMPT_LENGTH},
-        )
+    # Create and save the question
+    question = _new_question(request, agent_id)
 
-    question_type = body.get("type")
-    if question_type not in ("text", "multiple_choice"):
-        return validation_error(
-            "type must be 'text' or 'multiple_choice'",
-            details={"field": "type", "constraint": "enum", "allowed": ["text", "multiple_choice"]},
-        )
+    save_question(question)
 
-    # Validate options for multiple choice
-    options = body.get("options")
-    if question_type == "multiple_choice":
-        if not options or not isinstance(options, list):
-            return validation_error(
-                "options is required for multiple_choice questions",
-                details={"field": "options", "constraint": "required"},
-            )
-        if len(options) < 2 or len(options) > 10:
-            return validation_error(
-                "options must have 2-10 items",
-                details={"field": "options", "constraint": "length", "min": 2, "max": 10},
-            )
-
-    # Validate optional fields
-    min_responses = body.get("min_responses", DEFAULT_MIN_RESPONSES)
-    if not isinstance(min_responses, int) or min_responses < 1 or min_responses > MAX_MIN_RESPONSES:
-        return validation_error(
-            f"min_responses must be between 1 and {MAX_MIN_RESPONSES}",
-            details={"field": "min_responses", "constraint": "range", "min": 1, "max": MAX_MIN_RESPONSES},
-        )
+    logger.info("Created question %s", question.question_id)
 
-    timeout_seconds = body.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)
-    if not isinstance(timeout_seconds, int) or timeout_seconds < 60 or timeout_seconds > MAX_TIMEOUT_SECONDS:
-        return validation_error(
-            f"timeout_seconds must be between 60 and {MAX_TIMEOUT_SECONDS}",
-            details={"field": "timeout_seconds", "constraint": "range", "min": 60, "max": MAX_TIMEOUT_SECONDS},
-        )
+    # Return 201 Created response
+    return created(_created_item(question))
 
-    audience = body.get("audience")
-    if audience is not None and not isinstance(audience, list):
-        return validation_error(
-            "audience must be an array of strings",
-            details={"field": "audience", "constraint": "type"},
-        )
 
-    # Extract agent_id from header (optional, for future rate limiting)
-    agent_id = event.get("headers", {}).get("x-agent-id")
+def handle_create_questions(event: dict[str, Any]) -> dict[str, Any]:
+    """Handle POST /agent/questions/batch - Create several questions at once.
 
-    # Create and save the question
-    question = Question.create(
-        prompt=prompt,
-        question_type=question_type,
-        min_responses=min_responses,
-        timeout_seconds=timeout_seconds,
-        options=options if question_type == "multiple_choice" else None,
-        audience=audience,
+    Request body:
+    {
+        "questions": [{...}, {...}]  // up to 20, each in the POST /agent/questions format
+    }
+
+    The batch is validated as a whole before anything is saved, and the
+    questions are written in one DynamoDB transaction, so either all of them
+    are created or none is.
+
+    Args:
+        event: API Gateway event dictionary.
+
+    Returns:
+        API Gateway response dictionary. The body lists the created questions
+        in request order, each in the single-create format.
+    """
+    try:
+        request = CreateQuestionsRequest.from_json(event.get("body"))
+    except RequestValidationError as e:
+        return e.response
+
+    agent_id = get_map(event, "headers").get("x-agent-id")
+    questions = [_new_question(item, agent_id) for item in request.questions]
+
+    save_questions(questions)
+
+    logger.info("Created %d questions", len(questions))
+
+    return created({"questions": [_created_item(question) for question in questions]})
+
+
+def _new_question(request: CreateQuestionRequest, agent_id: str | None) -> Question:
+    """Build a new question from a validated create request.
+
+    Args:
+        request: The validated create request.
+        agent_id: The calling agent's ID from the X-Agent-ID header, if any.
+
+    Returns:
+        The new, unsaved question.
+    """
+    return Question.create(
+        prompt=request.prompt,
+        question_type=request.type,
+        min_responses=request.min_responses,
+        timeout_seconds=request.timeout_seconds,
+        options=request.options,
+        audience=request.audience,
         agent_id=agent_id,
     )
 
-    save_question(question)
 
-    logger.info("Created question %s", question.question_id)
+def _created_item(question: Question) -> dict[str, Any]:
+    """Build the create response body for one question.
 
-    # Return 201 Created response
-    return created(
-        {
-            "question_id": question.question_id,
-            "status": question.status,
-            "poll_url": f"/agent/questions/{question.question_id}",
-            "expires_at": question.expires_at,
-        }
-    )
+    Args:
+        question: The saved question.
+
+    Returns:
+        The question ID, status, poll URL and expiry.
+    """
+    return {
+        "question_id": question.question_id,
+        "status": question.status,
+        "poll_url": f"/agent/questions/{question.question_id}",
+        "expires_at": question.expires_at,
+    }
 
 
 def handle_get_question(event: dict[str, Any]) -> dict[str, Any]:
@@ -183,7 +187,7 @@ def handle_get_question(event: dict[str, Any]) -> dict[str, Any]:
         API Gateway response dictionary.
     """
     # Extract question_id from path parameters
-    path_params = event.get("pathParameters", {}) or {}
+    path_params = get_map(event, "pathParameters")
     question_id = path_params.get("question_id")
 
     if not question_id:
@@ -198,3 +202,37 @@ def handle_get_question(event: dict[str, Any]) -> dict[str, Any]:
     logger.info("Retrieved question %s with %d responses", question_id, len(responses))
 
     return success(question.to_agent_response(responses=responses))
+
+
+def handle_get_questions(event: dict[str, Any]) -> dict[str, Any]:
+    """Handle GET /agent/questions?ids=q_1,q_2 - Poll several questions at once.
+
+    Lets an agent waiting on many questions poll them in one request instead
+    of one request per question.
+
+    Args:
+        event: API Gateway event dictionary.
+
+    Returns:
+        API Gateway response dictionary. The body lists the questions that
+        exist, each in the single-question poll format; unknown IDs are left out.
+    """
+    raw_ids = get_map(event, "queryStringParameters").get("ids", "")
+    question_ids = [question_id for question_id in raw_ids.split(",") if question_id]
+
+    if not question_ids:
+        return validation_error(
+            "ids query parameter is required",
+            details={"field": "ids", "constraint": "required"},
+        )
+    if len(question_ids) > MAX_POLL_IDS:
+        return validation_error(
+            f"ids must list at most {MAX_POLL_IDS} question IDs",
+            details={"field": "ids", "constraint": "length", "max": MAX_POLL_IDS},
+        )
+
+    results = get_questions_with_responses(question_ids)
+
+    logger.info("Retrieved %d of %d requested questions", len(results), len(question_ids))
+
+    return success({"questions": [question.to_agent_response(responses=responses) for question, responses in results]})
@@ -8,19 +8,18 @@ Handles:
 - POST /human/responses - Submit an answer
 """
 
-import json
 import logging
 from typing import Any
 
 from ..models.question import (
     get_question,
-    list_open_questions,
-    update_question_status,
+    list_open_question_items,
 )
+from ..models.requests import RequestValidationError, SubmitResponseRequest
 from ..models.response import (
     Response,
     get_answered_question_ids,
-    save_response,
+    save_response_and_increment,
 )
 from ..utils.api_response import (
     created,
@@ -30,6 +29,7 @@ from ..utils.api_response import (
     success,
     validation_error,
 )
+from ..utils.events import get_map, get_route
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -48,8 +48,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:  # noqa: ARG
         API Gateway response dictionary.
     """
     try:
-        http_method = event.get("requestContext", {}).get("http", {}).get("method", "")
-        path = event.get("requestContext", {}).get("http", {}).get("path", "")
+        http_method, path = get_route(event)
 
         if http_method == "GET":
             if "/questions/" in path:
@@ -82,7 +81,7 @@ def handle_list_questions(event: dict[str, Any]) -> dict[str, Any]:
         API Gateway response dictionary.
     """
     # Parse query parameters
-    query_params = event.get("queryStringParameters") or {}
+    query_params = get_map(event, "queryStringParameters")
 
     limit = 20
     if "limit" in query_params:
@@ -93,7 +92,7 @@ def handle_list_questions(event: dict[str, Any]) -> dict[str, Any]:
             pass
 
     # Get fingerprint from header (for filtering already-answered questions)
-    headers = event.get("headers", {}) or {}
+    headers = get_map(event, "headers")
     fingerprint_hash = headers.get("x-fingerprint")
 
     # Get question IDs the user has already answered
@@ -101,18 +100,8 @@ def handle_list_questions(event: dict[str, Any]) -> dict[str, Any]:
     if fingerprint_hash:
         answered_ids = get_answered_question_ids(fingerprint_hash)
 
-    # Fetch open questions (fetch more to account for filtering)
-    # We fetch extra to compensate for filtered questions
-    fetch_limit = limit + len(answered_ids) if answered_ids else limit
-    fetch_limit = min(fetch_limit, 100)  # Cap at reasonable number
-    questions = list_open_questions(limit=fetch_limit)
-
-    # Filter out already-answered questions
-    if answered_ids:
-        questions = [q for q in questions if q.question_id not in answered_ids]
-
-    # Apply the original limit after filtering
-    questions = questions[:limit]
+    # Already-answered questions are filtered out by the query itself
+    questions = list_open_question_items(limit=limit, exclude_ids=answered_ids)
 
     logger.info(
         "Listed %d open questions (filtered %d already answered)",
@@ -122,7 +111,7 @@ def handle_list_questions(event: dict[str, Any]) -> dict[str, Any]:
 
     return success(
         {
-            "questions": [q.to_human_list_item() for q in questions],
+            "questions": questions,
         }
     )
 
@@ -140,7 +129,7 @@ def handle_get_question(event: dict[str, Any]) -> dict[str, Any]:
         API Gateway response dictionary.
     """
     # Extract question_id from path parameters
-    path_params = event.get("pathParameters", {}) or {}
+    path_params = get_map(event, "pathParameters")
     question_id = path_params.get("question_id")
 
     if not question_id:
@@ -163,7 +152,7 @@ def handle_get_question(event: dict[str, Any]) -> dict[str, Any]:
     return success(question.to_human_detail(can_answer=can_answer))
 
 
-def handle_submit_response(event: dict[str, Any]) -> dict[str, Any]:  # noqa: C901
+def handle_submit_response(event: dict[str, Any]) -> dict[str, Any]:
     """Handle POST /human/responses - Submit an answer.
 
     Request body:
@@ -180,19 +169,11 @@ def handle_submit_response(event: dict[str, Any]) -> dict[str, Any]:  # noqa: C9
     Returns:
         API Gateway response dictionary.
     """
-    # Parse request body
     try:
-        body = json.loads(event.get("body", "{}"))
-    except json.JSONDecodeError:
-        return validation_error("Invalid JSON in request body")
-
-    # Validate question_id
-    question_id = body.get("question_id")
-    if not question_id:
-        return validation_error(
-            "question_id is required",
-            details={"field": "question_id", "constraint": "required"},
-        )
+        request = SubmitResponseRequest.from_json(event.get("body"))
+    except RequestValidationError as e:
+        return e.response
+    question_id = request.question_id
 
     # Fetch the question
     question = get_question(question_id)
@@ -204,75 +185,30 @@ def handle_submit_response(event: dict[str, Any]) -> dict[str, Any]:  # noqa: C9
         return question_closed()
 
     # Validate answer based on question type
-    answer = body.get("answer")
-    selected_option = body.get("selected_option")
-
-    if question.type == "text":
-        if not answer or not isinstance(answer, str):
-            return validation_error(
-                "answer is required for text questions",
-                details={"field": "answer", "constraint": "required"},
-            )
-        if len(answer) > 5000:
-            return validation_error(
-                "answer must be at most 5000 characters",
-                details={"field": "answer", "constraint": "length", "max": 5000},
-            )
-        selected_option = None
-
-    elif question.type == "multiple_choice":
-        if selected_option is None or not isinstance(selected_option, int):
-            return validation_error(
-                "selected_option is required for multiple choice questions",
-                details={"field": "selected_option", "constraint": "required"},
-            )
-        if question.options and (selected_option < 0 or selected_option >= len(question.options)):
-            return validation_error(
-                f"selected_option must be between 0 and {len(question.options) - 1}",
-                details={
-                    "field": "selected_option",
-                    "constraint": "range",
-                    "min": 0,
-                    "max": len(question.options) - 1 if question.options else 0,
-                },
-            )
-        answer = None
-
-    # Validate optional confidence
-    confidence = body.get("confidence")
-    if confidence is not None and (not isinstance(confidence, int) or confidence < 1 or confidence > 5):
-        return validation_error(
-            "confidence must be between 1 and 5",
-            details={"field": "confidence", "constraint": "range", "min": 1, "max": 5},
-        )
+    try:
+        answer, selected_option = request.validate_answer(question)
+    except RequestValidationError as e:
+        return e.response
 
     # Extract fingerprint from header (optional, for future deduplication)
-    fingerprint_hash = event.get("headers", {}).get("x-fingerprint")
+    fingerprint_hash = get_map(event, "headers").get("x-fingerprint")
 
-    # Create and save the response
     response = Response.create(
         question_id=question_id,
         answer=answer,
         selected_option=selected_option,
-        confidence=confidence,
+        confidence=request.confidence,
         fingerprint_hash=fingerprint_hash,
     )
 
-    save_response(response)
-
-    # Update question response count and status
-    new_count = question.current_responses + 1
-    new_status = update_question_status(
-        question_id=question_id,
-        new_responses=new_count,
-        min_responses=question.min_responses,
-    )
+    new_status = save_response_and_increment(response, min_responses=question.min_responses)
+    if new_status is None:
+        return question_closed()
 
     logger.info(
-        "Submitted response %s to question %s. New count: %d, status: %s",
+        "Submitted response %s to question %s. New status: %s",
         response.response_id,
         question_id,
-        new_count,
         new_status,
     )
 
@@ -3,19 +3,27 @@
 Reference: ADR-02 Database Schema, ADR-03 API Design
 """
 
-import uuid
+import secrets
+import sys
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Literal
 
-from boto3.dynamodb.conditions import Key
+# Imported eagerly on purpose: creating the DynamoDB resource loads this module anyway
+# (boto3.dynamodb.transform depends on it), so deferring it would not shorten cold starts.
+from boto3.dynamodb.conditions import Attr, Key
 
 from ..utils.dynamodb import (
-    deserialize_item,
+    batch_get_items,
+    deserialize_items,
     get_questions_table,
     get_responses_table,
-    serialize_item,
+    transact_put_items,
 )
+from ..utils.question_cache import QuestionCache
+from ..utils.timestamps import utc_isoformat
 
 # Question status values
 QuestionStatus = Literal["OPEN", "PARTIAL", "CLOSED", "EXPIRED"]
@@ -27,6 +35,54 @@ MAX_TIMEOUT_SECONDS = 86400
 MAX_MIN_RESPONSES = 50
 MAX_PROMPT_LENGTH = 2000
 
+# Questions are deleted by DynamoDB TTL this long after they expire, so agents
+# can still fetch late results (PRD 04 Question Lifecycle)
+QUESTION_TTL_GRACE_SECONDS = 86400
+
+# Upper bound on index items evaluated when listing questions
+MAX_LIST_FETCH = 100
+# DynamoDB allows at most 100 operands for the IN comparator
+MAX_FILTER_IN_OPERANDS = 100
+
+# Question attributes needed to build human list items
+HUMAN_LIST_ATTRIBUTES = (
+    "question_id",
+    "prompt",
+    "type",
+    "min_responses",
+    "current_responses",
+    "created_at",
+    "options",
+    "audience",
+)
+
+# Response attributes exposed to agents when polling a question
+RESPONSE_OUTPUT_FIELDS = ("answer", "selected_option", "confidence")
+_RESPONSE_PROJECTION = ", ".join(f"#{name}" for name in RESPONSE_OUTPUT_FIELDS)
+_RESPONSE_PROJECTION_NAMES = {f"#{name}": name for name in RESPONSE_OUTPUT_FIELDS}
+
+# Sparse GSI holding only questions that accept responses (OPEN or PARTIAL).
+# The attribute is written on creation and removed when a question closes.
+ACCEPTING_INDEX = "ByAccepting"
+ACCEPTING_ATTRIBUTE = "accepting"
+ACCEPTING = "1"
+ACCEPTING_STATUSES = frozenset(("OPEN", "PARTIAL"))
+
+# Canonical status and type strings. Rows decoded from DynamoDB are mapped onto
+# these shared objects, so cached questions don't each hold their own copies.
+_CANONICAL_STRINGS = {
+    value: sys.intern(value) for value in ("OPEN", "PARTIAL", "CLOSED", "EXPIRED", "text", "multiple_choice")
+}
+
+# Most question IDs one batched poll may ask for
+MAX_POLL_IDS = 20
+
+# Reused across warm invocations for reads issued alongside the request thread.
+# Sized so a full batched poll queries every question's responses at once;
+# threads are only started when needed. Every submitted call is awaited before
+# the handler returns.
+_read_executor = ThreadPoolExecutor(max_workers=MAX_POLL_IDS, thread_name_prefix="aah-read")
+
 
 def generate_question_id() -> str:
     """Generate a unique question ID with q_ prefix.
@@ -34,12 +90,15 @@ def generate_question_id() -> str:
     Returns:
         A unique question ID string starting with 'q_'.
     """
-    return f"q_{uuid.uuid4().hex[:12]}"
+    return f"q_{secrets.token_hex(6)}"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Question:
-    """Question data model matching DynamoDB schema."""
+    """Question data model matching DynamoDB schema.
+
+    Instances are immutable so they can be shared safely through the question cache.
+    """
 
     question_id: str
     prompt: str
@@ -53,6 +112,7 @@ class Question:
     audience: list[str] | None = None
     agent_id: str | None = None
     closed_at: str | None = None
+    ttl: int | None = None
 
     @classmethod
     def create(
@@ -79,11 +139,7 @@ class Question:
         Returns:
             A new Question instance.
         """
-        now = datetime.now(timezone.utc)
-        expires_at = datetime.fromtimestamp(
-            now.timestamp() + timeout_seconds,
-            tz=timezone.utc,
-        )
+        now = time.time()
 
         return cls(
             question_id=generate_question_id(),
@@ -92,20 +148,22 @@ class Question:
             status="OPEN",
             min_responses=min_responses,
             current_responses=0,
-            created_at=now.isoformat(),
-            expires_at=expires_at.isoformat(),
+            created_at=utc_isoformat(now),
+            expires_at=utc_isoformat(now + timeout_seconds),
             options=options,
             audience=audience or ["general"],
             agent_id=agent_id,
+            ttl=int(now) + timeout_seconds + QUESTION_TTL_GRACE_SECONDS,
         )
 
     def to_dynamo_item(self) -> dict[str, Any]:
         """Convert to DynamoDB item format.
 
         Returns:
-            Dictionary suitable for DynamoDB put_item.
+            Dictionary suitable for DynamoDB put_item. Optional fields are
+            only set when present, since DynamoDB rejects None values.
         """
-        item = {
+        item: dict[str, Any] = {
             "question_id": self.question_id,
             "prompt": self.prompt,
             "type": self.type,
@@ -115,6 +173,8 @@ class Question:
             "created_at": self.created_at,
             "expires_at": self.expires_at,
         }
+        if self.status in ACCEPTING_STATUSES:
+            item[ACCEPTING_ATTRIBUTE] = ACCEPTING
         if self.options:
             item["options"] = self.options
         if self.audience:
@@ -123,7 +183,9 @@ class Question:
             item["agent_id"] = self.agent_id
         if self.closed_at:
             item["closed_at"] = self.closed_at
-        return serialize_item(item)
+        if self.ttl is not None:
+            item["ttl"] = self.ttl
+        return item
 
     @classmethod
     def from_dynamo_item(cls, item: dict[str, Any]) -> "Question":
@@ -135,20 +197,26 @@ class Question:
         Returns:
             Question instance.
         """
-        data = deserialize_item(item)
+        # Bind fields directly instead of running the generic deserialize_item
+        # pass: strings and string lists come back from boto3 as-is, and only
+        # the counters and ttl are Decimals.
+        ttl = item.get("ttl")
+        question_type = item["type"]
+        status = item["status"]
         return cls(
-            question_id=data["question_id"],
-            prompt=data["prompt"],
-            type=data["type"],
-            status=data["status"],
-            min_responses=data["min_responses"],
-            current_responses=data.get("current_responses", 0),
-            created_at=data["created_at"],
-            expires_at=data["expires_at"],
-            options=data.get("options"),
-            audience=data.get("audience"),
-            agent_id=data.get("agent_id"),
-            closed_at=data.get("closed_at"),
+            question_id=item["question_id"],
+            prompt=item["prompt"],
+            type=_CANONICAL_STRINGS.get(question_type, question_type),
+            status=_CANONICAL_STRINGS.get(status, status),
+            min_responses=int(item["min_responses"]),
+            current_responses=int(item.get("current_responses", 0)),
+            created_at=item["created_at"],
+            expires_at=item["expires_at"],
+            options=item.get("options"),
+            audience=item.get("audience"),
+            agent_id=item.get("agent_id"),
+            closed_at=item.get("closed_at"),
+            ttl=None if ttl is None else int(ttl),
         )
 
     def to_agent_response(self, responses: list[dict[str, Any]] | None = None) -> dict[str, Any]:
@@ -219,6 +287,25 @@ class Question:
         return result
 
 
+# In-process read cache for get_question. Writes made through the models
+# invalidate the entry, so only changes made elsewhere can be served stale.
+_question_cache: QuestionCache[Question] = QuestionCache()
+
+
+def clear_question_cache() -> None:
+    """Drop all cached questions."""
+    _question_cache.clear()
+
+
+def invalidate_cached_question(question_id: str) -> None:
+    """Drop one question from the read cache after it was modified elsewhere.
+
+    Args:
+        question_id: The question ID to evict.
+    """
+    _question_cache.invalidate(question_id)
+
+
 def save_question(question: Question) -> None:
     """Save a question to DynamoDB.
 
@@ -227,23 +314,107 @@ def save_question(question: Question) -> None:
     """
     table = get_questions_table()
     table.put_item(Item=question.to_dynamo_item())
+    _question_cache.invalidate(question.question_id)
+
+
+def save_questions(questions: Iterable[Question]) -> None:
+    """Save several questions in one transaction.
+
+    Either all of the questions are stored or none is, so a failed request
+    can be retried without creating duplicates.
+
+    Args:
+        questions: At most TRANSACT_WRITE_SIZE Question instances to save.
+
+    Raises:
+        ClientError: If the transaction fails.
+    """
+    questions = list(questions)
+    try:
+        transact_put_items(get_questions_table(), [question.to_dynamo_item() for question in questions])
+    finally:
+        for question in questions:
+            _question_cache.invalidate(question.question_id)
 
 
 def get_question(question_id: str) -> Question | None:
     """Fetch a question by ID.
 
+    Served from the in-process cache when a fresh entry exists.
+
     Args:
         question_id: The question ID to fetch.
 
     Returns:
         Question instance if found, None otherwise.
     """
+    cached = _question_cache.get(question_id)
+    if cached is not None:
+        return cached
+
+    fetched_at = time.monotonic()
+
     table = get_questions_table()
     response = table.get_item(Key={"question_id": question_id})
     item = response.get("Item")
     if not item:
         return None
-    return Question.from_dynamo_item(item)
+    question = Question.from_dynamo_item(item)
+    _question_cache.put(question_id, question, fetched_at)
+    return question
+
+
+def get_questions(question_ids: Iterable[str]) -> dict[str, Question]:
+    """Fetch several questions by ID.
+
+    Fresh cache entries are used as-is; the rest are read with batched gets.
+
+    Args:
+        question_ids: The question IDs to fetch.
+
+    Returns:
+        Mapping of question ID to Question; IDs that do not exist are omitted.
+
+    Raises:
+        UnprocessedItemsError: If DynamoDB keeps rejecting some of the reads.
+    """
+    questions: dict[str, Question] = {}
+    missing: list[dict[str, Any]] = []
+    for question_id in dict.fromkeys(question_ids):
+        cached = _question_cache.get(question_id)
+        if cached is not None:
+            questions[question_id] = cached
+        else:
+            missing.append({"question_id": question_id})
+    if not missing:
+        return questions
+
+    fetched_at = time.monotonic()
+    for item in batch_get_items(get_questions_table(), missing):
+        question = Question.from_dynamo_item(item)
+        questions[question.question_id] = question
+        _question_cache.put(question.question_id, question, fetched_at)
+    return questions
+
+
+def _query_response_items(question_id: str) -> list[dict[str, Any]]:
+    """Fetch the raw response items of a question.
+
+    Only the attributes exposed to agents are read, so DynamoDB ships and
+    boto3 parses nothing else.
+
+    Args:
+        question_id: The question ID whose responses to fetch.
+
+    Returns:
+        Raw DynamoDB items from the responses table.
+    """
+    response = get_responses_table().query(
+        KeyConditionExpression=Key("question_id").eq(question_id),
+        ProjectionExpression=_RESPONSE_PROJECTION,
+        ExpressionAttributeNames=_RESPONSE_PROJECTION_NAMES,
+    )
+    return response.get("Items", [])
 
 
 def get_question_with_responses(question_id: str) -> tuple[Question | None, list[dict[str, Any]]]:
@@ -255,152 +426,158 @@ def get_question_with_responses(question_id: str) -> tuple[Question | None, list
     Returns:
         Tuple of (Question or None, list of response dicts).
     """
+    # The responses query only needs the key, so it runs alongside the question
+    # lookup and the poll waits for one round trip instead of two
+    responses_future = _read_executor.submit(_query_response_items, question_id)
     question = get_question(question_id)
+    items = responses_future.result()
     if not question:
         return None, []
 
-    # Query responses table
-    responses_table = get_responses_table()
-    response = responses_table.query(KeyConditionExpression=Key("question_id").eq(question_id))
-
     # Format responses for API output (exclude internal fields)
-    responses = []
-    for item in response.get("Items", []):
-        data = deserialize_item(item)
-        resp = {}
-        if "answer" in data:
-            resp["answer"] = data["answer"]
-        if "selected_option" in data:
-            resp["selected_option"] = data["selected_option"]
-        if "confidence" in data:
-            resp["confidence"] = data["confidence"]
-        responses.append(resp)
+    responses = deserialize_items(items, fields=RESPONSE_OUTPUT_FIELDS)
 
     return question, responses
 
 
-def list_open_questions(limit: int = 20) -> list[Question]:
-    """List questions with OPEN or PARTIAL status.
+def get_questions_with_responses(question_ids: Iterable[str]) -> list[tuple[Question, list[dict[str, Any]]]]:
+    """Fetch several questions and all their responses.
 
-    Uses the ByStatus GSI.
+    The questions are read with get_questions(); the responses of the ones
+    that exist are then queried on the read executor.
 
     Args:
-        limit: Maximum number of questions to return.
+        question_ids: The question IDs to fetch.
 
     Returns:
-        List of Question instances.
+        (Question, response dicts) pairs in request order; unknown IDs are omitted.
+
+    Raises:
+        UnprocessedItemsError: If DynamoDB keeps rejecting some of the question reads.
+    """
+    unique_ids = list(dict.fromkeys(question_ids))
+    questions = get_questions(unique_ids)
+    found = [questions[question_id] for question_id in unique_ids if question_id in questions]
+    response_futures = [_read_executor.submit(_query_response_items, question.question_id) for question in found]
+    return [
+        (question, deserialize_items(future.result(), fields=RESPONSE_OUTPUT_FIELDS))
+        for question, future in zip(found, response_futures, strict=True)
+    ]
+
+
+def _list_open_items(
+    limit: int,
+    exclude_ids: set[str] | None,
+    attributes: tuple[str, ...] | None = None,
+) -> list[dict[str, Any]]:
+    """Fetch raw OPEN and PARTIAL question items, most recent first.
+
+    Queries the sparse ByAccepting GSI, which only contains questions that
+    still accept responses, so both statuses come back from a single query.
+
+    Excluded IDs are filtered by DynamoDB so they are never shipped back or
+    deserialized. Because Limit applies before the filter, the query
+    evaluates extra items to make up for the excluded ones, and follows
+    LastEvaluatedKey while the page is short, up to MAX_LIST_FETCH items.
+
+    Args:
+        limit: Maximum number of items to return.
+        exclude_ids: Question IDs to leave out (e.g. already answered).
+        attributes: Optional attributes to project; all attributes are
+            returned when omitted.
+
+    Returns:
+        Raw DynamoDB items.
     """
+    exclude_ids = exclude_ids or set()
+    filter_locally = len(exclude_ids) > MAX_FILTER_IN_OPERANDS
+
     table = get_questions_table()
-    questions = []
-
-    # Query for OPEN status
-    response = table.query(
-        IndexName="ByStatus",
-        KeyConditionExpression=Key("status").eq("OPEN"),
-        Limit=limit,
-        ScanIndexForward=False,  # Most recent first
-    )
-    for item in response.get("Items", []):
-        questions.append(Question.from_dynamo_item(item))
-
-    # If we have room, also get PARTIAL status
-    remaining = limit - len(questions)
-    if remaining > 0:
-        response = table.query(
-            IndexName="ByStatus",
-            KeyConditionExpression=Key("status").eq("PARTIAL"),
-            Limit=remaining,
-            ScanIndexForward=False,
-        )
-        for item in response.get("Items", []):
-            questions.append(Question.from_dynamo_item(item))
+    query_kwargs: dict[str, Any] = {
+        "IndexName": ACCEPTING_INDEX,
+        "KeyConditionExpression": Key(ACCEPTING_ATTRIBUTE).eq(ACCEPTING),
+        "Limit": min(limit + len(exclude_ids), MAX_LIST_FETCH),
+        "ScanIndexForward": False,  # Most recent first
+    }
+    if exclude_ids and not filter_locally:
+        query_kwargs["FilterExpression"] = ~Attr("question_id").is_in(sorted(exclude_ids))
+    if attributes:
+        # Placeholders sidestep reserved words such as "type"
+        query_kwargs["ProjectionExpression"] = ", ".join(f"#{name}" for name in attributes)
+        query_kwargs["ExpressionAttributeNames"] = {f"#{name}": name for name in attributes}
 
-    return questions
+    items: list[dict[str, Any]] = []
+    evaluated = 0
+    while True:
+        response = table.query(**query_kwargs)
+        page = response.get("Items", [])
+        evaluated += response.get("ScannedCount", len(page))
+        if filter_locally:
+            page = [item for item in page if item["question_id"] not in exclude_ids]
+        items.extend(page)
+
+        last_key = response.get("LastEvaluatedKey")
+        if len(items) >= limit or not last_key or evaluated >= MAX_LIST_FETCH:
+            break
+        query_kwargs["ExclusiveStartKey"] = last_key
+
+    return items[:limit]
 
 
-def increment_response_count(question_id: str, min_responses: int) -> str:
-    """Increment the response count and update status if needed.
+def list_open_questions(limit: int = 20, exclude_ids: set[str] | None = None) -> list[Question]:
+    """List questions with OPEN or PARTIAL status, most recent first.
 
-    Status transitions:
-    - OPEN -> PARTIAL (first response)
-    - PARTIAL -> CLOSED (min_responses reached)
+    Uses the sparse ByAccepting GSI.
 
     Args:
-        question_id: The question ID to update.
-        min_responses: Minimum responses needed for CLOSED status.
+        limit: Maximum number of questions to return.
+        exclude_ids: Question IDs to leave out (e.g. already answered).
 
     Returns:
-        The new status string.
+        List of Question instances.
     """
-    table = get_questions_table()
-
-    # Update with conditional logic
-    response = table.update_item(
-        Key={"question_id": question_id},
-        UpdateExpression="""
-            SET current_responses = current_responses + :inc,
-                #status = CASE
-                    WHEN current_responses + :inc >= :min THEN :closed
-                    WHEN current_responses = :zero THEN :partial
-                    ELSE #status
-                END
-        """,
-        # DynamoDB doesn't support CASE in UpdateExpression, so we do it differently
-        # Using a simpler approach with two possible updates
-        ConditionExpression="attribute_exists(question_id)",
-        ExpressionAttributeNames={"#status": "status"},
-        ExpressionAttributeValues={
-            ":inc": 1,
-            ":min": min_responses,
-            ":closed": "CLOSED",
-            ":partial": "PARTIAL",
-            ":zero": 0,
-        },
-        ReturnValues="ALL_NEW",
-    )
+    return [Question.from_dynamo_item(item) for item in _list_open_items(limit, exclude_ids)]
 
-    return str(response["Attributes"]["status"])
 
+def _human_list_item(data: dict[str, Any]) -> dict[str, Any]:
+    """Format a raw question item for the human list API.
 
-def update_question_status(question_id: str, new_responses: int, min_responses: int) -> str:
-    """Update the response count and status.
+    Mirrors Question.to_human_list_item, converting only the counters.
 
     Args:
-        question_id: The question ID to update.
-        new_responses: The new response count.
-        min_responses: Minimum responses needed for CLOSED status.
+        data: Raw DynamoDB question item with at least HUMAN_LIST_ATTRIBUTES.
 
     Returns:
-        The new status string.
+        Dictionary formatted for human list API response.
     """
-    table = get_questions_table()
-
-    # Determine new status
-    if new_responses >= min_responses:
-        new_status = "CLOSED"
-        closed_at = datetime.now(timezone.utc).isoformat()
-    elif new_responses > 0:
-        new_status = "PARTIAL"
-        closed_at = None
-    else:
-        new_status = "OPEN"
-        closed_at = None
-
-    update_expr = "SET current_responses = :count, #status = :status"
-    expr_values: dict[str, Any] = {
-        ":count": new_responses,
-        ":status": new_status,
+    list_item = {
+        "question_id": data["question_id"],
+        "prompt": data["prompt"],
+        "type": data["type"],
+        "responses_needed": max(0, int(data["min_responses"]) - int(data.get("current_responses", 0))),
+        "created_at": data["created_at"],
     }
+    if data.get("options"):
+        list_item["options"] = data["options"]
+    if data.get("audience"):
+        list_item["audience"] = data["audience"]
+    return list_item
 
-    if closed_at:
-        update_expr += ", closed_at = :closed_at"
-        expr_values[":closed_at"] = closed_at
 
-    table.update_item(
-        Key={"question_id": question_id},
-        UpdateExpression=update_expr,
-        ExpressionAttributeNames={"#status": "status"},
-        ExpressionAttributeValues=expr_values,
-    )
+def list_open_question_items(limit: int = 20, exclude_ids: set[str] | None = None) -> list[dict[str, Any]]:
+    """List OPEN or PARTIAL questions already formatted for the human list API.
 
-    return new_status
+    Equivalent to calling Question.to_human_list_item on the result of
+    list_open_questions, but only fetches HUMAN_LIST_ATTRIBUTES and builds
+    each dict straight from the DynamoDB item instead of constructing a
+    Question first.
+
+    Args:
+        limit: Maximum number of questions to return.
+        exclude_ids: Question IDs to leave out (e.g. already answered).
+
+    Returns:
+        List of dictionaries formatted for the human list API response.
+    """
+    items = _list_open_items(limit, exclude_ids, HUMAN_LIST_ATTRIBUTES)
+    return [_human_list_item(item) for item in items]
@@ -0,0 +1,340 @@
+"""Request body models for the API handlers.
+
+Reference: ADR-03 API Design
+
+Each model parses and validates a raw API Gateway body in one step. Validation
+failures raise RequestValidationError carrying a ready-made 400 response; the
+responses only depend on module constants, so they are built once at import
+time and shared. Callers must not mutate them.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from ..utils import jsonio
+from ..utils.api_response import validation_error
+from .question import (
+    DEFAULT_MIN_RESPONSES,
+    DEFAULT_TIMEOUT_SECONDS,
+    MAX_MIN_RESPONSES,
+    MAX_PROMPT_LENGTH,
+    MAX_TIMEOUT_SECONDS,
+    Question,
+)
+
+MIN_OPTIONS = 2
+MAX_OPTIONS = 10
+MIN_TIMEOUT_SECONDS = 60
+MAX_ANSWER_LENGTH = 5000
+MIN_CONFIDENCE = 1
+MAX_CONFIDENCE = 5
+MAX_BATCH_QUESTIONS = 20
+
+# A tuple, not a set: membership must not hash untrusted JSON values (lists and
+# objects are unhashable)
+_QUESTION_TYPES = ("text", "multiple_choice")
+
+_ERR_INVALID_JSON = validation_error("Invalid JSON in request body")
+_ERR_NOT_OBJECT = validation_error("Request body must be a JSON object")
+
+_ERR_PROMPT_REQUIRED = validation_error(
+    "prompt is required",
+    details={"field": "prompt", "constraint": "required"},
+)
+_ERR_PROMPT_LENGTH = validation_error(
+    f"prompt must be at most {MAX_PROMPT_LENGTH} characters",
+    details={"field": "prompt", "constraint": "length", "max": MAX_PROMPT_LENGTH},
+)
+_ERR_TYPE_ENUM = validation_error(
+    "type must be 'text' or 'multiple_choice'",
+    details={"field": "type", "constraint": "enum", "allowed": ["text", "multiple_choice"]},
+)
+_ERR_OPTIONS_REQUIRED = validation_error(
+    "options is required for multiple_choice questions",
+    details={"field": "options", "constraint": "required"},
+)
+_ERR_OPTIONS_LENGTH = validation_error(
+    f"options must have {MIN_OPTIONS}-{MAX_OPTIONS} items",
+    details={"field": "options", "constraint": "length", "min": MIN_OPTIONS, "max": MAX_OPTIONS},
+)
+_ERR_MIN_RESPONSES_RANGE = validation_error(
+    f"min_responses must be between 1 and {MAX_MIN_RESPONSES}",
+    details={"field": "min_responses", "constraint": "range", "min": 1, "max": MAX_MIN_RESPONSES},
+)
+_ERR_TIMEOUT_RANGE = validation_error(
+    f"timeout_seconds must be between {MIN_TIMEOUT_SECONDS} and {MAX_TIMEOUT_SECONDS}",
+    details={
+        "field": "timeout_seconds",
+        "constraint": "range",
+        "min": MIN_TIMEOUT_SECONDS,
+        "max": MAX_TIMEOUT_SECONDS,
+    },
+)
+_ERR_AUDIENCE_TYPE = validation_error(
+    "audience must be an array of strings",
+    details={"field": "audience", "constraint": "type"},
+)
+_ERR_QUESTIONS_REQUIRED = validation_error(
+    "questions must be a non-empty array of question objects",
+    details={"field": "questions", "constraint": "required"},
+)
+_ERR_QUESTIONS_LENGTH = validation_error(
+    f"questions must have at most {MAX_BATCH_QUESTIONS} items",
+    details={"field": "questions", "constraint": "length", "max": MAX_BATCH_QUESTIONS},
+)
+
+_ERR_QUESTION_ID_REQUIRED = validation_error(
+    "question_id is required",
+    details={"field": "question_id", "constraint": "required"},
+)
+_ERR_ANSWER_REQUIRED = validation_error(
+    "answer is required for text questions",
+    details={"field": "answer", "constraint": "required"},
+)
+_ERR_ANSWER_LENGTH = validation_error(
+    f"answer must be at most {MAX_ANSWER_LENGTH} characters",
+    details={"field": "answer", "constraint": "length", "max": MAX_ANSWER_LENGTH},
+)
+_ERR_SELECTED_OPTION_REQUIRED = validation_error(
+    "selected_option is required for multiple choice questions",
+    details={"field": "selected_option", "constraint": "required"},
+)
+_ERR_CONFIDENCE_RANGE = validation_error(
+    f"confidence must be between {MIN_CONFIDENCE} and {MAX_CONFIDENCE}",
+    details={"field": "confidence", "constraint": "range", "min": MIN_CONFIDENCE, "max": MAX_CONFIDENCE},
+)
+
+
+class RequestValidationError(Exception):
+    """Raised when a request body fails validation.
+
+    Attributes:
+        response: The 400 API Gateway response to return to the caller.
+    """
+
+    def __init__(self, response: dict[str, Any]) -> None:
+        """Initialize with the error response to return.
+
+        Args:
+            response: A validation_error() response.
+        """
+        super().__init__(response["body"])
+        self.response = response
+
+
+def _load_object(raw_body: str | bytes | None) -> dict[str, Any]:
+    """Decode a request body that must be a JSON object.
+
+    Args:
+        raw_body: Raw body from the API Gateway event; None is treated as {}.
+
+    Returns:
+        The decoded object.
+
+    Raises:
+        RequestValidationError: If the body is not valid JSON or not an object.
+    """
+    try:
+        body = jsonio.loads(raw_body or "{}")
+    except jsonio.JSONDecodeError:
+        raise RequestValidationError(_ERR_INVALID_JSON) from None
+    if not isinstance(body, dict):
+        raise RequestValidationError(_ERR_NOT_OBJECT)
+    return body
+
+
+@dataclass(slots=True, frozen=True)
+class CreateQuestionRequest:
+    """Validated body of POST /agent/questions."""
+
+    prompt: str
+    type: Literal["text", "multiple_choice"]
+    min_responses: int
+    timeout_seconds: int
+    options: list[str] | None = None
+    audience: list[str] | None = None
+
+    @classmethod
+    def from_json(cls, raw_body: str | bytes | None) -> "CreateQuestionRequest":
+        """Parse and validate a create-question request body.
+
+        Args:
+            raw_body: Raw body from the API Gateway event.
+
+        Returns:
+            The validated request. Options are only kept for multiple_choice questions.
+
+        Raises:
+            RequestValidationError: If any field is missing or invalid.
+        """
+        return cls.from_dict(_load_object(raw_body))
+
+    @classmethod
+    def from_dict(cls, body: dict[str, Any]) -> "CreateQuestionRequest":  # noqa: C901
+        """Validate an already decoded create-question object.
+
+        Args:
+            body: The decoded request object.
+
+        Returns:
+            The validated request. Options are only kept for multiple_choice questions.
+
+        Raises:
+            RequestValidationError: If any field is missing or invalid.
+        """
+        prompt = body.get("prompt")
+        if not prompt:
+            raise RequestValidationError(_ERR_PROMPT_REQUIRED)
+        if len(prompt) > MAX_PROMPT_LENGTH:
+            raise RequestValidationError(_ERR_PROMPT_LENGTH)
+
+        question_type = body.get("type")
+        if question_type not in _QUESTION_TYPES:
+            raise RequestValidationError(_ERR_TYPE_ENUM)
+
+        options = body.get("options")
+        if question_type == "multiple_choice":
+            if not options or not isinstance(options, list):
+                raise RequestValidationError(_ERR_OPTIONS_REQUIRED)
+            if len(options) < MIN_OPTIONS or len(options) > MAX_OPTIONS:
+                raise RequestValidationError(_ERR_OPTIONS_LENGTH)
+        else:
+            options = None
+
+        min_responses = body.get("min_responses", DEFAULT_MIN_RESPONSES)
+        if not isinstance(min_responses, int) or min_responses < 1 or min_responses > MAX_MIN_RESPONSES:
+            raise RequestValidationError(_ERR_MIN_RESPONSES_RANGE)
+
+        timeout_seconds = body.get("timeout_seconds", DEFAULT_TIMEOUT_SECONDS)
+        if (
+            not isinstance(timeout_seconds, int)
+            or timeout_seconds < MIN_TIMEOUT_SECONDS
+            or timeout_seconds > MAX_TIMEOUT_SECONDS
+        ):
+            raise RequestValidationError(_ERR_TIMEOUT_RANGE)
+
+        audience = body.get("audience")
+        if audience is not None and not isinstance(audience, list):
+            raise RequestValidationError(_ERR_AUDIENCE_TYPE)
+
+        return cls(
+            prompt=prompt,
+            type=question_type,
+            min_responses=min_responses,
+            timeout_seconds=timeout_seconds,
+            options=options,
+            audience=audience,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CreateQuestionsRequest:
+    """Validated body of POST /agent/questions/batch."""
+
+    questions: tuple[CreateQuestionRequest, ...]
+
+    @classmethod
+    def from_json(cls, raw_body: str | bytes | None) -> "CreateQuestionsRequest":
+        """Parse and validate a batch create-question request body.
+
+        The body is {"questions": [...]}, each item in the single create format.
+
+        Args:
+            raw_body: Raw body from the API Gateway event.
+
+        Returns:
+            The validated request, with questions in request order.
+
+        Raises:
+            RequestValidationError: If the list is missing, empty or too long,
+                or if any question is invalid. Nothing is created in that case.
+        """
+        body = _load_object(raw_body)
+
+        items = body.get("questions")
+        if not items or not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            raise RequestValidationError(_ERR_QUESTIONS_REQUIRED)
+        if len(items) > MAX_BATCH_QUESTIONS:
+            raise RequestValidationError(_ERR_QUESTIONS_LENGTH)
+
+        return cls(questions=tuple(CreateQuestionRequest.from_dict(item) for item in items))
+
+
+@dataclass(slots=True, frozen=True)
+class SubmitResponseRequest:
+    """Body of POST /human/responses.
+
+    The answer fields can only be checked against the question they answer,
+    so they are kept raw here and validated by validate_answer().
+    """
+
+    question_id: str
+    answer: Any = None
+    selected_option: Any = None
+    confidence: int | None = None
+
+    @classmethod
+    def from_json(cls, raw_body: str | bytes | None) -> "SubmitResponseRequest":
+        """Parse a submit-response request body and validate question-independent fields.
+
+        Args:
+            raw_body: Raw body from the API Gateway event.
+
+        Returns:
+            The parsed request.
+
+        Raises:
+            RequestValidationError: If question_id is missing or confidence is out of range.
+        """
+        body = _load_object(raw_body)
+
+        question_id = body.get("question_id")
+        if not question_id:
+            raise RequestValidationError(_ERR_QUESTION_ID_REQUIRED)
+
+        confidence = body.get("confidence")
+        if confidence is not None and (
+            not isinstance(confidence, int) or confidence < MIN_CONFIDENCE or confidence > MAX_CONFIDENCE
+        ):
+            raise RequestValidationError(_ERR_CONFIDENCE_RANGE)
+
+        return cls(
+            question_id=question_id,
+            answer=body.get("answer"),
+            selected_option=body.get("selected_option"),
+            confidence=confidence,
+        )
+
+    def validate_answer(self, question: Question) -> tuple[str | None, int | None]:
+        """Validate the answer fields against the question type.
+
+        Args:
+            question: The question being answered.
+
+        Returns:
+            Tuple of (answer, selected_option); the field that does not apply
+            to the question type is None.
+
+        Raises:
+            RequestValidationError: If the answer does not fit the question.
+        """
+        if question.type == "text":
+            answer = self.answer
+            if not answer or not isinstance(answer, str):
+                raise RequestValidationError(_ERR_ANSWER_REQUIRED)
+            if len(answer) > MAX_ANSWER_LENGTH:
+                raise RequestValidationError(_ERR_ANSWER_LENGTH)
+            return answer, None
+
+        selected_option = self.selected_option
+        if selected_option is None or not isinstance(selected_option, int):
+            raise RequestValidationError(_ERR_SELECTED_OPTION_REQUIRED)
+        if question.options and (selected_option < 0 or selected_option >= len(question.options)):
+            max_option = len(question.options) - 1
+            raise RequestValidationError(
+                validation_error(
+                    f"selected_option must be between 0 and {max_option}",
+                    details={"field": "selected_option", "constraint": "range", "min": 0, "max": max_option},
+                )
+            )
+        return None, selected_option
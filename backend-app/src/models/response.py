@@ -3,16 +3,27 @@
 Reference: ADR-02 Database Schema, ADR-03 API Design
 """
 
-import uuid
+import secrets
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import Any
+from typing import Any, cast
+
+from boto3.dynamodb.types import TypeDeserializer
+from botocore.exceptions import ClientError
 
 from ..utils.dynamodb import (
     deserialize_item,
+    get_dynamodb_client,
+    get_questions_table,
     get_responses_table,
-    serialize_item,
 )
+from ..utils.timestamps import utc_isoformat
+from .question import ACCEPTING_ATTRIBUTE, invalidate_cached_question
+
+# Attempts for a response transaction that loses a race with another write to the same question
+MAX_TRANSACTION_ATTEMPTS = 3
+
+_type_deserializer = TypeDeserializer()
 
 
 def generate_response_id() -> str:
@@ -21,10 +32,10 @@ def generate_response_id() -> str:
     Returns:
         A unique response ID string starting with 'r_'.
     """
-    return f"r_{uuid.uuid4().hex[:12]}"
+    return f"r_{secrets.token_hex(6)}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Response:
     """Response data model matching DynamoDB schema."""
 
@@ -60,7 +71,7 @@ class Response:
         return cls(
             question_id=question_id,
             response_id=generate_response_id(),
-            created_at=datetime.now(timezone.utc).isoformat(),
+            created_at=utc_isoformat(),
             answer=answer,
             selected_option=selected_option,
             confidence=confidence,
@@ -71,7 +82,8 @@ class Response:
         """Convert to DynamoDB item format.
 
         Returns:
-            Dictionary suitable for DynamoDB put_item.
+            Dictionary suitable for DynamoDB put_item. Optional fields are
+            only set when present, since DynamoDB rejects None values.
         """
         item: dict[str, Any] = {
             "question_id": self.question_id,
@@ -86,7 +98,7 @@ class Response:
             item["confidence"] = self.confidence
         if self.fingerprint_hash is not None:
             item["fingerprint_hash"] = self.fingerprint_hash
-        return serialize_item(item)
+        return item
 
     @classmethod
     def from_dynamo_item(cls, item: dict[str, Any]) -> "Response":
@@ -133,6 +145,115 @@ def save_response(response: Response) -> None:
     table.put_item(Item=response.to_dynamo_item())
 
 
+def _transact_response(transact_items: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Run a response transaction whose second item updates the question.
+
+    Transactions cancelled by a conflicting concurrent write are retried
+    with a short backoff.
+
+    Args:
+        transact_items: The Put for the response followed by the question Update.
+
+    Returns:
+        None if the transaction committed. If the question update's condition
+        failed, the question item as it was at that moment ({} if it does not
+        exist).
+
+    Raises:
+        ClientError: For any other failure, or if conflicts persist.
+    """
+    client = get_dynamodb_client()
+    attempt = 1
+    while True:
+        try:
+            # The stubs describe raw AttributeValues; the resource's client takes native values
+            client.transact_write_items(TransactItems=transact_items)  # type: ignore[arg-type]
+            return None
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            reasons = cast("list[dict[str, Any]]", e.response.get("CancellationReasons", []))
+            codes = [reason.get("Code") for reason in reasons]
+            if len(reasons) > 1 and codes[1] == "ConditionalCheckFailed":
+                # Error responses bypass boto3's type transform, so the item is in AttributeValue form
+                old_item = reasons[1].get("Item")
+                if not old_item:
+                    return {}
+                return {key: _type_deserializer.deserialize(value) for key, value in old_item.items()}
+            if "TransactionConflict" not in codes or attempt >= MAX_TRANSACTION_ATTEMPTS:
+                raise
+        time.sleep(0.02 * 2**attempt)
+        attempt += 1
+
+
+def save_response_and_increment(response: Response, min_responses: int) -> str | None:
+    """Save a response and count it against its question in one transaction.
+
+    The response Put and the question's atomic ADD commit or fail together,
+    so a response is never stored without being counted (or vice versa),
+    and the request costs a single round trip.
+
+    Status transitions:
+    - OPEN -> PARTIAL (below min_responses)
+    - OPEN/PARTIAL -> CLOSED (the response that reaches min_responses)
+
+    The common case is a single transaction whose condition requires the
+    count to stay below min_responses. When that condition fails on an
+    accepting question, this response is the one that closes it, and a
+    second transaction records it together with the CLOSED status.
+
+    Args:
+        response: Response instance to save.
+        min_responses: Minimum responses needed for CLOSED status.
+
+    Returns:
+        The new status string, or None if the question no longer accepts
+        responses (already closed, or deleted). Nothing is written then.
+    """
+    put = {"Put": {"TableName": get_responses_table().name, "Item": response.to_dynamo_item()}}
+    update: dict[str, Any] = {
+        "TableName": get_questions_table().name,
+        "Key": {"question_id": response.question_id},
+        "ConditionExpression": "#status IN (:open, :partial) AND current_responses < :last",
+        "UpdateExpression": "ADD current_responses :one SET #status = :partial",
+        "ExpressionAttributeNames": {"#status": "status"},
+        "ExpressionAttributeValues": {
+            ":one": 1,
+            ":open": "OPEN",
+            ":partial": "PARTIAL",
+            ":last": min_responses - 1,
+        },
+        "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+    }
+
+    try:
+        old_question = _transact_response([put, {"Update": update}])
+    finally:
+        invalidate_cached_question(response.question_id)
+    if old_question is None:
+        return "PARTIAL"
+    if old_question.get("status") not in ("OPEN", "PARTIAL"):
+        return None
+
+    # This response reaches min_responses: record it and close the question together
+    update["ConditionExpression"] = "#status IN (:open, :partial)"
+    update["UpdateExpression"] = (
+        f"ADD current_responses :one SET #status = :closed, closed_at = :closed_at REMOVE {ACCEPTING_ATTRIBUTE}"
+    )
+    update["ExpressionAttributeValues"] = {
+        ":one": 1,
+        ":open": "OPEN",
+        ":partial": "PARTIAL",
+        ":closed": "CLOSED",
+        ":closed_at": utc_isoformat(),
+    }
+    try:
+        old_question = _transact_response([put, {"Update": update}])
+    finally:
+        invalidate_cached_question(response.question_id)
+    return "CLOSED" if old_question is None else None
+
+
 def get_answered_question_ids(fingerprint_hash: str) -> set[str]:
     """Get the set of question IDs that a fingerprint has already answered.
 
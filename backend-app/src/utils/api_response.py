@@ -1,11 +1,21 @@
 """Standardized API response helpers for Lambda handlers.
 
 Reference: ADR-03 API Design
+
+Responses are plain dicts handed straight back to the Lambda runtime. The
+fixed error responses and the JSON headers are built once at import time and
+shared between calls, so callers must not mutate a returned response.
 """
 
-import json
 from typing import Any
 
+from .jsonio import dumps
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+DEFAULT_NOT_FOUND_MESSAGE = "Resource not found"
+DEFAULT_SERVER_ERROR_MESSAGE = "An internal error occurred"
+
 
 def success(body: dict[str, Any] | list[Any], status_code: int = 200) -> dict[str, Any]:
     """Return a successful API response.
@@ -19,10 +29,8 @@ def success(body: dict[str, Any] | list[Any], status_code: int = 200) -> dict[st
     """
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-        },
-        "body": json.dumps(body),
+        "headers": _JSON_HEADERS,
+        "body": dumps(body),
     }
 
 
@@ -75,10 +83,8 @@ def error(
 
     return {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-        },
-        "body": json.dumps(error_body),
+        "headers": _JSON_HEADERS,
+        "body": dumps(error_body),
     }
 
 
@@ -95,7 +101,7 @@ def validation_error(message: str, details: dict[str, Any] | None = None) -> dic
     return error("VALIDATION_ERROR", message, status_code=400, details=details)
 
 
-def not_found(message: str = "Resource not found") -> dict[str, Any]:
+def not_found(message: str = DEFAULT_NOT_FOUND_MESSAGE) -> dict[str, Any]:
     """Return a 404 not found error.
 
     Args:
@@ -104,6 +110,8 @@ def not_found(message: str = "Resource not found") -> dict[str, Any]:
     Returns:
         API Gateway 404 response.
     """
+    if message == DEFAULT_NOT_FOUND_MESSAGE:
+        return _NOT_FOUND
     return error("NOT_FOUND", message, status_code=404)
 
 
@@ -113,11 +121,7 @@ def question_not_found() -> dict[str, Any]:
     Returns:
         API Gateway 404 response for missing question.
     """
-    return error(
-        "QUESTION_NOT_FOUND",
-        "The requested question does not exist or has expired.",
-        status_code=404,
-    )
+    return _QUESTION_NOT_FOUND
 
 
 def already_answered() -> dict[str, Any]:
@@ -126,11 +130,7 @@ def already_answered() -> dict[str, Any]:
     Returns:
         API Gateway 409 conflict response.
     """
-    return error(
-        "ALREADY_ANSWERED",
-        "You have already answered this question.",
-        status_code=409,
-    )
+    return _ALREADY_ANSWERED
 
 
 def question_closed() -> dict[str, Any]:
@@ -139,14 +139,10 @@ def question_closed() -> dict[str, Any]:
     Returns:
         API Gateway 410 gone response.
     """
-    return error(
-        "QUESTION_CLOSED",
-        "This question is no longer accepting responses.",
-        status_code=410,
-    )
+    return _QUESTION_CLOSED
 
 
-def server_error(message: str = "An internal error occurred") -> dict[str, Any]:
+def server_error(message: str = DEFAULT_SERVER_ERROR_MESSAGE) -> dict[str, Any]:
     """Return a 500 server error.
 
     Args:
@@ -155,4 +151,26 @@ def server_error(message: str = "An internal error occurred") -> dict[str, Any]:
     Returns:
         API Gateway 500 server error response.
     """
+    if message == DEFAULT_SERVER_ERROR_MESSAGE:
+        return _SERVER_ERROR
     return error("SERVER_ERROR", message, status_code=500)
+
+
+# Fixed error responses, built once after error() is defined and shared by the helpers above
+_NOT_FOUND = error("NOT_FOUND", DEFAULT_NOT_FOUND_MESSAGE, status_code=404)
+_QUESTION_NOT_FOUND = error(
+    "QUESTION_NOT_FOUND",
+    "The requested question does not exist or has expired.",
+    status_code=404,
+)
+_ALREADY_ANSWERED = error(
+    "ALREADY_ANSWERED",
+    "You have already answered this question.",
+    status_code=409,
+)
+_QUESTION_CLOSED = error(
+    "QUESTION_CLOSED",
+    "This question is no longer accepting responses.",
+    status_code=410,
+)
+_SERVER_ERROR = error("SERVER_ERROR", DEFAULT_SERVER_ERROR_MESSAGE, status_code=500)
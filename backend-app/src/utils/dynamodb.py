@@ -6,14 +6,48 @@ Reference: ADR-02 Database Schema Design
 from __future__ import annotations
 
 import os
+import time
+from collections.abc import Callable, Iterable, Sequence
+from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
 
 if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
     from mypy_boto3_dynamodb.service_resource import DynamoDBServiceResource, Table
 
-# Lazy initialization of DynamoDB resource
+# Keep pooled connections alive between warm invocations; the pool is sized for
+# the most requests a handler issues concurrently (one responses query per
+# question of a batched poll, see question.MAX_POLL_IDS, plus the request thread). Short timeouts with
+# retries fail over a stalled connection; three attempts fit the 10s Lambda timeout.
+CLIENT_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=24,
+    connect_timeout=1.0,
+    read_timeout=2.0,
+    retries={"mode": "standard", "max_attempts": 3},
+)
+
+# Table names are fixed per deployment, so they are read once at import
+QUESTIONS_TABLE_NAME = os.environ.get("QUESTIONS_TABLE", "aah-questions")
+RESPONSES_TABLE_NAME = os.environ.get("RESPONSES_TABLE", "aah-responses")
+
+# DynamoDB limit per BatchGetItem request
+BATCH_GET_SIZE = 100
+# Unprocessed keys are retried with exponential backoff up to this many requests per chunk
+BATCH_MAX_ATTEMPTS = 5
+BATCH_BACKOFF_SECONDS = 0.05
+
+# DynamoDB limit per TransactWriteItems request
+TRANSACT_WRITE_SIZE = 100
+# Cancellation reasons after which the same transaction may succeed when resent
+_RETRYABLE_CANCELLATIONS = frozenset(("None", "TransactionConflict", "ThrottlingError"))
+
+# Lazily initialized once per Lambda container and reused across warm invocations.
+# Model code should always go through the get_* accessors below.
 _dynamodb_resource: DynamoDBServiceResource | None = None
 _questions_table: Table | None = None
 _responses_table: Table | None = None
@@ -27,10 +61,23 @@ def get_dynamodb_resource() -> DynamoDBServiceResource:
     """
     global _dynamodb_resource  # noqa: PLW0603
     if _dynamodb_resource is None:
-        _dynamodb_resource = boto3.resource("dynamodb")
+        _dynamodb_resource = boto3.resource("dynamodb", config=CLIENT_CONFIG)
     return _dynamodb_resource
 
 
+def get_dynamodb_client() -> DynamoDBClient:
+    """Get the low-level DynamoDB client behind the shared resource.
+
+    Use this for operations that span tables (e.g. transact_write_items).
+    It shares the resource's connection pool and still accepts and returns
+    native Python values rather than raw AttributeValue dicts.
+
+    Returns:
+        The DynamoDB client.
+    """
+    return get_dynamodb_resource().meta.client
+
+
 def get_questions_table() -> Table:
     """Get the questions table resource.
 
@@ -39,8 +86,7 @@ def get_questions_table() -> Table:
     """
     global _questions_table  # noqa: PLW0603
     if _questions_table is None:
-        table_name = os.environ.get("QUESTIONS_TABLE", "aah-questions")
-        _questions_table = get_dynamodb_resource().Table(table_name)
+        _questions_table = get_dynamodb_resource().Table(QUESTIONS_TABLE_NAME)
     return _questions_table
 
 
@@ -52,53 +98,177 @@ def get_responses_table() -> Table:
     """
     global _responses_table  # noqa: PLW0603
     if _responses_table is None:
-        table_name = os.environ.get("RESPONSES_TABLE", "aah-responses")
-        _responses_table = get_dynamodb_resource().Table(table_name)
+        _responses_table = get_dynamodb_resource().Table(RESPONSES_TABLE_NAME)
     return _responses_table
 
 
-def serialize_item(item: dict[str, Any]) -> dict[str, Any]:
-    """Convert Python types to DynamoDB-compatible types.
+def init_table_handles() -> None:
+    """Create the resource and table handles ahead of the first request.
+
+    Called at import time inside Lambda so the work lands in the init phase
+    instead of the first billed invocation. Set AAH_DISABLE_EAGER_INIT to
+    skip it.
+    """
+    get_questions_table()
+    get_responses_table()
 
-    Removes None values as DynamoDB doesn't accept them.
+
+def reset_table_handles() -> None:
+    """Drop the cached resource and table handles so the next access rebuilds them.
+
+    Intended for tests that swap out boto3 or the handles themselves.
+    """
+    global _dynamodb_resource, _questions_table, _responses_table  # noqa: PLW0603
+    _dynamodb_resource = None
+    _questions_table = None
+    _responses_table = None
+
+
+class UnprocessedItemsError(Exception):
+    """Raised when a batch request still has unprocessed items after all retries."""
+
+
+def transact_put_items(table: Table, items: Sequence[dict[str, Any]]) -> None:
+    """Write items to a table in one TransactWriteItems request.
+
+    Either every item is written or none is. Transactions cancelled by a
+    conflicting write or throttling are resent with exponential backoff.
+
+    Args:
+        table: Table to write to.
+        items: At most TRANSACT_WRITE_SIZE items as built by the models' to_dynamo_item.
+
+    Raises:
+        ValueError: If there are more items than one transaction can hold.
+        ClientError: If the transaction fails for another reason, or is still
+            cancelled after BATCH_MAX_ATTEMPTS requests.
+    """
+    if len(items) > TRANSACT_WRITE_SIZE:
+        msg = f"At most {TRANSACT_WRITE_SIZE} items fit in one transaction, got {len(items)}"
+        raise ValueError(msg)
+    if not items:
+        return
+
+    client = get_dynamodb_client()
+    transact_items = [{"Put": {"TableName": table.name, "Item": item}} for item in items]
+    for attempt in range(BATCH_MAX_ATTEMPTS):
+        if attempt:
+            time.sleep(BATCH_BACKOFF_SECONDS * 2 ** (attempt - 1))
+        try:
+            # The stubs describe raw AttributeValues; the resource's client takes native values
+            client.transact_write_items(TransactItems=transact_items)  # type: ignore[arg-type]
+            return
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "TransactionCanceledException":
+                raise
+            codes = {reason.get("Code") for reason in e.response.get("CancellationReasons", [])}
+            if not codes <= _RETRYABLE_CANCELLATIONS or attempt == BATCH_MAX_ATTEMPTS - 1:
+                raise
+
+
+def batch_get_items(table: Table, keys: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Read items from a table with BatchGetItem.
+
+    Keys are sent in chunks of BATCH_GET_SIZE. Keys DynamoDB returns as
+    unprocessed are requested again with exponential backoff.
 
     Args:
-        item: Dictionary to serialize.
+        table: Table to read from.
+        keys: Primary keys of the items to fetch.
 
     Returns:
-        Dictionary with None values removed.
+        Raw DynamoDB items in no particular order; missing keys are omitted.
+
+    Raises:
+        UnprocessedItemsError: If keys are still unprocessed after BATCH_MAX_ATTEMPTS requests.
     """
-    return {k: v for k, v in item.items() if v is not None}
+    client = get_dynamodb_client()
+    items: list[dict[str, Any]] = []
+    for start in range(0, len(keys), BATCH_GET_SIZE):
+        pending: dict[str, Any] = {table.name: {"Keys": list(keys[start : start + BATCH_GET_SIZE])}}
+        for attempt in range(BATCH_MAX_ATTEMPTS):
+            if attempt:
+                time.sleep(BATCH_BACKOFF_SECONDS * 2 ** (attempt - 1))
+            response = client.batch_get_item(RequestItems=pending)
+            items.extend(response.get("Responses", {}).get(table.name, []))
+            pending = dict(response.get("UnprocessedKeys") or {})
+            if not pending:
+                break
+        else:
+            msg = f"{len(pending[table.name]['Keys'])} keys were not read from {table.name}"
+            raise UnprocessedItemsError(msg)
+    return items
 
 
-def deserialize_item(item: dict[str, Any]) -> dict[str, Any]:
+def deserialize_item(item: dict[str, Any], fields: Iterable[str] | None = None) -> dict[str, Any]:
     """Convert DynamoDB item to Python dict.
 
     Handles Decimal to int/float conversion.
 
     Args:
         item: DynamoDB item dictionary.
+        fields: Optional top-level keys to keep. Other keys are skipped
+            without being converted; keys missing from the item are omitted.
 
     Returns:
         Dictionary with Decimal values converted to int/float.
     """
-    from decimal import Decimal
-
-    result: dict[str, Any] = {}
-    for key, value in item.items():
-        if isinstance(value, Decimal):
-            # Convert Decimal to int if it's a whole number, otherwise float
-            if value % 1 == 0:
-                result[key] = int(value)
-            else:
-                result[key] = float(value)
-        elif isinstance(value, list):
-            result[key] = [_deserialize_value(v) for v in value]
-        elif isinstance(value, dict):
-            result[key] = deserialize_item(value)
-        else:
-            result[key] = value
-    return result
+    if fields is None:
+        return {key: _deserialize_value(value) for key, value in item.items()}
+    return {key: _deserialize_value(item[key]) for key in fields if key in item}
+
+
+def deserialize_items(items: Iterable[dict[str, Any]], fields: Iterable[str] | None = None) -> list[dict[str, Any]]:
+    """Convert a page of DynamoDB items to Python dicts.
+
+    Args:
+        items: DynamoDB items, e.g. the Items of a query response.
+        fields: Optional top-level keys to keep, as for deserialize_item.
+
+    Returns:
+        List of deserialized dictionaries in the same order.
+    """
+    if fields is not None:
+        fields = tuple(fields)
+    return [deserialize_item(item, fields) for item in items]
+
+
+def _decimal_to_number(value: Decimal) -> int | float:
+    """Convert a DynamoDB number to int if it is whole, otherwise float.
+
+    Args:
+        value: Decimal returned by boto3.
+
+    Returns:
+        The number as int or float.
+    """
+    # Comparing against the integral value is cheaper than value % 1
+    return int(value) if value == value.to_integral_value() else float(value)
+
+
+def _deserialize_list(value: list[Any]) -> list[Any]:
+    """Deserialize each element of a DynamoDB list.
+
+    Args:
+        value: List to deserialize.
+
+    Returns:
+        The list itself if it only holds strings (options, audience),
+        otherwise a new list with deserialized elements.
+    """
+    for element in value:
+        if type(element) is not str:
+            return [_deserialize_value(v) for v in value]
+    return value
+
+
+# Converters keyed on the exact type boto3 returns. Types missing from the table
+# (str, bool, None, Binary, sets) are passed through unchanged.
+_CONVERTERS: dict[type, Callable[[Any], Any]] = {
+    Decimal: _decimal_to_number,
+    list: _deserialize_list,
+    dict: deserialize_item,
+}
 
 
 def _deserialize_value(value: Any) -> Any:
@@ -110,10 +280,9 @@ def _deserialize_value(value: Any) -> Any:
     Returns:
         Deserialized value.
     """
-    from decimal import Decimal
+    convert = _CONVERTERS.get(type(value))
+    return value if convert is None else convert(value)
 
-    if isinstance(value, dict):
-        return deserialize_item(value)
-    if isinstance(value, Decimal):
-        return int(value) if value % 1 == 0 else float(value)
-    return value
+
+if os.environ.get("AWS_LAMBDA_FUNCTION_NAME") and not os.environ.get("AAH_DISABLE_EAGER_INIT"):
+    init_table_handles()
@@ -0,0 +1,42 @@
+"""Accessors for API Gateway HTTP API (payload v2) events.
+
+Reference: ADR-03 API Design
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+# Shared read-only stand-in for absent headers/path/query maps, so lookups never allocate a default dict
+EMPTY_MAPPING: Mapping[str, str] = MappingProxyType({})
+
+
+def get_route(event: dict[str, Any]) -> tuple[str, str]:
+    """Return the HTTP method and raw path of a request.
+
+    Args:
+        event: API Gateway event dictionary.
+
+    Returns:
+        Tuple of (method, path); both are empty strings if the event has no HTTP context.
+    """
+    try:
+        http = event["requestContext"]["http"]
+        return http["method"], http["path"]
+    except (KeyError, TypeError):
+        return "", ""
+
+
+def get_map(event: dict[str, Any], key: str) -> Mapping[str, str]:
+    """Return a string map from the event such as headers or pathParameters.
+
+    API Gateway omits these keys or sets them to null when they are empty.
+
+    Args:
+        event: API Gateway event dictionary.
+        key: Event key, e.g. "headers", "pathParameters" or "queryStringParameters".
+
+    Returns:
+        The map, or a shared empty read-only mapping.
+    """
+    return event.get(key) or EMPTY_MAPPING
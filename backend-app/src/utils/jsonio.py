@@ -0,0 +1,72 @@
+"""JSON encoding and decoding for request and response bodies.
+
+Uses orjson when it is available in the deployment package and falls back to
+the standard library otherwise, so handlers never depend on it being present.
+"""
+
+import json
+from decimal import Decimal
+from typing import Any
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """Encode values the JSON libraries do not handle natively.
+
+    DynamoDB numbers arrive as Decimal; the models convert them, but a value
+    that slips through should still encode as a JSON number.
+
+    Args:
+        obj: Value the encoder could not serialize.
+
+    Returns:
+        A JSON-serializable replacement.
+
+    Raises:
+        TypeError: If the value has no JSON representation.
+    """
+    if isinstance(obj, Decimal):
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def loads(data: str | bytes) -> Any:
+    """Decode a JSON document.
+
+    Args:
+        data: JSON text as str or bytes.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        JSONDecodeError: If the document is not valid JSON.
+    """
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Encode an object as a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        The JSON document as str (API Gateway expects a string body).
+    """
+    if _HAS_ORJSON:
+        encoded: str = orjson.dumps(obj, default=_default).decode()
+        return encoded
+    return json.dumps(obj, separators=(",", ":"), default=_default)
@@ -0,0 +1,93 @@
+"""Short-TTL in-process cache for question reads.
+
+Agents poll the same question repeatedly, so a cache that lives in the warm
+Lambda container collapses repeated GetItem calls while status changes still
+show up within QUESTION_CACHE_TTL_SECONDS. Handlers may read from worker
+threads, so all access goes through a single lock.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+QUESTION_CACHE_TTL_SECONDS = 2.0
+QUESTION_CACHE_MAX_SIZE = 512
+
+
+class QuestionCache[V]:
+    """Thread-safe LRU cache with a per-entry TTL, keyed by question_id.
+
+    Cached values are shared between callers, so they should be immutable.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = QUESTION_CACHE_TTL_SECONDS,
+        max_size: int = QUESTION_CACHE_MAX_SIZE,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long an entry is served after it was fetched.
+            max_size: Maximum number of entries; the least recently used is evicted beyond it.
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+    def keys(self) -> list[str]:
+        """Return the cached question IDs, least recently used first."""
+        with self._lock:
+            return list(self._entries)
+
+    def get(self, question_id: str) -> V | None:
+        """Return a fresh cached value.
+
+        Args:
+            question_id: The question ID to look up.
+
+        Returns:
+            The cached value, or None if it is missing or older than the TTL.
+        """
+        with self._lock:
+            entry = self._entries.get(question_id)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= self.ttl_seconds:
+                del self._entries[question_id]
+                return None
+            self._entries.move_to_end(question_id)
+            return entry[1]
+
+    def put(self, question_id: str, value: V, fetched_at: float) -> None:
+        """Store a value, evicting the least recently used entry on overflow.
+
+        Args:
+            question_id: The question ID to store the value under.
+            value: The value to cache.
+            fetched_at: Monotonic timestamp taken before the value was fetched.
+        """
+        with self._lock:
+            self._entries[question_id] = (fetched_at, value)
+            self._entries.move_to_end(question_id)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, question_id: str) -> None:
+        """Drop one entry, e.g. after the question was modified.
+
+        Args:
+            question_id: The question ID to evict.
+        """
+        with self._lock:
+            self._entries.pop(question_id, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,25 @@
+"""ISO 8601 timestamp formatting for stored items.
+
+Reference: ADR-02 Database Schema Design
+"""
+
+import time
+
+
+def utc_isoformat(timestamp: float | None = None) -> str:
+    """Format a Unix timestamp as an ISO 8601 UTC string with microseconds.
+
+    Produces the same text as datetime.isoformat() on an aware UTC datetime
+    (e.g. "2026-01-01T12:00:00.123456+00:00") without building a datetime,
+    except that the fractional part is always present.
+
+    Args:
+        timestamp: Seconds since the epoch; defaults to the current time.
+
+    Returns:
+        The formatted timestamp.
+    """
+    if timestamp is None:
+        timestamp = time.time()
+    seconds, micros = divmod(round(timestamp * 1_000_000), 1_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{micros:06d}+00:00"
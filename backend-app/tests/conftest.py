@@ -2,80 +2,94 @@
 
 import json
 import os
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
+# Table names are read when src.utils.dynamodb is imported, so they must be set
+# before any test module imports the application code
+os.environ["QUESTIONS_TABLE"] = "test-questions"
+os.environ["RESPONSES_TABLE"] = "test-responses"
+
 
 @pytest.fixture(autouse=True)
-def mock_env_vars() -> None:
-    """Set required environment variables for all tests."""
-    os.environ["QUESTIONS_TABLE"] = "test-questions"
-    os.environ["RESPONSES_TABLE"] = "test-responses"
+def clear_question_cache() -> None:
+    """Start every test with an empty question read cache."""
+    from src.models.question import clear_question_cache
+
+    clear_question_cache()
 
 
 @pytest.fixture
-def mock_dynamodb_tables() -> Any:
+def mock_dynamodb_tables(monkeypatch: pytest.MonkeyPatch) -> dict[str, MagicMock]:
     """Mock DynamoDB tables for testing."""
-    with patch("src.utils.dynamodb.get_dynamodb_resource") as mock_resource:
-        mock_questions_table = MagicMock()
-        mock_responses_table = MagicMock()
-
-        # Configure the mock resource to return mock tables
-        mock_resource.return_value.Table.side_effect = lambda name: (
-            mock_questions_table if "questions" in name else mock_responses_table
-        )
-
-        yield {
-            "questions": mock_questions_table,
-            "responses": mock_responses_table,
-        }
+    from src.utils import dynamodb
 
+    mock_questions_table = MagicMock()
+    mock_responses_table = MagicMock()
+    monkeypatch.setattr(dynamodb, "_questions_table", mock_questions_table)
+    monkeypatch.setattr(dynamodb, "_responses_table", mock_responses_table)
 
-@pytest.fixture
-def sample_question_data() -> dict[str, Any]:
-    """Sample question data for testing."""
     return {
-        "question_id": "q_test123456",
-        "prompt": "What is the best approach for this feature?",
-        "type": "text",
-        "status": "OPEN",
-        "min_responses": 5,
-        "current_responses": 0,
-        "created_at": "2026-02-02T12:00:00+00:00",
-        "expires_at": "2026-02-02T13:00:00+00:00",
-        "audience": ["general"],
+        "questions": mock_questions_table,
+        "responses": mock_responses_table,
     }
 
 
-@pytest.fixture
-def sample_multiple_choice_question_data() -> dict[str, Any]:
+# Sample data is shared by the whole session and read-only; tests that need a
+# variant build their own dict, e.g. {**sample_question_data, "status": "CLOSED"}.
+@pytest.fixture(scope="session")
+def sample_question_data() -> Mapping[str, Any]:
+    """Sample question data for testing."""
+    return MappingProxyType(
+        {
+            "question_id": "q_test123456",
+            "prompt": "What is the best approach for this feature?",
+            "type": "text",
+            "status": "OPEN",
+            "min_responses": 5,
+            "current_responses": 0,
+            "created_at": "2026-02-02T12:00:00+00:00",
+            "expires_at": "2026-02-02T13:00:00+00:00",
+            "audience": ["general"],
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_multiple_choice_question_data() -> Mapping[str, Any]:
     """Sample multiple choice question data for testing."""
-    return {
-        "question_id": "q_mc_test1234",
-        "prompt": "Which option do you prefer?",
-        "type": "multiple_choice",
-        "status": "OPEN",
-        "min_responses": 3,
-        "current_responses": 0,
-        "created_at": "2026-02-02T12:00:00+00:00",
-        "expires_at": "2026-02-02T13:00:00+00:00",
-        "options": ["Option A", "Option B", "Option C"],
-        "audience": ["technical"],
-    }
+    return MappingProxyType(
+        {
+            "question_id": "q_mc_test1234",
+            "prompt": "Which option do you prefer?",
+            "type": "multiple_choice",
+            "status": "OPEN",
+            "min_responses": 3,
+            "current_responses": 0,
+            "created_at": "2026-02-02T12:00:00+00:00",
+            "expires_at": "2026-02-02T13:00:00+00:00",
+            "options": ["Option A", "Option B", "Option C"],
+            "audience": ["technical"],
+        }
+    )
 
 
-@pytest.fixture
-def sample_response_data() -> dict[str, Any]:
+@pytest.fixture(scope="session")
+def sample_response_data() -> Mapping[str, Any]:
     """Sample response data for testing."""
-    return {
-        "question_id": "q_test123456",
-        "response_id": "r_resp123456",
-        "created_at": "2026-02-02T12:30:00+00:00",
-        "answer": "I think we should use approach X because...",
-        "confidence": 4,
-    }
+    return MappingProxyType(
+        {
+            "question_id": "q_test123456",
+            "response_id": "r_resp123456",
+            "created_at": "2026-02-02T12:30:00+00:00",
+            "answer": "I think we should use approach X because...",
+            "confidence": 4,
+        }
+    )
 
 
 @pytest.fixture
@@ -100,49 +114,37 @@ def api_gateway_event() -> dict[str, Any]:
     }
 
 
-def make_post_event(path: str, body: dict[str, Any]) -> dict[str, Any]:
-    """Create a POST event for testing handlers."""
+# Top-level event fields shared by every test event. Only immutable values live
+# here; nested dicts are built per event so tests can mutate them freely.
+_EVENT_TEMPLATE: dict[str, Any] = {
+    "version": "2.0",
+    "routeKey": "$default",
+    "rawQueryString": "",
+    "isBase64Encoded": False,
+}
+
+
+def _make_event(method: str, path: str, body: str | None, **fields: Any) -> dict[str, Any]:
+    """Create an API Gateway HTTP API (payload v2) event from the shared template."""
     return {
-        "version": "2.0",
-        "routeKey": "$default",
+        **_EVENT_TEMPLATE,
         "rawPath": path,
-        "rawQueryString": "",
-        "headers": {
-            "content-type": "application/json",
-        },
-        "requestContext": {
-            "http": {
-                "method": "POST",
-                "path": path,
-            },
-        },
-        "body": json.dumps(body),
-        "isBase64Encoded": False,
+        "headers": {"content-type": "application/json"},
+        "requestContext": {"http": {"method": method, "path": path}},
+        "body": body,
+        **fields,
     }
 
 
+def make_post_event(path: str, body: dict[str, Any]) -> dict[str, Any]:
+    """Create a POST event for testing handlers."""
+    return _make_event("POST", path, json.dumps(body))
+
+
 def make_get_event(
     path: str,
     path_params: dict[str, str] | None = None,
     query_params: dict[str, str] | None = None,
 ) -> dict[str, Any]:
     """Create a GET event for testing handlers."""
-    return {
-        "version": "2.0",
-        "routeKey": "$default",
-        "rawPath": path,
-        "rawQueryString": "",
-        "headers": {
-            "content-type": "application/json",
-        },
-        "requestContext": {
-            "http": {
-                "method": "GET",
-                "path": path,
-            },
-        },
-        "pathParameters": path_params,
-        "queryStringParameters": query_params,
-        "body": None,
-        "isBase64Encoded": False,
-    }
+    return _make_event("GET", path, None, pathParameters=path_params, queryStringParameters=query_params)
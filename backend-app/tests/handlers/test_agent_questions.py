@@ -1,6 +1,7 @@
 """Tests for the agent questions handler."""
 
 import json
+from collections.abc import Mapping
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -35,6 +36,47 @@ class TestAgentQuestionsHandler:
         assert body["status"] == "OPEN"
         mock_save.assert_called_once()
 
+    @patch("src.handlers.agent_questions.save_questions")
+    def test_create_questions_batch(self, mock_save: MagicMock) -> None:
+        """POST to /batch should create every question with one batched save."""
+        from src.handlers.agent_questions import handler
+
+        event = make_post_event(
+            "/agent/questions/batch",
+            {
+                "questions": [
+                    {"prompt": "First?", "type": "text"},
+                    {"prompt": "Second?", "type": "multiple_choice", "options": ["A", "B"]},
+                ]
+            },
+        )
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 201
+        created = json.loads(response["body"])["questions"]
+        assert len(created) == 2
+        assert all(item["status"] == "OPEN" for item in created)
+        saved = mock_save.call_args.args[0]
+        assert [question.question_id for question in saved] == [item["question_id"] for item in created]
+        assert [question.prompt for question in saved] == ["First?", "Second?"]
+
+    @patch("src.handlers.agent_questions.save_questions")
+    def test_create_questions_batch_invalid_item(self, mock_save: MagicMock) -> None:
+        """One invalid question should reject the whole batch."""
+        from src.handlers.agent_questions import handler
+
+        event = make_post_event(
+            "/agent/questions/batch",
+            {"questions": [{"prompt": "Fine?", "type": "text"}, {"type": "text"}]},
+        )
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["details"]["field"] == "prompt"
+        mock_save.assert_not_called()
+
     def test_create_question_missing_prompt(self) -> None:
         """POST without prompt should return 400."""
         from src.handlers.agent_questions import handler
@@ -66,11 +108,57 @@ class TestAgentQuestionsHandler:
 
         assert response["statusCode"] == 400
 
+    def test_create_question_unhashable_type(self) -> None:
+        """POST with a list or object type should return 400, not a server error."""
+        from src.handlers.agent_questions import handler
+
+        event = make_post_event("/agent/questions", {"prompt": "Test question", "type": ["text"]})
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["details"]["field"] == "type"
+
+    @patch("src.handlers.agent_questions.save_questions")
+    def test_create_questions_batch_unhashable_type(self, mock_save: MagicMock) -> None:
+        """A batch item with an object type should reject the batch with 400."""
+        from src.handlers.agent_questions import handler
+
+        event = make_post_event(
+            "/agent/questions/batch",
+            {"questions": [{"prompt": "Test question", "type": {"a": 1}}]},
+        )
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["details"]["field"] == "type"
+        mock_save.assert_not_called()
+
+    def test_create_question_too_many_options(self) -> None:
+        """POST with more than the allowed number of options should return 400 with details."""
+        from src.handlers.agent_questions import handler
+
+        event = make_post_event(
+            "/agent/questions",
+            {
+                "prompt": "Pick one",
+                "type": "multiple_choice",
+                "options": [str(i) for i in range(11)],
+            },
+        )
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 400
+        details = json.loads(response["body"])["error"]["details"]
+        assert details == {"field": "options", "constraint": "length", "min": 2, "max": 10}
+
     @patch("src.handlers.agent_questions.get_question_with_responses")
     def test_get_question_success(
         self,
         mock_get: MagicMock,
-        sample_question_data: dict[str, Any],
+        sample_question_data: Mapping[str, Any],
     ) -> None:
         """GET should return question with responses."""
         from src.handlers.agent_questions import handler
@@ -112,6 +200,47 @@ class TestAgentQuestionsHandler:
         body = json.loads(response["body"])
         assert body["error"]["code"] == "QUESTION_NOT_FOUND"
 
+    @patch("src.handlers.agent_questions.get_questions_with_responses")
+    def test_get_questions_batch(
+        self,
+        mock_get: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """GET without a path ID should poll every listed question in one call."""
+        from src.handlers.agent_questions import handler
+        from src.models.question import Question
+
+        mock_get.return_value = [(Question(**sample_question_data), [{"answer": "test"}])]
+
+        event = make_get_event("/agent/questions", query_params={"ids": "q_test123456,q_missing"})
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 200
+        body = json.loads(response["body"])
+        assert [question["question_id"] for question in body["questions"]] == ["q_test123456"]
+        assert body["questions"][0]["responses"] == [{"answer": "test"}]
+        mock_get.assert_called_once_with(["q_test123456", "q_missing"])
+
+    def test_get_questions_batch_requires_ids(self) -> None:
+        """GET without a path ID or ids should return 400."""
+        from src.handlers.agent_questions import handler
+
+        response = handler(make_get_event("/agent/questions"), None)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["details"]["field"] == "ids"
+
+    def test_get_questions_batch_too_many_ids(self) -> None:
+        """GET with more IDs than one batch allows should return 400."""
+        from src.handlers.agent_questions import MAX_POLL_IDS, handler
+
+        ids = ",".join(f"q_{i}" for i in range(MAX_POLL_IDS + 1))
+        response = handler(make_get_event("/agent/questions", query_params={"ids": ids}), None)
+
+        assert response["statusCode"] == 400
+        assert json.loads(response["body"])["error"]["details"]["max"] == MAX_POLL_IDS
+
     def test_unsupported_method(self) -> None:
         """Unsupported HTTP method should return 400."""
         from src.handlers.agent_questions import handler
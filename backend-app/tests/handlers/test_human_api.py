@@ -1,6 +1,7 @@
 """Tests for the human API handler."""
 
 import json
+from collections.abc import Mapping
 from typing import Any
 from unittest.mock import MagicMock, patch
 
@@ -10,18 +11,17 @@ from tests.conftest import make_get_event, make_post_event
 class TestHumanApiHandler:
     """Tests for the main human API handler."""
 
-    @patch("src.handlers.human_api.list_open_questions")
+    @patch("src.handlers.human_api.list_open_question_items")
     def test_list_questions_success(
         self,
         mock_list: MagicMock,
-        sample_question_data: dict[str, Any],
+        sample_question_data: Mapping[str, Any],
     ) -> None:
         """GET /human/questions should return list of open questions."""
         from src.handlers.human_api import handler
         from src.models.question import Question
 
-        mock_question = Question(**sample_question_data)
-        mock_list.return_value = [mock_question]
+        mock_list.return_value = [Question(**sample_question_data).to_human_list_item()]
 
         event = make_get_event("/human/questions")
 
@@ -32,11 +32,33 @@ class TestHumanApiHandler:
         assert "questions" in body
         assert len(body["questions"]) == 1
 
+    @patch("src.handlers.human_api.get_answered_question_ids")
+    @patch("src.handlers.human_api.list_open_question_items")
+    def test_list_questions_excludes_answered(
+        self,
+        mock_list: MagicMock,
+        mock_answered: MagicMock,
+    ) -> None:
+        """Answered question IDs for the fingerprint should be excluded by the query."""
+        from src.handlers.human_api import handler
+
+        mock_answered.return_value = {"q_answered"}
+        mock_list.return_value = []
+
+        event = make_get_event("/human/questions")
+        event["headers"]["x-fingerprint"] = "fp_123"
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 200
+        mock_answered.assert_called_once_with("fp_123")
+        mock_list.assert_called_once_with(limit=20, exclude_ids={"q_answered"})
+
     @patch("src.handlers.human_api.get_question")
     def test_get_question_success(
         self,
         mock_get: MagicMock,
-        sample_question_data: dict[str, Any],
+        sample_question_data: Mapping[str, Any],
     ) -> None:
         """GET /human/questions/{id} should return question details."""
         from src.handlers.human_api import handler
@@ -76,15 +98,13 @@ class TestHumanApiHandler:
 
         assert response["statusCode"] == 404
 
-    @patch("src.handlers.human_api.update_question_status")
-    @patch("src.handlers.human_api.save_response")
+    @patch("src.handlers.human_api.save_response_and_increment")
     @patch("src.handlers.human_api.get_question")
     def test_submit_response_success(
         self,
         mock_get_question: MagicMock,
-        mock_save_response: MagicMock,  # noqa: ARG002
-        mock_update_status: MagicMock,
-        sample_question_data: dict[str, Any],
+        mock_save: MagicMock,
+        sample_question_data: Mapping[str, Any],
     ) -> None:
         """POST /human/responses should submit answer and return 201."""
         from src.handlers.human_api import handler
@@ -92,7 +112,7 @@ class TestHumanApiHandler:
 
         mock_question = Question(**sample_question_data)
         mock_get_question.return_value = mock_question
-        mock_update_status.return_value = "PARTIAL"
+        mock_save.return_value = "PARTIAL"
 
         event = make_post_event(
             "/human/responses",
@@ -109,6 +129,9 @@ class TestHumanApiHandler:
         body = json.loads(response["body"])
         assert "response_id" in body
         assert body["points_earned"] == 10
+        (saved,) = mock_save.call_args.args
+        assert saved.response_id == body["response_id"]
+        assert mock_save.call_args.kwargs == {"min_responses": 5}
 
     @patch("src.handlers.human_api.get_question")
     def test_submit_response_question_not_found(
@@ -136,14 +159,13 @@ class TestHumanApiHandler:
     def test_submit_response_question_closed(
         self,
         mock_get: MagicMock,
-        sample_question_data: dict[str, Any],
+        sample_question_data: Mapping[str, Any],
     ) -> None:
         """POST to closed question should return 410."""
         from src.handlers.human_api import handler
         from src.models.question import Question
 
-        sample_question_data["status"] = "CLOSED"
-        mock_question = Question(**sample_question_data)
+        mock_question = Question(**{**sample_question_data, "status": "CLOSED"})
         mock_get.return_value = mock_question
 
         event = make_post_event(
@@ -158,6 +180,33 @@ class TestHumanApiHandler:
 
         assert response["statusCode"] == 410
 
+    @patch("src.handlers.human_api.save_response_and_increment")
+    @patch("src.handlers.human_api.get_question")
+    def test_submit_response_closed_concurrently(
+        self,
+        mock_get_question: MagicMock,
+        mock_save: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """POST should return 410 if the question closed after it was read."""
+        from src.handlers.human_api import handler
+        from src.models.question import Question
+
+        mock_get_question.return_value = Question(**sample_question_data)
+        mock_save.return_value = None
+
+        event = make_post_event(
+            "/human/responses",
+            {
+                "question_id": "q_test123456",
+                "answer": "Test",
+            },
+        )
+
+        response = handler(event, None)
+
+        assert response["statusCode"] == 410
+
     def test_submit_response_missing_question_id(self) -> None:
         """POST without question_id should return 400."""
         from src.handlers.human_api import handler
@@ -1,8 +1,15 @@
 """Tests for the Question model."""
 
+import dataclasses
+import sys
+import threading
+from collections.abc import Mapping
+from decimal import Decimal
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.models.question import Question, generate_question_id
 
 
@@ -14,6 +21,12 @@ class TestGenerateQuestionId:
         question_id = generate_question_id()
         assert question_id.startswith("q_")
 
+    def test_generates_twelve_hex_chars(self) -> None:
+        """The random part should stay 12 lowercase hex characters."""
+        suffix = generate_question_id().removeprefix("q_")
+        assert len(suffix) == 12
+        assert set(suffix) <= set("0123456789abcdef")
+
     def test_generates_unique_ids(self) -> None:
         """Each call should generate a unique ID."""
         ids = {generate_question_id() for _ in range(100)}
@@ -52,7 +65,7 @@ class TestQuestionModel:
         assert question.type == "multiple_choice"
         assert question.options == options
 
-    def test_to_dynamo_item(self, sample_question_data: dict[str, Any]) -> None:
+    def test_to_dynamo_item(self, sample_question_data: Mapping[str, Any]) -> None:
         """to_dynamo_item should serialize question correctly."""
         question = Question(**sample_question_data)
         item = question.to_dynamo_item()
@@ -62,7 +75,26 @@ class TestQuestionModel:
         assert item["type"] == sample_question_data["type"]
         assert item["status"] == sample_question_data["status"]
 
-    def test_from_dynamo_item(self, sample_question_data: dict[str, Any]) -> None:
+    def test_to_dynamo_item_accepting_flag(self, sample_question_data: Mapping[str, Any]) -> None:
+        """Only questions that accept responses should carry the sparse index key."""
+        open_item = Question(**sample_question_data).to_dynamo_item()
+        closed_item = Question(**{**sample_question_data, "status": "CLOSED"}).to_dynamo_item()
+
+        assert open_item["accepting"] == "1"
+        assert "accepting" not in closed_item
+
+    @patch("src.models.question.time.time", return_value=1_770_000_000.5)
+    def test_create_sets_numeric_ttl(self, mock_time: MagicMock) -> None:  # noqa: ARG002
+        """New questions should carry an epoch TTL one grace period after expiry."""
+        from src.models.question import QUESTION_TTL_GRACE_SECONDS
+
+        question = Question.create(prompt="Test?", question_type="text", timeout_seconds=600)
+        item = question.to_dynamo_item()
+
+        assert item["ttl"] == 1_770_000_000 + 600 + QUESTION_TTL_GRACE_SECONDS
+        assert Question.from_dynamo_item(item).ttl == item["ttl"]
+
+    def test_from_dynamo_item(self, sample_question_data: Mapping[str, Any]) -> None:
         """from_dynamo_item should deserialize question correctly."""
         question = Question.from_dynamo_item(sample_question_data)
 
@@ -70,7 +102,26 @@ class TestQuestionModel:
         assert question.prompt == sample_question_data["prompt"]
         assert question.type == sample_question_data["type"]
 
-    def test_to_agent_response(self, sample_question_data: dict[str, Any]) -> None:
+    def test_from_dynamo_item_converts_counters(self, sample_question_data: Mapping[str, Any]) -> None:
+        """Decimal counters from boto3 should become ints on the model."""
+        item = {**sample_question_data, "min_responses": Decimal(5), "current_responses": Decimal(2), "ttl": Decimal(9)}
+
+        question = Question.from_dynamo_item(item)
+
+        assert (question.min_responses, question.current_responses, question.ttl) == (5, 2, 9)
+        assert type(question.min_responses) is int
+        assert question.audience == ["general"]
+
+    def test_from_dynamo_item_shares_status_and_type(self, sample_question_data: Mapping[str, Any]) -> None:
+        """Decoded status and type strings should be replaced by shared canonical objects."""
+        item = {**sample_question_data, "status": "".join(["OP", "EN"]), "type": "".join(["te", "xt"])}
+
+        question = Question.from_dynamo_item(item)
+
+        assert question.status is Question.from_dynamo_item(sample_question_data).status
+        assert question.type is sys.intern("text")
+
+    def test_to_agent_response(self, sample_question_data: Mapping[str, Any]) -> None:
         """to_agent_response should format response for agent API."""
         question = Question(**sample_question_data)
         response = question.to_agent_response(responses=[{"answer": "test"}])
@@ -79,7 +130,7 @@ class TestQuestionModel:
         assert response["status"] == "OPEN"
         assert response["responses"] == [{"answer": "test"}]
 
-    def test_to_human_list_item(self, sample_question_data: dict[str, Any]) -> None:
+    def test_to_human_list_item(self, sample_question_data: Mapping[str, Any]) -> None:
         """to_human_list_item should format response for human list API."""
         question = Question(**sample_question_data)
         item = question.to_human_list_item()
@@ -88,6 +139,14 @@ class TestQuestionModel:
         assert item["prompt"] == sample_question_data["prompt"]
         assert "responses_needed" in item
 
+    def test_question_is_immutable(self, sample_question_data: Mapping[str, Any]) -> None:
+        """Questions should be frozen slotted instances."""
+        question = Question(**sample_question_data)
+
+        assert not hasattr(question, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            question.status = "CLOSED"  # type: ignore[misc]
+
 
 class TestQuestionDatabaseOperations:
     """Tests for question database operations."""
@@ -108,11 +167,46 @@ class TestQuestionDatabaseOperations:
 
         mock_table.put_item.assert_called_once()
 
+    @patch("src.models.question.transact_put_items")
+    @patch("src.models.question.get_questions_table")
+    def test_save_questions_in_one_transaction(self, mock_get_table: MagicMock, mock_transact_put: MagicMock) -> None:
+        """save_questions should write all questions through one transactional call."""
+        from src.models.question import save_questions
+
+        questions = [Question.create(prompt=f"Q{i}?", question_type="text") for i in range(3)]
+        save_questions(questions)
+
+        mock_transact_put.assert_called_once_with(
+            mock_get_table.return_value, [question.to_dynamo_item() for question in questions]
+        )
+
+    @patch("src.models.question.batch_get_items")
+    @patch("src.models.question.get_questions_table")
+    def test_get_questions_uses_cache_and_batch(
+        self,
+        mock_get_table: MagicMock,
+        mock_batch_get: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """Only uncached IDs should be read, and missing ones left out of the result."""
+        from src.models.question import get_question, get_questions
+
+        mock_get_table.return_value.get_item.return_value = {"Item": sample_question_data}
+        get_question("q_test123456")
+        mock_batch_get.return_value = [{**sample_question_data, "question_id": "q_other"}]
+
+        questions = get_questions(["q_test123456", "q_other", "q_missing", "q_other"])
+
+        assert set(questions) == {"q_test123456", "q_other"}
+        mock_batch_get.assert_called_once_with(
+            mock_get_table.return_value, [{"question_id": "q_other"}, {"question_id": "q_missing"}]
+        )
+
     @patch("src.models.question.get_questions_table")
     def test_get_question_found(
         self,
         mock_get_table: MagicMock,
-        sample_question_data: dict[str, Any],
+        sample_question_data: Mapping[str, Any],
     ) -> None:
         """get_question should return question when found."""
         from src.models.question import get_question
@@ -141,3 +235,323 @@ class TestQuestionDatabaseOperations:
         question = get_question("q_nonexistent")
 
         assert question is None
+
+    @patch("src.models.question.get_responses_table")
+    @patch("src.models.question.get_questions_table")
+    def test_get_question_with_responses(
+        self,
+        mock_get_questions: MagicMock,
+        mock_get_responses: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """Responses should only expose answer, selected_option and confidence."""
+        from src.models.question import get_question_with_responses
+
+        mock_questions = MagicMock()
+        mock_questions.get_item.return_value = {"Item": sample_question_data}
+        mock_get_questions.return_value = mock_questions
+        mock_responses = MagicMock()
+        mock_responses.query.return_value = {
+            "Items": [
+                {"question_id": "q_test123456", "answer": "A", "confidence": Decimal(4), "fingerprint_hash": "fp"},
+                {"question_id": "q_test123456", "selected_option": Decimal(1)},
+            ]
+        }
+        mock_get_responses.return_value = mock_responses
+
+        question, responses = get_question_with_responses("q_test123456")
+
+        assert question is not None
+        assert responses == [{"answer": "A", "confidence": 4}, {"selected_option": 1}]
+        query_kwargs = mock_responses.query.call_args.kwargs
+        assert query_kwargs["ProjectionExpression"] == "#answer, #selected_option, #confidence"
+        assert query_kwargs["ExpressionAttributeNames"]["#selected_option"] == "selected_option"
+
+    @patch("src.models.question.get_responses_table")
+    @patch("src.models.question.get_questions_table")
+    def test_get_question_with_responses_missing_question(
+        self,
+        mock_get_questions: MagicMock,
+        mock_get_responses: MagicMock,
+    ) -> None:
+        """A missing question should yield no responses even though both reads ran."""
+        from src.models.question import get_question_with_responses
+
+        mock_get_questions.return_value.get_item.return_value = {}
+        mock_get_responses.return_value.query.return_value = {"Items": [{"answer": "orphan"}]}
+
+        assert get_question_with_responses("q_missing") == (None, [])
+        mock_get_responses.return_value.query.assert_called_once()
+
+    @patch("src.models.question.get_responses_table")
+    @patch("src.models.question.batch_get_items")
+    @patch("src.models.question.get_questions_table")
+    def test_get_questions_with_responses(
+        self,
+        mock_get_questions: MagicMock,  # noqa: ARG002
+        mock_batch_get: MagicMock,
+        mock_get_responses: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """Found questions should come back in request order with their responses; unknown IDs are dropped."""
+        from src.models.question import get_questions_with_responses
+
+        mock_batch_get.return_value = [
+            {**sample_question_data, "question_id": "q_b"},
+            {**sample_question_data, "question_id": "q_a"},
+        ]
+        mock_get_responses.return_value.query.return_value = {"Items": [{"answer": "A", "fingerprint_hash": "fp"}]}
+
+        results = get_questions_with_responses(["q_a", "q_missing", "q_b", "q_a"])
+
+        assert [question.question_id for question, _ in results] == ["q_a", "q_b"]
+        assert [responses for _, responses in results] == [[{"answer": "A"}], [{"answer": "A"}]]
+        assert mock_get_responses.return_value.query.call_count == 2
+
+    @patch("src.models.question.get_responses_table")
+    @patch("src.models.question.batch_get_items")
+    @patch("src.models.question.get_questions_table")
+    def test_get_questions_with_responses_queries_concurrently(
+        self,
+        mock_get_questions: MagicMock,  # noqa: ARG002
+        mock_batch_get: MagicMock,
+        mock_get_responses: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """A full batched poll should run every responses query at the same time."""
+        from src.models.question import MAX_POLL_IDS, get_questions_with_responses
+        from src.utils.dynamodb import CLIENT_CONFIG
+
+        question_ids = [f"q_{i}" for i in range(MAX_POLL_IDS)]
+        mock_batch_get.return_value = [
+            {**sample_question_data, "question_id": question_id} for question_id in question_ids
+        ]
+        barrier = threading.Barrier(MAX_POLL_IDS, timeout=5)
+
+        def query(**kwargs: Any) -> dict[str, Any]:  # noqa: ARG001
+            barrier.wait()
+            return {"Items": []}
+
+        mock_get_responses.return_value.query.side_effect = query
+
+        results = get_questions_with_responses(question_ids)
+
+        assert len(results) == MAX_POLL_IDS
+        assert CLIENT_CONFIG.max_pool_connections > MAX_POLL_IDS
+
+
+class TestQuestionCache:
+    """Tests for the in-process get_question cache."""
+
+    @patch("src.models.question.get_questions_table")
+    def test_repeated_get_served_from_cache(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """Polling the same question within the TTL should hit DynamoDB once."""
+        from src.models.question import get_question
+
+        mock_table = MagicMock()
+        mock_table.get_item.return_value = {"Item": sample_question_data}
+        mock_get_table.return_value = mock_table
+
+        first = get_question("q_test123456")
+        second = get_question("q_test123456")
+
+        assert first is second
+        mock_table.get_item.assert_called_once()
+
+    @patch("src.models.question.time.monotonic")
+    @patch("src.models.question.get_questions_table")
+    def test_expired_entry_refetched(
+        self,
+        mock_get_table: MagicMock,
+        mock_monotonic: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """Entries older than the TTL should be fetched again."""
+        from src.models.question import get_question
+        from src.utils.question_cache import QUESTION_CACHE_TTL_SECONDS
+
+        mock_table = MagicMock()
+        mock_table.get_item.return_value = {"Item": sample_question_data}
+        mock_get_table.return_value = mock_table
+
+        mock_monotonic.return_value = 100.0
+        get_question("q_test123456")
+        mock_monotonic.return_value = 100.0 + QUESTION_CACHE_TTL_SECONDS
+        get_question("q_test123456")
+
+        assert mock_table.get_item.call_count == 2
+
+    @patch("src.models.question.get_questions_table")
+    def test_invalidate_evicts_entry(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """invalidate_cached_question should force the next read to DynamoDB."""
+        from src.models.question import get_question, invalidate_cached_question
+
+        mock_table = MagicMock()
+        mock_table.get_item.return_value = {"Item": sample_question_data}
+        mock_get_table.return_value = mock_table
+
+        get_question("q_test123456")
+        invalidate_cached_question("q_test123456")
+        get_question("q_test123456")
+
+        assert mock_table.get_item.call_count == 2
+
+
+class TestListOpenQuestions:
+    """Tests for listing open questions."""
+
+    @patch("src.models.question.get_questions_table")
+    def test_single_query_on_accepting_index(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """OPEN and PARTIAL questions should come from one query on the sparse index."""
+        from src.models.question import list_open_questions
+
+        partial_item = {**sample_question_data, "question_id": "q_partial", "status": "PARTIAL"}
+        mock_table = MagicMock()
+        mock_table.query.return_value = {"Items": [partial_item, sample_question_data]}
+        mock_get_table.return_value = mock_table
+
+        questions = list_open_questions(limit=20)
+
+        assert [q.question_id for q in questions] == ["q_partial", "q_test123456"]
+        mock_table.query.assert_called_once()
+        kwargs = mock_table.query.call_args.kwargs
+        assert kwargs["IndexName"] == "ByAccepting"
+        assert kwargs["KeyConditionExpression"].get_expression()["values"][1] == "1"
+        assert kwargs["ScanIndexForward"] is False
+
+    @patch("src.models.question.get_questions_table")
+    def test_respects_limit(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """The result should be truncated to the requested limit."""
+        from src.models.question import list_open_questions
+
+        mock_table = MagicMock()
+        mock_table.query.return_value = {"Items": [sample_question_data] * 3}
+        mock_get_table.return_value = mock_table
+
+        questions = list_open_questions(limit=2)
+
+        assert len(questions) == 2
+
+    @patch("src.models.question.get_questions_table")
+    def test_short_page_follows_last_evaluated_key(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """A page cut short by the filter should be continued from LastEvaluatedKey."""
+        from src.models.question import list_open_questions
+
+        last_key = {"question_id": "q_test123456", "accepting": "1", "created_at": "x"}
+        mock_table = MagicMock()
+        mock_table.query.side_effect = [
+            {"Items": [sample_question_data], "ScannedCount": 3, "LastEvaluatedKey": last_key},
+            {"Items": [sample_question_data], "ScannedCount": 3},
+        ]
+        mock_get_table.return_value = mock_table
+
+        questions = list_open_questions(limit=2, exclude_ids={"q_a"})
+
+        assert len(questions) == 2
+        assert mock_table.query.call_args_list[1].kwargs["ExclusiveStartKey"] == last_key
+
+    @patch("src.models.question.get_questions_table")
+    def test_excluded_ids_filtered_server_side(
+        self,
+        mock_get_table: MagicMock,
+    ) -> None:
+        """Excluded IDs should become a FilterExpression and widen the query limit."""
+        from src.models.question import list_open_questions
+
+        mock_table = MagicMock()
+        mock_table.query.return_value = {"Items": []}
+        mock_get_table.return_value = mock_table
+
+        list_open_questions(limit=10, exclude_ids={"q_a", "q_b"})
+
+        kwargs = mock_table.query.call_args.kwargs
+        assert kwargs["Limit"] == 12
+        assert "FilterExpression" in kwargs
+
+    @patch("src.models.question.get_questions_table")
+    def test_large_exclusion_set_filtered_locally(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """Exclusion sets above the IN operand limit should be filtered in Python."""
+        from src.models.question import list_open_questions
+
+        exclude_ids = {f"q_{i}" for i in range(150)}
+        mock_table = MagicMock()
+        mock_table.query.return_value = {
+            "Items": [{**sample_question_data, "question_id": "q_1"}, sample_question_data],
+        }
+        mock_get_table.return_value = mock_table
+
+        questions = list_open_questions(limit=10, exclude_ids=exclude_ids)
+
+        assert "FilterExpression" not in mock_table.query.call_args.kwargs
+        assert [q.question_id for q in questions] == ["q_test123456"]
+
+    @patch("src.models.question.get_questions_table")
+    def test_list_items_match_question_formatting(
+        self,
+        mock_get_table: MagicMock,
+        sample_question_data: Mapping[str, Any],
+    ) -> None:
+        """list_open_question_items should equal to_human_list_item on each question."""
+        from src.models.question import list_open_question_items, list_open_questions
+
+        mc_item = {
+            **sample_question_data,
+            "question_id": "q_mc",
+            "type": "multiple_choice",
+            "options": ["A", "B"],
+            "audience": ["technical"],
+            "current_responses": Decimal(2),
+            "min_responses": Decimal(5),
+        }
+        mock_table = MagicMock()
+        mock_table.query.return_value = {"Items": [sample_question_data, mc_item]}
+        mock_get_table.return_value = mock_table
+
+        items = list_open_question_items(limit=4)
+
+        assert items == [q.to_human_list_item() for q in list_open_questions(limit=4)]
+        assert items[1]["responses_needed"] == 3
+
+    @patch("src.models.question.get_questions_table")
+    def test_list_items_project_needed_attributes(self, mock_get_table: MagicMock) -> None:
+        """The list-item query should only project the attributes it formats."""
+        from src.models.question import HUMAN_LIST_ATTRIBUTES, list_open_question_items, list_open_questions
+
+        mock_table = MagicMock()
+        mock_table.query.return_value = {"Items": []}
+        mock_get_table.return_value = mock_table
+
+        list_open_question_items(limit=5)
+
+        for call in mock_table.query.call_args_list:
+            assert call.kwargs["ProjectionExpression"].split(", ") == [f"#{a}" for a in HUMAN_LIST_ATTRIBUTES]
+            assert call.kwargs["ExpressionAttributeNames"]["#type"] == "type"
+
+        mock_table.query.reset_mock()
+        list_open_questions(limit=5)
+
+        assert all("ProjectionExpression" not in call.kwargs for call in mock_table.query.call_args_list)
@@ -0,0 +1,112 @@
+"""Tests for request body models."""
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+import pytest
+
+from src.models.question import Question
+from src.models.requests import (
+    MAX_BATCH_QUESTIONS,
+    CreateQuestionRequest,
+    CreateQuestionsRequest,
+    RequestValidationError,
+    SubmitResponseRequest,
+)
+
+
+def _error(exc_info: pytest.ExceptionInfo[RequestValidationError]) -> dict[str, Any]:
+    body: dict[str, Any] = json.loads(exc_info.value.response["body"])
+    return body["error"]
+
+
+class TestCreateQuestionRequest:
+    """Tests for CreateQuestionRequest parsing."""
+
+    def test_defaults_applied(self) -> None:
+        """Omitted optional fields should take their defaults."""
+        request = CreateQuestionRequest.from_json('{"prompt": "Hi?", "type": "text", "options": ["a", "b"]}')
+
+        assert request.min_responses == 5
+        assert request.timeout_seconds == 3600
+        assert request.options is None
+
+    def test_invalid_json(self) -> None:
+        """Malformed JSON should raise a validation error."""
+        with pytest.raises(RequestValidationError) as exc_info:
+            CreateQuestionRequest.from_json("{not json")
+
+        assert exc_info.value.response["statusCode"] == 400
+        assert _error(exc_info)["message"] == "Invalid JSON in request body"
+
+    def test_non_object_body(self) -> None:
+        """A JSON body that is not an object should be rejected."""
+        with pytest.raises(RequestValidationError) as exc_info:
+            CreateQuestionRequest.from_json("[1, 2]")
+
+        assert _error(exc_info)["code"] == "VALIDATION_ERROR"
+
+    def test_timeout_out_of_range(self) -> None:
+        """timeout_seconds below the minimum should be rejected."""
+        with pytest.raises(RequestValidationError) as exc_info:
+            CreateQuestionRequest.from_json('{"prompt": "Hi?", "type": "text", "timeout_seconds": 10}')
+
+        assert _error(exc_info)["details"]["field"] == "timeout_seconds"
+
+
+class TestCreateQuestionsRequest:
+    """Tests for CreateQuestionsRequest parsing."""
+
+    def test_items_validated_in_order(self) -> None:
+        """Each item should be validated like a single create request."""
+        request = CreateQuestionsRequest.from_json(
+            json.dumps({"questions": [{"prompt": "A?", "type": "text"}, {"prompt": "B?", "type": "text"}]})
+        )
+
+        assert [question.prompt for question in request.questions] == ["A?", "B?"]
+        assert request.questions[0].min_responses == 5
+
+    def test_empty_list(self) -> None:
+        """An empty or missing questions list should be rejected."""
+        for body in ('{"questions": []}', "{}", '{"questions": ["A?"]}'):
+            with pytest.raises(RequestValidationError) as exc_info:
+                CreateQuestionsRequest.from_json(body)
+
+            assert _error(exc_info)["details"] == {"field": "questions", "constraint": "required"}
+
+    def test_too_many_questions(self) -> None:
+        """More questions than one batch allows should be rejected."""
+        items = [{"prompt": "Q?", "type": "text"}] * (MAX_BATCH_QUESTIONS + 1)
+
+        with pytest.raises(RequestValidationError) as exc_info:
+            CreateQuestionsRequest.from_json(json.dumps({"questions": items}))
+
+        assert _error(exc_info)["details"]["max"] == MAX_BATCH_QUESTIONS
+
+
+class TestSubmitResponseRequest:
+    """Tests for SubmitResponseRequest parsing and answer validation."""
+
+    def test_confidence_out_of_range(self) -> None:
+        """A confidence outside 1-5 should be rejected before the question is needed."""
+        with pytest.raises(RequestValidationError) as exc_info:
+            SubmitResponseRequest.from_json('{"question_id": "q_1", "confidence": 9}')
+
+        assert _error(exc_info)["details"]["field"] == "confidence"
+
+    def test_text_answer(self, sample_question_data: Mapping[str, Any]) -> None:
+        """Text questions should keep the answer and drop selected_option."""
+        request = SubmitResponseRequest.from_json('{"question_id": "q_1", "answer": "Yes", "selected_option": 1}')
+
+        assert request.validate_answer(Question(**sample_question_data)) == ("Yes", None)
+
+    def test_selected_option_out_of_range(self, sample_question_data: Mapping[str, Any]) -> None:
+        """selected_option must index into the question's options."""
+        question = Question(**{**sample_question_data, "type": "multiple_choice", "options": ["A", "B"]})
+        request = SubmitResponseRequest.from_json('{"question_id": "q_1", "selected_option": 2}')
+
+        with pytest.raises(RequestValidationError) as exc_info:
+            request.validate_answer(question)
+
+        assert _error(exc_info)["details"] == {"field": "selected_option", "constraint": "range", "min": 0, "max": 1}
@@ -1,8 +1,11 @@
 """Tests for the Response model."""
 
+from collections.abc import Mapping
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+from botocore.exceptions import ClientError
+
 from src.models.response import Response, generate_response_id
 
 
@@ -47,7 +50,7 @@ class TestResponseModel:
         assert response.selected_option == 2
         assert response.answer is None
 
-    def test_to_dynamo_item(self, sample_response_data: dict[str, Any]) -> None:
+    def test_to_dynamo_item(self, sample_response_data: Mapping[str, Any]) -> None:
         """to_dynamo_item should serialize response correctly."""
         response = Response(**sample_response_data)
         item = response.to_dynamo_item()
@@ -56,7 +59,18 @@ class TestResponseModel:
         assert item["response_id"] == sample_response_data["response_id"]
         assert item["answer"] == sample_response_data["answer"]
 
-    def test_from_dynamo_item(self, sample_response_data: dict[str, Any]) -> None:
+    def test_to_dynamo_item_omits_unset_fields(self) -> None:
+        """Fields that are None should not appear in the item at all."""
+        response = Response(question_id="q_1", response_id="r_1", created_at="t", answer="yes")
+
+        assert response.to_dynamo_item() == {
+            "question_id": "q_1",
+            "response_id": "r_1",
+            "created_at": "t",
+            "answer": "yes",
+        }
+
+    def test_from_dynamo_item(self, sample_response_data: Mapping[str, Any]) -> None:
         """from_dynamo_item should deserialize response correctly."""
         response = Response.from_dynamo_item(sample_response_data)
 
@@ -64,7 +78,7 @@ class TestResponseModel:
         assert response.response_id == sample_response_data["response_id"]
         assert response.answer == sample_response_data["answer"]
 
-    def test_to_api_response(self, sample_response_data: dict[str, Any]) -> None:
+    def test_to_api_response(self, sample_response_data: Mapping[str, Any]) -> None:
         """to_api_response should format response for API."""
         response = Response(**sample_response_data)
         api_response = response.to_api_response()
@@ -72,6 +86,12 @@ class TestResponseModel:
         assert api_response["response_id"] == sample_response_data["response_id"]
         assert api_response["points_earned"] == 10  # Placeholder value
 
+    def test_slotted_instances(self, sample_response_data: Mapping[str, Any]) -> None:
+        """Responses should not carry a per-instance __dict__."""
+        response = Response(**sample_response_data)
+
+        assert not hasattr(response, "__dict__")
+
 
 class TestResponseDatabaseOperations:
     """Tests for response database operations."""
@@ -94,3 +114,101 @@ class TestResponseDatabaseOperations:
         save_response(response)
 
         mock_table.put_item.assert_called_once()
+
+
+def _cancelled(*codes: str, item: dict[str, Any] | None = None) -> ClientError:
+    reasons: list[dict[str, Any]] = [{"Code": code} for code in codes]
+    if item is not None:
+        reasons[1]["Item"] = item
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": reasons,
+        },
+        "TransactWriteItems",
+    )
+
+
+@patch("src.models.response.get_questions_table")
+@patch("src.models.response.get_responses_table")
+@patch("src.models.response.get_dynamodb_client")
+class TestSaveResponseAndIncrement:
+    """Tests for the transactional response write."""
+
+    def test_below_threshold_single_transaction(
+        self,
+        mock_get_client: MagicMock,
+        mock_responses: MagicMock,
+        mock_questions: MagicMock,
+    ) -> None:
+        """A response below min_responses should commit in one transaction and leave the question PARTIAL."""
+        from src.models.response import save_response_and_increment
+
+        mock_responses.return_value.name = "test-responses"
+        mock_questions.return_value.name = "test-questions"
+        response = Response.create(question_id="q_test123456", answer="Yes")
+
+        status = save_response_and_increment(response, min_responses=5)
+
+        assert status == "PARTIAL"
+        transact_items = mock_get_client.return_value.transact_write_items.call_args.kwargs["TransactItems"]
+        assert transact_items[0]["Put"] == {"TableName": "test-responses", "Item": response.to_dynamo_item()}
+        update = transact_items[1]["Update"]
+        assert update["TableName"] == "test-questions"
+        assert update["UpdateExpression"].startswith("ADD current_responses :one")
+        assert update["ExpressionAttributeValues"][":last"] == 4
+
+    def test_reaching_threshold_closes_question(
+        self,
+        mock_get_client: MagicMock,
+        mock_responses: MagicMock,  # noqa: ARG002
+        mock_questions: MagicMock,  # noqa: ARG002
+    ) -> None:
+        """The response that reaches min_responses should be written with the CLOSED transition."""
+        from src.models.response import save_response_and_increment
+
+        transact = mock_get_client.return_value.transact_write_items
+        transact.side_effect = [
+            _cancelled("None", "ConditionalCheckFailed", item={"status": {"S": "PARTIAL"}}),
+            None,
+        ]
+
+        status = save_response_and_increment(Response.create(question_id="q_test123456", answer="Yes"), 5)
+
+        assert status == "CLOSED"
+        close_update = transact.call_args_list[1].kwargs["TransactItems"][1]["Update"]
+        assert "REMOVE accepting" in close_update["UpdateExpression"]
+        assert close_update["ExpressionAttributeValues"][":closed"] == "CLOSED"
+
+    def test_closed_question_writes_nothing(
+        self,
+        mock_get_client: MagicMock,
+        mock_responses: MagicMock,  # noqa: ARG002
+        mock_questions: MagicMock,  # noqa: ARG002
+    ) -> None:
+        """A question that no longer accepts responses should return None without a second attempt."""
+        from src.models.response import save_response_and_increment
+
+        transact = mock_get_client.return_value.transact_write_items
+        transact.side_effect = _cancelled("None", "ConditionalCheckFailed", item={"status": {"S": "CLOSED"}})
+
+        assert save_response_and_increment(Response.create(question_id="q_test123456", answer="Yes"), 5) is None
+        transact.assert_called_once()
+
+    @patch("src.models.response.time.sleep")
+    def test_conflict_retried(
+        self,
+        mock_sleep: MagicMock,
+        mock_get_client: MagicMock,
+        mock_responses: MagicMock,  # noqa: ARG002
+        mock_questions: MagicMock,  # noqa: ARG002
+    ) -> None:
+        """A transaction cancelled by a concurrent write should be retried."""
+        from src.models.response import save_response_and_increment
+
+        transact = mock_get_client.return_value.transact_write_items
+        transact.side_effect = [_cancelled("None", "TransactionConflict"), None]
+
+        assert save_response_and_increment(Response.create(question_id="q_test123456", answer="Yes"), 5) == "PARTIAL"
+        assert transact.call_count == 2
+        mock_sleep.assert_called_once()
@@ -0,0 +1,33 @@
+"""Tests for API response helpers."""
+
+import json
+
+from src.utils import api_response
+
+
+class TestErrorResponses:
+    """Tests for the error response helpers."""
+
+    def test_question_closed_body(self) -> None:
+        """Fixed error responses should carry the standard error envelope."""
+        response = api_response.question_closed()
+
+        assert response["statusCode"] == 410
+        assert response["headers"] == {"Content-Type": "application/json"}
+        assert json.loads(response["body"]) == {
+            "error": {"code": "QUESTION_CLOSED", "message": "This question is no longer accepting responses."}
+        }
+
+    def test_fixed_errors_are_prebuilt(self) -> None:
+        """Fixed error responses should be built once and reused."""
+        assert api_response.question_not_found() is api_response.question_not_found()
+        assert api_response.already_answered() is api_response.already_answered()
+        assert api_response.not_found() is api_response.not_found()
+        assert api_response.server_error() is api_response.server_error()
+
+    def test_custom_message_builds_new_response(self) -> None:
+        """A non-default message should produce its own response."""
+        response = api_response.server_error("boom")
+
+        assert response is not api_response.server_error()
+        assert json.loads(response["body"])["error"] == {"code": "SERVER_ERROR", "message": "boom"}
@@ -0,0 +1,206 @@
+"""Tests for the DynamoDB utilities."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock, patch
+
+import pytest
+from botocore.exceptions import ClientError
+
+from src.utils import dynamodb
+
+
+@pytest.fixture
+def fresh_handles() -> Iterator[None]:
+    """Reset the cached DynamoDB handles around a test."""
+    dynamodb.reset_table_handles()
+    yield
+    dynamodb.reset_table_handles()
+
+
+@pytest.mark.usefixtures("fresh_handles")
+class TestTableHandles:
+    """Tests for the cached table accessors."""
+
+    @patch("src.utils.dynamodb.boto3")
+    def test_resource_created_once(self, mock_boto3: MagicMock) -> None:
+        """The boto3 resource should be built once and reused across calls."""
+        first = dynamodb.get_dynamodb_resource()
+        second = dynamodb.get_dynamodb_resource()
+
+        assert first is second
+        mock_boto3.resource.assert_called_once_with("dynamodb", config=dynamodb.CLIENT_CONFIG)
+
+    @patch("src.utils.dynamodb.boto3")
+    def test_client_shares_resource_connection(self, mock_boto3: MagicMock) -> None:
+        """The low-level client should be the resource's own client."""
+        client = dynamodb.get_dynamodb_client()
+
+        assert client is mock_boto3.resource.return_value.meta.client
+        mock_boto3.client.assert_not_called()
+
+    @patch("src.utils.dynamodb.boto3")
+    def test_tables_cached_across_calls(self, mock_boto3: MagicMock) -> None:
+        """Table handles should be looked up once per container, not per call."""
+        mock_resource = mock_boto3.resource.return_value
+
+        for _ in range(3):
+            dynamodb.get_questions_table()
+            dynamodb.get_responses_table()
+
+        assert mock_resource.Table.call_count == 2
+        mock_resource.Table.assert_any_call("test-questions")
+        mock_resource.Table.assert_any_call("test-responses")
+
+    @patch("src.utils.dynamodb.boto3")
+    def test_init_table_handles(self, mock_boto3: MagicMock) -> None:
+        """Eager init should leave both table handles cached for the first request."""
+        dynamodb.init_table_handles()
+
+        assert dynamodb._questions_table is not None
+        assert dynamodb._responses_table is not None
+        dynamodb.get_questions_table()
+        assert mock_boto3.resource.return_value.Table.call_count == 2
+
+
+class TestBatchHelpers:
+    """Tests for batch_get_items."""
+
+    @patch("src.utils.dynamodb.time.sleep")
+    @patch("src.utils.dynamodb.get_dynamodb_client")
+    def test_get_chunks_and_retries(self, mock_get_client: MagicMock, mock_sleep: MagicMock) -> None:  # noqa: ARG002
+        """Reads should be chunked by 100 keys and unprocessed keys requested again."""
+        keys = [{"question_id": f"q_{i}"} for i in range(150)]
+        client = mock_get_client.return_value
+        client.batch_get_item.side_effect = [
+            {"Responses": {"aah-questions": [{"question_id": "q_0"}]}},
+            {
+                "Responses": {"aah-questions": [{"question_id": "q_100"}]},
+                "UnprocessedKeys": {"aah-questions": {"Keys": [{"question_id": "q_101"}]}},
+            },
+            {"Responses": {"aah-questions": [{"question_id": "q_101"}]}},
+        ]
+        table = MagicMock()
+        table.name = "aah-questions"
+
+        items = dynamodb.batch_get_items(table, keys)
+
+        assert items == [{"question_id": "q_0"}, {"question_id": "q_100"}, {"question_id": "q_101"}]
+        calls = client.batch_get_item.call_args_list
+        assert len(calls[0].kwargs["RequestItems"]["aah-questions"]["Keys"]) == 100
+        assert len(calls[1].kwargs["RequestItems"]["aah-questions"]["Keys"]) == 50
+
+
+def _cancelled(*codes: str) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": "TransactionCanceledException", "Message": "cancelled"},
+            "CancellationReasons": [{"Code": code} for code in codes],
+        },
+        "TransactWriteItems",
+    )
+
+
+class TestTransactPutItems:
+    """Tests for transact_put_items."""
+
+    @patch("src.utils.dynamodb.time.sleep")
+    @patch("src.utils.dynamodb.get_dynamodb_client")
+    def test_puts_in_one_transaction_and_retries_conflicts(
+        self,
+        mock_get_client: MagicMock,
+        mock_sleep: MagicMock,
+    ) -> None:
+        """All items should go into one transaction, resent after a conflict."""
+        client = mock_get_client.return_value
+        client.transact_write_items.side_effect = [_cancelled("None", "TransactionConflict"), {}]
+        table = MagicMock()
+        table.name = "aah-questions"
+
+        dynamodb.transact_put_items(table, [{"question_id": "q_0"}, {"question_id": "q_1"}])
+
+        assert client.transact_write_items.call_count == 2
+        assert client.transact_write_items.call_args.kwargs["TransactItems"] == [
+            {"Put": {"TableName": "aah-questions", "Item": {"question_id": "q_0"}}},
+            {"Put": {"TableName": "aah-questions", "Item": {"question_id": "q_1"}}},
+        ]
+        mock_sleep.assert_called_once_with(dynamodb.BATCH_BACKOFF_SECONDS)
+
+    @patch("src.utils.dynamodb.get_dynamodb_client")
+    def test_other_cancellations_raise(self, mock_get_client: MagicMock) -> None:
+        """A transaction cancelled for a non-transient reason should not be resent."""
+        client = mock_get_client.return_value
+        client.transact_write_items.side_effect = _cancelled("ValidationError")
+        table = MagicMock()
+
+        with pytest.raises(ClientError):
+            dynamodb.transact_put_items(table, [{"question_id": "q_0"}])
+
+        client.transact_write_items.assert_called_once()
+
+    def test_rejects_oversized_transactions(self) -> None:
+        """More items than one transaction holds should fail before any write."""
+        items = [{"question_id": f"q_{i}"} for i in range(dynamodb.TRANSACT_WRITE_SIZE + 1)]
+
+        with pytest.raises(ValueError, match="At most"):
+            dynamodb.transact_put_items(MagicMock(), items)
+
+
+class TestDeserializeItem:
+    """Tests for deserialize_item."""
+
+    def test_converts_decimals(self) -> None:
+        """Whole Decimals should become ints and fractional ones floats."""
+        from decimal import Decimal
+
+        item = {"count": Decimal(3), "score": Decimal("0.5"), "nested": {"n": Decimal(1)}, "tags": [Decimal(2)]}
+
+        assert dynamodb.deserialize_item(item) == {"count": 3, "score": 0.5, "nested": {"n": 1}, "tags": [2]}
+
+    def test_fields_projection(self) -> None:
+        """Only the requested fields present on the item should be returned."""
+        from decimal import Decimal
+
+        item = {"answer": "yes", "confidence": Decimal(4), "fingerprint_hash": "fp"}
+
+        result = dynamodb.deserialize_item(item, fields=("answer", "selected_option", "confidence"))
+
+        assert result == {"answer": "yes", "confidence": 4}
+
+    def test_nested_lists(self) -> None:
+        """Decimals inside nested lists should be converted too."""
+        from decimal import Decimal
+
+        assert dynamodb.deserialize_item({"grid": [[Decimal(1), Decimal("1.5")]]}) == {"grid": [[1, 1.5]]}
+
+    def test_string_lists_returned_as_is(self) -> None:
+        """String-only lists should be reused, while mixed lists are still converted."""
+        from decimal import Decimal
+
+        options = ["a", "b"]
+        result = dynamodb.deserialize_item({"options": options, "mixed": ["a", Decimal(1)]})
+
+        assert result["options"] is options
+        assert result["mixed"] == ["a", 1]
+
+    def test_whole_decimal_with_exponent(self) -> None:
+        """Whole Decimals written with a fractional exponent should still become ints."""
+        from decimal import Decimal
+
+        result = dynamodb.deserialize_item({"a": Decimal("5.0"), "b": Decimal("1E+2")})
+
+        assert result == {"a": 5, "b": 100}
+        assert isinstance(result["a"], int)
+
+    def test_passes_through_other_types(self) -> None:
+        """Strings, booleans, None and sets should be returned unchanged."""
+        item = {"s": "x", "b": True, "n": None, "ss": {"a", "b"}}
+
+        assert dynamodb.deserialize_item(item) == item
+
+    def test_deserialize_items(self) -> None:
+        """deserialize_items should convert every item and apply the field projection."""
+        from decimal import Decimal
+
+        items = [{"a": Decimal(1), "b": "x"}, {"a": Decimal(2)}]
+
+        assert dynamodb.deserialize_items(items, fields=iter(["a"])) == [{"a": 1}, {"a": 2}]
@@ -0,0 +1,30 @@
+"""Tests for API Gateway event accessors."""
+
+from src.utils.events import EMPTY_MAPPING, get_map, get_route
+from tests.conftest import make_get_event
+
+
+class TestEventAccessors:
+    """Tests for get_route/get_map."""
+
+    def test_get_route(self) -> None:
+        """Method and path should be read from the HTTP request context."""
+        event = make_get_event("/human/questions")
+
+        assert get_route(event) == ("GET", "/human/questions")
+
+    def test_get_route_without_http_context(self) -> None:
+        """Events without an HTTP context should yield empty strings."""
+        assert get_route({}) == ("", "")
+        assert get_route({"requestContext": None}) == ("", "")
+
+    def test_get_map_missing_or_null(self) -> None:
+        """Absent and null maps should both return the shared empty mapping."""
+        assert get_map({}, "headers") is EMPTY_MAPPING
+        assert get_map({"pathParameters": None}, "pathParameters") is EMPTY_MAPPING
+
+    def test_get_map_present(self) -> None:
+        """Present maps should be returned unchanged."""
+        event = make_get_event("/human/questions/q_1", path_params={"question_id": "q_1"})
+
+        assert get_map(event, "pathParameters") == {"question_id": "q_1"}
@@ -0,0 +1,39 @@
+"""Tests for JSON encoding helpers."""
+
+import pytest
+
+from src.utils import jsonio
+
+
+class TestJsonIO:
+    """Tests for loads/dumps."""
+
+    def test_round_trip(self) -> None:
+        """Encoded output should decode back to the original object."""
+        payload = {"question_id": "q_abc", "options": ["a", "b"], "count": 3, "closed": None}
+
+        assert jsonio.loads(jsonio.dumps(payload)) == payload
+
+    def test_dumps_is_compact_str(self) -> None:
+        """Encoding should return a str without insignificant whitespace."""
+        assert jsonio.dumps({"a": 1, "b": [1, 2]}) == '{"a":1,"b":[1,2]}'
+
+    def test_loads_accepts_bytes(self) -> None:
+        """Decoding should accept bytes as well as str."""
+        assert jsonio.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_invalid_json_raises(self) -> None:
+        """Invalid input should raise the exported JSONDecodeError."""
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads("not json")
+
+    def test_dumps_decimals(self) -> None:
+        """Decimals should encode as JSON numbers."""
+        from decimal import Decimal
+
+        assert jsonio.dumps({"n": Decimal(3), "x": Decimal("0.5")}) == '{"n":3,"x":0.5}'
+
+    def test_dumps_unsupported_type_raises(self) -> None:
+        """Values without a JSON representation should still raise TypeError."""
+        with pytest.raises(TypeError):
+            jsonio.dumps({"s": {1, 2}})
@@ -0,0 +1,45 @@
+"""Tests for the question read cache."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+from src.utils.question_cache import QuestionCache
+
+
+class TestQuestionCache:
+    """Tests for QuestionCache."""
+
+    @patch("src.utils.question_cache.time.monotonic")
+    def test_entry_served_until_ttl(self, mock_monotonic: MagicMock) -> None:
+        """Entries should be returned within the TTL and dropped once it has passed."""
+        cache: QuestionCache[str] = QuestionCache(ttl_seconds=2.0)
+        cache.put("q_a", "question", fetched_at=100.0)
+
+        mock_monotonic.return_value = 101.9
+        assert cache.get("q_a") == "question"
+        mock_monotonic.return_value = 102.0
+        assert cache.get("q_a") is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_evicted_on_overflow(self) -> None:
+        """The cache should stay bounded by evicting the least recently used entry."""
+        cache: QuestionCache[str] = QuestionCache(max_size=2)
+        now = time.monotonic()
+        cache.put("q_a", "a", fetched_at=now)
+        cache.put("q_b", "b", fetched_at=now)
+        cache.get("q_a")
+        cache.put("q_c", "c", fetched_at=now)
+
+        assert cache.keys() == ["q_a", "q_c"]
+
+    def test_invalidate_and_clear(self) -> None:
+        """Invalidated and cleared entries should no longer be served."""
+        cache: QuestionCache[str] = QuestionCache()
+        cache.put("q_a", "a", fetched_at=time.monotonic())
+        cache.put("q_b", "b", fetched_at=time.monotonic())
+
+        cache.invalidate("q_a")
+        cache.invalidate("q_missing")
+        assert cache.keys() == ["q_b"]
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,27 @@
+"""Tests for timestamp formatting."""
+
+from datetime import datetime, timezone
+
+from src.utils.timestamps import utc_isoformat
+
+
+class TestUtcIsoformat:
+    """Tests for utc_isoformat."""
+
+    def test_matches_datetime_isoformat(self) -> None:
+        """Output should match datetime.isoformat() for an aware UTC datetime."""
+        timestamp = 1767225600.123456
+
+        expected = datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+        assert utc_isoformat(timestamp) == expected
+
+    def test_whole_seconds_keep_fraction(self) -> None:
+        """Whole-second timestamps should still include microseconds."""
+        assert utc_isoformat(0) == "1970-01-01T00:00:00.000000+00:00"
+
+    def test_round_trips_through_fromisoformat(self) -> None:
+        """The output should parse back to the same instant."""
+        timestamp = 1767225600.5
+
+        assert datetime.fromisoformat(utc_isoformat(timestamp)).timestamp() == timestamp
@@ -8,23 +8,34 @@ This module contains the main agent logic, including:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
 import os
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from openai import OpenAI
-from rich.console import Console
+from openai import NOT_GIVEN, AsyncOpenAI, DefaultAsyncHttpxClient
+from rich.console import Console, Group, RenderableType
 from rich.live import Live
-from rich.panel import Panel
+from rich.markdown import Markdown
 from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 
-from ask_a_human import AskHumanClient, AskHumanOrchestrator
+from ask_a_human import AskHumanClient, AskHumanOrchestrator, QuestionResponse
 from ask_a_human.exceptions import AskHumanError
 
-from prompts import ANALYZE_BRIEF_PROMPT, GENERATE_CONTENT_PROMPT, GENERATE_HEADLINES_PROMPT
+from llm_cache import LLMCache
+from prompts import (
+    BRIEF_ANALYSIS_SCHEMA,
+    HEADLINES_SCHEMA,
+    analyze_brief_prompt,
+    generate_content_prompt,
+    generate_headlines_prompt,
+)
+
+OPENAI_KEY_PATH = Path(__file__).parent.parent.parent / "secrets" / "openai-api-key.txt"
 
 
 @dataclass
@@ -56,6 +67,11 @@ class ContentWriterAgent:
     3. Generate headline options with LLM
     4. Ask humans for headline preference
     5. Generate final content with LLM
+
+    While humans pick the tone, headlines for every tone option are
+    generated speculatively so the LLM round-trip overlaps the human wait,
+    and the headline question for the top-ranked tone is asked alongside
+    the tone question. It is only asked again if humans pick another tone.
     """
 
     def __init__(
@@ -64,6 +80,7 @@ class ContentWriterAgent:
         openai_api_key: str | None = None,
         ask_human_agent_id: str | None = None,
         ask_human_base_url: str | None = None,
+        llm_cache: LLMCache | None = None,
     ) -> None:
         """Initialize the agent.
 
@@ -72,12 +89,25 @@ class ContentWriterAgent:
             openai_api_key: OpenAI API key. Falls back to env var or secrets file.
             ask_human_agent_id: Agent ID for Ask-a-Human. Falls back to env var.
             ask_human_base_url: Base URL for Ask-a-Human API. Falls back to env var.
+            llm_cache: Cache for repeatable LLM calls. Opens the on-disk cache if not provided.
         """
         self.console = console or Console()
 
+        # Spinner shown while waiting on humans, reused across waits. Polls are
+        # seconds apart, so 2 refreshes per second is plenty.
+        self._progress = Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            console=self.console,
+            refresh_per_second=2,
+            transient=True,
+        )
+
         # Initialize OpenAI client
         api_key = openai_api_key or self._get_openai_key()
-        self.openai = OpenAI(api_key=api_key)
+        # HTTP/2 lets the parallel headline calls share one connection
+        self.openai = AsyncOpenAI(api_key=api_key, http_client=DefaultAsyncHttpxClient(http2=True))
+        self.llm_cache = llm_cache or LLMCache()
 
         # Initialize Ask-a-Human client
         self.ask_human = AskHumanClient(
@@ -90,51 +120,88 @@ class ContentWriterAgent:
             max_backoff=60.0,  # Max 1 minute between checks
         )
 
-    def _get_openai_key(self) -> str:
-        """Get OpenAI API key from env var or secrets file."""
+    @staticmethod
+    @functools.cache
+    def _get_openai_key() -> str:
+        """Get OpenAI API key from env var or secrets file, once per process."""
         # Try environment variable first
         if key := os.environ.get("OPENAI_API_KEY"):
             return key
 
         # Try secrets file
-        secrets_path = Path(__file__).parent.parent.parent / "secrets" / "openai-api-key.txt"
-        if secrets_path.exists():
-            return secrets_path.read_text().strip()
+        if OPENAI_KEY_PATH.exists():
+            return OPENAI_KEY_PATH.read_text().strip()
 
         raise ValueError(
             "OpenAI API key not found. Set OPENAI_API_KEY env var "
             "or create secrets/openai-api-key.txt"
         )
 
-    def _call_llm(self, prompt: str, parse_json: bool = False) -> str | dict[str, Any]:
+    async def _call_llm(
+        self, prompt: str, json_schema: dict[str, Any] | None = None, cache: bool = False
+    ) -> str | dict[str, Any]:
         """Call OpenAI with a prompt.
 
         Args:
             prompt: The prompt to send.
-            parse_json: Whether to parse the response as JSON.
+            json_schema: Structured output schema. When given, OpenAI is asked for
+                JSON matching it and the parsed object is returned.
+            cache: Whether the call may be served from and stored in the LLM cache.
+                Cached calls run at temperature 0 so a stored answer is a fair
+                stand-in for a fresh one.
 
         Returns:
-            The response text, or parsed JSON if parse_json=True.
+            The response text, or the parsed JSON object if json_schema is given.
         """
-        response = self.openai.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.7,
-        )
+        model = "gpt-4o-mini"
+        temperature = 0.0 if cache else 0.7
+
+        cached = self.llm_cache.get(model, temperature, prompt) if cache else None
+        if cached is None:
+            response = await self.openai.responses.create(
+                model=model,
+                input=prompt,
+                temperature=temperature,
+                text=(
+                    {"format": {"type": "json_schema", **json_schema}}
+                    if json_schema is not None
+                    else NOT_GIVEN
+                ),
+                store=False,
+            )
+            text = response.output_text
+        else:
+            text = cached
+
+        result: str | dict[str, Any] = json.loads(text) if json_schema is not None else text
+
+        # Stored only once parsing succeeded, so a malformed reply is retried next time
+        if cache and cached is None:
+            self.llm_cache.put(model, temperature, prompt, text)
 
-        text = response.choices[0].message.content or ""
+        return result
 
-        if parse_json:
-            # Extract JSON from response (handle markdown code blocks)
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-            return json.loads(text)
+    async def _stream_llm(self, prompt: str) -> AsyncIterator[str]:
+        """Call OpenAI with a prompt and yield the response text as it arrives.
+
+        Args:
+            prompt: The prompt to send.
 
-        return text
+        Yields:
+            Chunks of response text.
+        """
+        stream = await self.openai.responses.create(
+            model="gpt-4o-mini",
+            input=prompt,
+            temperature=0.7,
+            store=False,
+            stream=True,
+        )
+        async for event in stream:
+            if event.type == "response.output_text.delta":
+                yield event.delta
 
-    def analyze_brief(self, brief: str) -> BriefAnalysis:
+    async def analyze_brief(self, brief: str) -> BriefAnalysis:
         """Analyze a content brief using OpenAI.
 
         Args:
@@ -145,8 +212,8 @@ class ContentWriterAgent:
         """
         self.console.print("\n[bold blue]📋 Analyzing your brief...[/bold blue]")
 
-        prompt = ANALYZE_BRIEF_PROMPT.format(brief=brief)
-        result = self._call_llm(prompt, parse_json=True)
+        prompt = analyze_brief_prompt(brief)
+        result = await self._call_llm(prompt, json_schema=BRIEF_ANALYSIS_SCHEMA, cache=True)
 
         if isinstance(result, str):
             raise ValueError(f"Expected JSON response, got: {result}")
@@ -170,113 +237,177 @@ class ContentWriterAgent:
 
         return analysis
 
-    def ask_humans_for_tone(self, analysis: BriefAnalysis) -> str:
+    async def _submit_tone_question(self, analysis: BriefAnalysis) -> str:
         """Ask humans to choose the tone/style.
 
         Args:
             analysis: The brief analysis with tone options.
 
         Returns:
-            The selected tone.
+            The ID of the submitted question.
         """
         self.console.print("\n[bold blue]🧑 Asking humans about writing tone...[/bold blue]")
 
-        try:
-            # Submit the question
-            submission = self.orchestrator.submit(
-                prompt=(
-                    f"We're writing a {analysis.content_type} for {analysis.target_audience}. "
-                    f"Which tone/style would be most effective?"
-                ),
-                type="multiple_choice",
-                options=analysis.tone_options,
-                audience=["creative", "product"],
-                min_responses=3,
-                timeout_seconds=600,  # 10 minutes
-            )
+        submission = await asyncio.to_thread(
+            self.orchestrator.submit,
+            prompt=(
+                f"We're writing a {analysis.content_type} for {analysis.target_audience}. "
+                f"Which tone/style would be most effective?"
+            ),
+            type="multiple_choice",
+            options=analysis.tone_options,
+            audience=["creative", "product"],
+            min_responses=3,
+            timeout_seconds=600,  # 10 minutes
+        )
 
-            self.console.print(f"   Question ID: {submission.question_id}")
+        self.console.print(f"   Question ID: {submission.question_id}")
+        return submission.question_id
 
-            # Wait for responses with progress display
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                task = progress.add_task("Waiting for human responses...", total=None)
+    async def _submit_headline_question(self, headlines: list[str]) -> str:
+        """Ask humans to choose the headline.
 
-                responses = self.orchestrator.await_responses(
-                    [submission.question_id],
+        Args:
+            headlines: List of headline options.
+
+        Returns:
+            The ID of the submitted question.
+        """
+        self.console.print("\n[bold blue]🧑 Asking humans about headline preference...[/bold blue]")
+
+        submission = await asyncio.to_thread(
+            self.orchestrator.submit,
+            prompt="Which headline is most compelling and would make you want to read more?",
+            type="multiple_choice",
+            options=headlines,
+            audience=["creative", "product"],
+            min_responses=3,
+            timeout_seconds=600,
+        )
+
+        self.console.print(f"   Question ID: {submission.question_id}")
+        return submission.question_id
+
+    async def _await_humans(self, question_ids: list[str]) -> dict[str, QuestionResponse]:
+        """Wait for at least one response to each question, with progress display.
+
+        Args:
+            question_ids: IDs of the questions to wait for.
+
+        Returns:
+            Dictionary mapping question_id to its latest QuestionResponse.
+        """
+        with self._progress:
+            task = self._progress.add_task("Waiting for human responses...", total=None)
+            try:
+                return await self.orchestrator.await_responses_async(
+                    question_ids,
                     min_responses=1,  # Accept at least 1 response
                     timeout=300,  # Wait up to 5 minutes
                 )
+            finally:
+                self._progress.remove_task(task)
 
-            question = responses[submission.question_id]
-
-            # Count votes for each option
-            if question.summary:
-                # Find the winning option
-                winner = max(question.summary.items(), key=lambda x: x[1])
-                selected_tone = winner[0]
-            elif question.responses:
-                # Fall back to first response
-                first_response = question.responses[0]
-                if first_response.selected_option is not None:
-                    selected_tone = analysis.tone_options[first_response.selected_option]
-                else:
-                    selected_tone = analysis.tone_options[0]
-            else:
-                # No responses, use default
-                self.console.print(
-                    "[yellow]⚠[/yellow] No human responses received, using default tone"
-                )
-                selected_tone = analysis.tone_options[0]
+    def _select_tone(self, question: QuestionResponse, analysis: BriefAnalysis) -> str:
+        """Pick the tone the humans voted for.
 
-            self.console.print(f'[green]✓[/green] Tone preference received: "{selected_tone}"')
-            return selected_tone
+        Args:
+            question: The answered tone question.
+            analysis: The brief analysis with tone options.
 
-        except AskHumanError as e:
-            self.console.print(f"[yellow]⚠[/yellow] Ask-a-Human error: {e}")
-            self.console.print("   Using default tone")
-            return analysis.tone_options[0]
+        Returns:
+            The selected tone, or the first option if nobody answered.
+        """
+        lines: list[RenderableType] = []
+        selected_tone = _winning_option(question, analysis.tone_options)
+        if selected_tone is None:
+            lines.append("[yellow]⚠[/yellow] No human responses received, using default tone")
+            selected_tone = analysis.tone_options[0]
 
-    def generate_headlines(self, brief: str, analysis: BriefAnalysis, tone: str) -> list[str]:
-        """Generate headline options using OpenAI.
+        lines.append(f'[green]✓[/green] Tone preference received: "{selected_tone}"')
+        self.console.print(Group(*lines))
+        return selected_tone
+
+    def _select_headline(self, question: QuestionResponse, headlines: list[str]) -> str:
+        """Pick the headline the humans voted for.
+
+        Args:
+            question: The answered headline question.
+            headlines: List of headline options.
+
+        Returns:
+            The selected headline, or the first option if nobody answered.
+        """
+        lines: list[RenderableType] = []
+        selected_headline = _winning_option(question, headlines)
+        if selected_headline is None:
+            lines.append("[yellow]⚠[/yellow] No human responses received, using first headline")
+            selected_headline = headlines[0]
+
+        lines.append(f'[green]✓[/green] Headline selected: "{selected_headline}"')
+        self.console.print(Group(*lines))
+        return selected_headline
+
+    async def _headline_options(self, brief: str, analysis: BriefAnalysis, tone: str) -> list[str]:
+        """Ask OpenAI for headline options without printing progress.
 
         Args:
             brief: The original content brief.
             analysis: The brief analysis.
-            tone: The selected tone.
+            tone: The tone to write the headlines in.
 
         Returns:
             List of headline options.
         """
-        self.console.print("\n[bold blue]💡 Generating headline options...[/bold blue]")
-
-        prompt = GENERATE_HEADLINES_PROMPT.format(
+        prompt = generate_headlines_prompt(
             brief=brief,
             tone=tone,
             content_type=analysis.content_type,
             target_audience=analysis.target_audience,
         )
 
-        result = self._call_llm(prompt, parse_json=True)
+        result = await self._call_llm(prompt, json_schema=HEADLINES_SCHEMA, cache=True)
 
         if isinstance(result, str):
             raise ValueError(f"Expected JSON response, got: {result}")
 
-        headlines = result.get("headlines", [
+        return result.get("headlines", [
             "Compelling Headline Option 1",
             "Engaging Headline Option 2",
             "Powerful Headline Option 3",
             "Creative Headline Option 4",
         ])
 
+    async def generate_headlines(
+        self,
+        brief: str,
+        analysis: BriefAnalysis,
+        tone: str,
+        prefetched: asyncio.Task[list[str]] | None = None,
+    ) -> list[str]:
+        """Generate headline options using OpenAI.
+
+        Args:
+            brief: The original content brief.
+            analysis: The brief analysis.
+            tone: The selected tone.
+            prefetched: A task already generating headlines for this tone, if any.
+
+        Returns:
+            List of headline options.
+        """
+        self.console.print("\n[bold blue]💡 Generating headline options...[/bold blue]")
+
+        if prefetched is not None:
+            headlines = await prefetched
+        else:
+            headlines = await self._headline_options(brief, analysis, tone)
+
         self.console.print(f"[green]✓[/green] Generated {len(headlines)} headline options")
         return headlines
 
-    def ask_humans_for_headline(self, headlines: list[str]) -> str:
-        """Ask humans to choose the headline.
+    async def ask_humans_for_headline(self, headlines: list[str]) -> str:
+        """Ask humans to choose the headline and wait for their vote.
 
         Args:
             headlines: List of headline options.
@@ -284,62 +415,21 @@ class ContentWriterAgent:
         Returns:
             The selected headline.
         """
-        self.console.print("\n[bold blue]🧑 Asking humans about headline preference...[/bold blue]")
-
         try:
-            # Submit the question
-            submission = self.orchestrator.submit(
-                prompt="Which headline is most compelling and would make you want to read more?",
-                type="multiple_choice",
-                options=headlines,
-                audience=["creative", "product"],
-                min_responses=3,
-                timeout_seconds=600,
-            )
-
-            self.console.print(f"   Question ID: {submission.question_id}")
-
-            # Wait for responses
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[progress.description]{task.description}"),
-                console=self.console,
-            ) as progress:
-                task = progress.add_task("Waiting for human responses...", total=None)
-
-                responses = self.orchestrator.await_responses(
-                    [submission.question_id],
-                    min_responses=1,
-                    timeout=300,
-                )
-
-            question = responses[submission.question_id]
-
-            # Count votes
-            if question.summary:
-                winner = max(question.summary.items(), key=lambda x: x[1])
-                selected_headline = winner[0]
-            elif question.responses:
-                first_response = question.responses[0]
-                if first_response.selected_option is not None:
-                    selected_headline = headlines[first_response.selected_option]
-                else:
-                    selected_headline = headlines[0]
-            else:
-                self.console.print(
-                    "[yellow]⚠[/yellow] No human responses received, using first headline"
-                )
-                selected_headline = headlines[0]
-
-            self.console.print(f'[green]✓[/green] Headline selected: "{selected_headline}"')
-            return selected_headline
-
+            question_id = await self._submit_headline_question(headlines)
+            responses = await self._await_humans([question_id])
         except AskHumanError as e:
-            self.console.print(f"[yellow]⚠[/yellow] Ask-a-Human error: {e}")
-            self.console.print("   Using first headline option")
+            self.console.print(
+                Group(
+                    f"[yellow]⚠[/yellow] Ask-a-Human error: {e}",
+                    "   Using first headline option",
+                )
+            )
             return headlines[0]
 
-    def generate_content(
+        return self._select_headline(responses[question_id], headlines)
+
+    async def generate_content(
         self, brief: str, analysis: BriefAnalysis, tone: str, headline: str
     ) -> str:
         """Generate the final content using OpenAI.
@@ -355,7 +445,7 @@ class ContentWriterAgent:
         """
         self.console.print("\n[bold blue]📝 Generating final content...[/bold blue]")
 
-        prompt = GENERATE_CONTENT_PROMPT.format(
+        prompt = generate_content_prompt(
             brief=brief,
             content_type=analysis.content_type,
             target_audience=analysis.target_audience,
@@ -364,15 +454,17 @@ class ContentWriterAgent:
             key_points="\n".join(f"- {point}" for point in analysis.key_points),
         )
 
-        content = self._call_llm(prompt, parse_json=False)
-
-        if not isinstance(content, str):
-            content = str(content)
+        # Show the article as it is written; main prints the finished version
+        content = ""
+        with Live(Markdown(content), console=self.console, transient=True) as live:
+            async for delta in self._stream_llm(prompt):
+                content += delta
+                live.update(Markdown(content))
 
         self.console.print("[green]✓[/green] Content generated")
         return content
 
-    def run(self, brief: str) -> ContentResult:
+    async def run(self, brief: str) -> ContentResult:
         """Run the full content writing workflow.
 
         Args:
@@ -382,19 +474,55 @@ class ContentWriterAgent:
             ContentResult with the generated content and metadata.
         """
         # Step 1: Analyze the brief
-        analysis = self.analyze_brief(brief)
-
-        # Step 2: Ask humans for tone (HUMAN DECISION POINT 1)
-        tone = self.ask_humans_for_tone(analysis)
-
-        # Step 3: Generate headline options
-        headlines = self.generate_headlines(brief, analysis, tone)
-
-        # Step 4: Ask humans for headline (HUMAN DECISION POINT 2)
-        headline = self.ask_humans_for_headline(headlines)
+        analysis = await self.analyze_brief(brief)
+
+        # Start on headlines for every tone option while the humans decide
+        speculative = {
+            option: asyncio.create_task(self._headline_options(brief, analysis, option))
+            for option in analysis.tone_options
+        }
+
+        # Steps 2-4 (HUMAN DECISION POINTS): ask for the tone and, betting on the
+        # top-ranked tone, for its headline at the same time, then wait for both
+        tone_guess = analysis.tone_options[0]
+        headlines: list[str] | None = None
+        try:
+            try:
+                tone_id = await self._submit_tone_question(analysis)
+                headlines = await self.generate_headlines(
+                    brief, analysis, tone_guess, speculative[tone_guess]
+                )
+                headline_id = await self._submit_headline_question(headlines)
+                responses = await self._await_humans([tone_id, headline_id])
+            except AskHumanError as e:
+                self.console.print(
+                    Group(
+                        f"[yellow]⚠[/yellow] Ask-a-Human error: {e}",
+                        "   Using default tone and first headline option",
+                    )
+                )
+                tone = tone_guess
+                if headlines is None:
+                    headlines = await self.generate_headlines(
+                        brief, analysis, tone, speculative[tone]
+                    )
+                headline = headlines[0]
+            else:
+                tone = self._select_tone(responses[tone_id], analysis)
+                if tone == tone_guess:
+                    headline = self._select_headline(responses[headline_id], headlines)
+                else:
+                    # The bet lost: ask again with headlines for the chosen tone
+                    headlines = await self.generate_headlines(
+                        brief, analysis, tone, speculative.get(tone)
+                    )
+                    headline = await self.ask_humans_for_headline(headlines)
+        finally:
+            for task in speculative.values():
+                _discard(task)
 
         # Step 5: Generate final content
-        content = self.generate_content(brief, analysis, tone, headline)
+        content = await self.generate_content(brief, analysis, tone, headline)
 
         return ContentResult(
             headline=headline,
@@ -403,6 +531,34 @@ class ContentWriterAgent:
             brief_analysis=analysis,
         )
 
-    def close(self) -> None:
+    async def close(self) -> None:
         """Clean up resources."""
         self.ask_human.close()
+        await self.openai.close()
+        self.llm_cache.close()
+
+
+def _winning_option(question: QuestionResponse, options: list[str]) -> str | None:
+    """Return the option with the most votes, or None if nobody answered."""
+    if question.summary:
+        return max(question.summary, key=question.summary.__getitem__)
+    if question.responses:
+        # Fall back to first response
+        first_response = question.responses[0]
+        if first_response.selected_option is not None:
+            return options[first_response.selected_option]
+        return options[0]
+    return None
+
+
+def _discard(task: asyncio.Task[Any]) -> None:
+    """Cancel a speculative task whose result is no longer needed.
+
+    A task that already failed has its exception marked as retrieved, so
+    asyncio does not log it when the task is garbage collected.
+    """
+    if task.done():
+        if not task.cancelled():
+            task.exception()
+    else:
+        task.cancel()
@@ -0,0 +1,60 @@
+"""On-disk cache for LLM responses.
+
+Demo users often retry the same brief, so responses for prompts sent at
+temperature 0 are stored in a small SQLite database and reused instead of
+calling OpenAI again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+
+
+def default_cache_path() -> Path:
+    """Return the cache location, honoring XDG_CACHE_HOME."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "content-writer" / "llm.sqlite"
+
+
+class LLMCache:
+    """Exact-match cache of LLM responses keyed by model, temperature and prompt."""
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Open (and create if needed) the cache database.
+
+        Args:
+            path: Database file. Defaults to default_cache_path().
+        """
+        self.path = path or default_cache_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, text TEXT NOT NULL)"
+        )
+
+    @staticmethod
+    def _key(model: str, temperature: float, prompt: str) -> str:
+        """Hash the request parameters into a cache key."""
+        return hashlib.sha256(f"{model}\0{temperature}\0{prompt}".encode()).hexdigest()
+
+    def get(self, model: str, temperature: float, prompt: str) -> str | None:
+        """Return the cached response text, or None on a miss."""
+        row = self._db.execute(
+            "SELECT text FROM responses WHERE key = ?", (self._key(model, temperature, prompt),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, model: str, temperature: float, prompt: str, text: str) -> None:
+        """Store a response text, replacing any previous entry."""
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, text) VALUES (?, ?)",
+                (self._key(model, temperature, prompt), text),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._db.close()
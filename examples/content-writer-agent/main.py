@@ -8,15 +8,19 @@ Usage:
     python main.py
 """
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
+import asyncio
+
+from rich.console import Console, Group
 
 from agent import ContentWriterAgent
 
 
 def main() -> None:
     """Run the Content Writer Agent CLI."""
+    # Only needed for the banner, so importing this module doesn't pay for them
+    from rich.panel import Panel
+    from rich.text import Text
+
     console = Console()
 
     # Display welcome banner
@@ -40,6 +44,10 @@ def main() -> None:
         console.print(f"[red]Error:[/red] {e}")
         return
 
+    # One event loop for the whole session so the agent's async HTTP
+    # connections stay usable between briefs.
+    runner = asyncio.Runner()
+
     try:
         while True:
             # Get content brief from user
@@ -63,22 +71,25 @@ def main() -> None:
 
             # Run the agent
             try:
-                result = agent.run(brief)
+                result = runner.run(agent.run(brief))
 
-                # Display the result
-                console.print()
-                console.print("=" * 65)
+                # Display the result in one render
+                rule = "=" * 65
                 console.print(
-                    "[bold green]FINAL CONTENT[/bold green]".center(65),
+                    Group(
+                        "",
+                        rule,
+                        "[bold green]FINAL CONTENT[/bold green]".center(65),
+                        rule,
+                        "",
+                        f"[dim]Tone:[/dim] {result.tone}",
+                        "",
+                        result.content,
+                        "",
+                        rule,
+                        "",
+                    )
                 )
-                console.print("=" * 65)
-                console.print()
-                console.print(f"[dim]Tone:[/dim] {result.tone}")
-                console.print()
-                console.print(result.content)
-                console.print()
-                console.print("=" * 65)
-                console.print()
 
             except Exception as e:
                 console.print(f"\n[red]Error during content generation:[/red] {e}")
@@ -88,7 +99,8 @@ def main() -> None:
         console.print("\n\n[dim]Interrupted. Goodbye![/dim]")
 
     finally:
-        agent.close()
+        runner.run(agent.close())
+        runner.close()
 
 
 if __name__ == "__main__":
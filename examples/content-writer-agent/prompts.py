@@ -1,6 +1,12 @@
-"""LLM prompt templates for the Content Writer Agent."""
+"""LLM prompt templates and structured output schemas for the Content Writer Agent.
 
-ANALYZE_BRIEF_PROMPT = """You are a content strategist analyzing a content brief.
+Templates use string.Template so the JSON examples need no brace escaping;
+they are parsed once at import and filled in by the *_prompt() functions.
+"""
+
+from string import Template
+
+_ANALYZE_BRIEF_TEMPLATE = Template("""You are a content strategist analyzing a content brief.
 
 Given the following content brief, analyze it and provide:
 1. A summary of the content type (blog post, landing page, email, etc.)
@@ -9,10 +15,10 @@ Given the following content brief, analyze it and provide:
 4. 4 tone/style options that would be appropriate
 
 Content Brief:
-{brief}
+$brief
 
 Respond in JSON format:
-{{
+{
     "content_type": "string",
     "target_audience": "string",
     "key_points": ["string", "string", ...],
@@ -22,43 +28,43 @@ Respond in JSON format:
         "Urgent and persuasive",
         "Informative and neutral"
     ]
-}}
-"""
+}
+""")
 
-GENERATE_HEADLINES_PROMPT = """You are a copywriter generating headline options.
+_GENERATE_HEADLINES_TEMPLATE = Template("""You are a copywriter generating headline options.
 
 Given the following content brief and selected tone, generate 4 compelling headline options.
 
 Content Brief:
-{brief}
+$brief
 
-Selected Tone: {tone}
-Content Type: {content_type}
-Target Audience: {target_audience}
+Selected Tone: $tone
+Content Type: $content_type
+Target Audience: $target_audience
 
 Respond in JSON format:
-{{
+{
     "headlines": [
         "Headline option 1",
         "Headline option 2",
         "Headline option 3",
         "Headline option 4"
     ]
-}}
-"""
+}
+""")
 
-GENERATE_CONTENT_PROMPT = """You are a skilled content writer.
+_GENERATE_CONTENT_TEMPLATE = Template("""You are a skilled content writer.
 
 Write the content based on the following specifications:
 
 Content Brief:
-{brief}
+$brief
 
-Content Type: {content_type}
-Target Audience: {target_audience}
-Tone/Style: {tone}
-Headline: {headline}
-Key Points to Cover: {key_points}
+Content Type: $content_type
+Target Audience: $target_audience
+Tone/Style: $tone
+Headline: $headline
+Key Points to Cover: $key_points
 
 Write engaging, well-structured content that:
 - Uses the specified tone throughout
@@ -68,4 +74,68 @@ Write engaging, well-structured content that:
 - Is well-formatted with proper headings, paragraphs, etc.
 
 Write the content now:
-"""
+""")
+
+
+def analyze_brief_prompt(brief: str) -> str:
+    """Build the prompt that analyzes a content brief."""
+    return _ANALYZE_BRIEF_TEMPLATE.substitute(brief=brief)
+
+
+def generate_headlines_prompt(
+    brief: str, tone: str, content_type: str, target_audience: str
+) -> str:
+    """Build the prompt that generates headline options for a tone."""
+    return _GENERATE_HEADLINES_TEMPLATE.substitute(
+        brief=brief,
+        tone=tone,
+        content_type=content_type,
+        target_audience=target_audience,
+    )
+
+
+def generate_content_prompt(
+    brief: str, content_type: str, target_audience: str, tone: str, headline: str, key_points: str
+) -> str:
+    """Build the prompt that writes the final content."""
+    return _GENERATE_CONTENT_TEMPLATE.substitute(
+        brief=brief,
+        content_type=content_type,
+        target_audience=target_audience,
+        tone=tone,
+        headline=headline,
+        key_points=key_points,
+    )
+
+
+# Structured output schemas for the JSON prompts above. Strict mode makes
+# OpenAI return exactly these fields, so replies can be passed to json.loads.
+
+BRIEF_ANALYSIS_SCHEMA = {
+    "name": "brief_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "content_type": {"type": "string"},
+            "target_audience": {"type": "string"},
+            "key_points": {"type": "array", "items": {"type": "string"}},
+            "tone_options": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["content_type", "target_audience", "key_points", "tone_options"],
+        "additionalProperties": False,
+    },
+}
+
+HEADLINES_SCHEMA = {
+    "name": "headlines",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "headlines": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["headlines"],
+        "additionalProperties": False,
+    },
+}
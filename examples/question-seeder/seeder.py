@@ -11,20 +11,22 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import asyncio
+import contextlib
 import random
-import sys
 import time
+from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from itertools import islice
 from typing import Any
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
-from rich.text import Text
 
-from ask_a_human import AskHumanClient
+from ask_a_human import AskHumanClient, QuestionRequest, QuestionResponse
+from ask_a_human.client import MAX_POLL_IDS, MAX_SUBMIT_BATCH
 from ask_a_human.exceptions import AskHumanError
 
 # Question templates organized by category
@@ -219,17 +221,74 @@ QUESTION_TEMPLATES = {
     ],
 }
 
+# Caps on what a long-running seed keeps in memory
+MAX_INSIGHTS = 500
+MAX_CLOSED_QUESTIONS = 1000
 
-@dataclass
+# Open questions are polled this many times per submission interval, but no
+# more often than every MIN_POLL_SECONDS, so short intervals don't flood the API
+POLLS_PER_INTERVAL = 4
+MIN_POLL_SECONDS = 2.0
+
+# With intervals shorter than this, questions due within it are submitted in one batched request
+SUBMIT_FLUSH_SECONDS = 0.5
+
+# Seconds each seeded question stays open for responses
+QUESTION_TIMEOUT_SECONDS = 3600
+
+# Statuses after which a question gets no more responses
+_FINISHED_STATUSES = ("CLOSED", "EXPIRED")
+
+TemplateKey = tuple[str, str, tuple[str, ...]]
+
+
+def poll_seconds(interval: float) -> float:
+    """Return the seconds between polls for a submission interval."""
+    return max(interval / POLLS_PER_INTERVAL, MIN_POLL_SECONDS)
+
+
+def template_key(template: dict[str, Any]) -> TemplateKey:
+    """Return the content key identifying a question template."""
+    return template["prompt"], template["type"], tuple(template.get("options") or ())
+
+
+# Every distinct (category, template) pair. Each template is equally likely to
+# be picked, whatever the size of its category.
+_ALL_QUESTIONS = tuple(
+    {
+        template_key(question): (category, question)
+        for category, questions in QUESTION_TEMPLATES.items()
+        for question in questions
+    }.values()
+)
+
+
+@dataclass(slots=True)
 class TrackedQuestion:
-    """A question being tracked for responses."""
+    """A question being tracked for responses.
+
+    Uses slots, as a long-running seed keeps thousands of these around.
+    """
 
     question_id: str
     prompt: str
     category: str
-    submitted_at: datetime
+    # Monotonic clock reading; only meaningful relative to other readings
+    submitted_at_ns: int = field(default_factory=time.monotonic_ns)
     responses: list[dict[str, Any]] = field(default_factory=list)
+    # Number of entries in responses, kept in step as responses are appended
+    response_count: int = 0
     status: str = "OPEN"
+    # Truncated prompt for display, computed once
+    prompt_short: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.prompt_short = self.prompt[:50]
+
+    @property
+    def age_seconds(self) -> float:
+        """Seconds since the question was submitted."""
+        return (time.monotonic_ns() - self.submitted_at_ns) / 1e9
 
 
 class QuestionSeeder:
@@ -242,88 +301,199 @@ class QuestionSeeder:
         base_url: str | None = None,
     ) -> None:
         self.console = console or Console()
+        # Shared by every submit and poll, including the concurrent poll batches
         self.client = AskHumanClient(
             agent_id=agent_id or "question-seeder",
             base_url=base_url,
         )
-        self.tracked_questions: list[TrackedQuestion] = []
+        # Only open questions are polled; finished ones move to a bounded archive
+        self.open_questions: list[TrackedQuestion] = []
+        self.closed_questions: deque[TrackedQuestion] = deque(maxlen=MAX_CLOSED_QUESTIONS)
         self.total_submitted = 0
         self.total_responses = 0
-        self.insights: list[str] = []
+        self.total_insights = 0
+        self.insights: deque[str] = deque(maxlen=MAX_INSIGHTS)
+        # Templates free to submit, in random order. A template is taken out
+        # while its question is open and put back at the end once it finishes,
+        # so humans are never asked the same thing twice at once.
+        self._available: deque[tuple[str, dict[str, Any]]] = deque(
+            random.sample(_ALL_QUESTIONS, len(_ALL_QUESTIONS))
+        )
+        # Template of each open question, by question ID
+        self._in_use: dict[str, tuple[str, dict[str, Any]]] = {}
+        # Last rendered status table and insights panel, reused while their inputs are unchanged
+        self._status_key: tuple[int, int, int, int] | None = None
+        self._status_table: Table | None = None
+        self._insights_key: int | None = None
+        self._insights_panel: Panel | None = None
 
-    def pick_question(self) -> tuple[str, dict[str, Any]]:
-        """Pick a random question from the templates."""
-        category = random.choice(list(QUESTION_TEMPLATES.keys()))
-        question = random.choice(QUESTION_TEMPLATES[category])
-        return category, question
+    @property
+    def templates_available(self) -> int:
+        """Number of templates not currently asked by an open question."""
+        return len(self._available)
 
-    def submit_question(self) -> TrackedQuestion | None:
-        """Submit a new question and track it."""
-        category, template = self.pick_question()
+    async def submit_questions(self, count: int = 1) -> list[TrackedQuestion]:
+        """Submit new questions in one batched request and track them.
 
-        try:
-            result = self.client.submit_question(
+        Only the blocking API call runs in a worker thread; the questions are
+        tracked on the event loop, so check_responses never sees
+        open_questions change under it.
+
+        Questions are taken from the templates no open question is asking, so
+        fewer than count are submitted when fewer templates are available.
+
+        Args:
+            count: Number of questions to submit.
+
+        Returns:
+            The tracked questions, or an empty list if nothing was submitted.
+        """
+        picks = [self._available.popleft() for _ in range(min(count, len(self._available)))]
+        if not picks:
+            return []
+
+        requests = [
+            QuestionRequest(
                 prompt=template["prompt"],
                 type=template["type"],
                 options=template.get("options"),
                 audience=["general", "product", "creative"],
                 min_responses=3,
-                timeout_seconds=3600,
+                timeout_seconds=QUESTION_TIMEOUT_SECONDS,
             )
+            for _, template in picks
+        ]
+        try:
+            results = await asyncio.to_thread(self.client.submit_questions, requests)
+        except AskHumanError as e:
+            self.console.print(f"[red]Error submitting question:[/red] {e}")
+            # Nothing was created, so the templates go back to be tried first next time
+            self._available.extendleft(reversed(picks))
+            return []
 
-            tracked = TrackedQuestion(
+        submitted_at_ns = time.monotonic_ns()
+        submitted = [
+            TrackedQuestion(
                 question_id=result.question_id,
                 prompt=template["prompt"],
                 category=category,
-                submitted_at=datetime.now(),
+                submitted_at_ns=submitted_at_ns,
             )
-            self.tracked_questions.append(tracked)
-            self.total_submitted += 1
-
-            return tracked
-
-        except AskHumanError as e:
-            self.console.print(f"[red]Error submitting question:[/red] {e}")
-            return None
-
-    def check_responses(self) -> list[tuple[TrackedQuestion, int]]:
-        """Check for new responses on all tracked questions."""
+            for result, (category, template) in zip(results, picks, strict=True)
+        ]
+        for result, pick in zip(results, picks, strict=True):
+            self._in_use[result.question_id] = pick
+        self.open_questions.extend(submitted)
+        self.total_submitted += len(submitted)
+
+        return submitted
+
+    async def check_responses(self) -> list[tuple[TrackedQuestion, int]]:
+        """Check for new responses on all open questions.
+
+        Open questions are polled with batched requests of up to
+        MAX_POLL_IDS questions, and the batches are sent concurrently, so a
+        tick takes about one round-trip however many questions are open.
+        Questions that have closed, or are older than their timeout, are moved
+        to closed_questions. Questions the server no longer returns (deleted
+        after expiry) are dropped. Either way their templates become available
+        to submit again.
+        """
         updates = []
 
-        for tracked in self.tracked_questions:
-            if tracked.status == "CLOSED":
-                continue
+        open_ids = [tracked.question_id for tracked in self.open_questions]
+        batches = [
+            open_ids[start : start + MAX_POLL_IDS]
+            for start in range(0, len(open_ids), MAX_POLL_IDS)
+        ]
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self.client.get_questions, batch) for batch in batches),
+            return_exceptions=True,
+        )
 
-            try:
-                response = self.client.get_question(tracked.question_id)
-                new_count = len(response.responses) - len(tracked.responses)
+        responses: dict[str, QuestionResponse] = {}
+        # IDs whose batch was answered; one missing from responses no longer exists
+        polled_ids: set[str] = set()
+        for batch, result in zip(batches, results, strict=True):
+            if isinstance(result, AskHumanError):
+                continue  # Silently continue on errors
+            if isinstance(result, BaseException):
+                raise result
+            responses.update(result)
+            polled_ids.update(batch)
+
+        # Walk backwards so a finished question can be swap-popped out in O(1)
+        open_questions = self.open_questions
+        for index in range(len(open_questions) - 1, -1, -1):
+            tracked = open_questions[index]
+            response = responses.get(tracked.question_id)
+            if response is None:
+                if tracked.question_id in polled_ids:
+                    self._release(index)
+                continue
 
-                if new_count > 0:
-                    # Store new responses
-                    tracked.responses = [
-                        {
-                            "answer": r.answer,
-                            "selected_option": r.selected_option,
-                        }
-                        for r in response.responses
-                    ]
-                    self.total_responses += new_count
-                    updates.append((tracked, new_count))
+            new_count = len(response.responses) - tracked.response_count
+
+            if new_count > 0:
+                # Store new responses, truncating answers for display once here
+                tracked.responses.extend(
+                    {
+                        "answer": r.answer,
+                        "answer_short": r.answer[:80] if r.answer else None,
+                        "selected_option": r.selected_option,
+                    }
+                    for r in response.responses[-new_count:]
+                )
+                tracked.response_count += new_count
+                self.total_responses += new_count
+                updates.append((tracked, new_count))
+
+                # Extract insights from text responses
+                for r in response.responses[-new_count:]:
+                    if r.answer and len(r.answer) > 20:
+                        self.insights.append(f"[{tracked.category}] {r.answer[:100]}...")
+                        self.total_insights += 1
+
+            tracked.status = response.status
+            # The server never marks questions EXPIRED, so go by the question's age
+            expired = tracked.age_seconds >= QUESTION_TIMEOUT_SECONDS
+            if expired and tracked.status not in _FINISHED_STATUSES:
+                tracked.status = "EXPIRED"
+            if tracked.status in _FINISHED_STATUSES:
+                self._release(index)
+                self.closed_questions.append(tracked)
 
-                    # Extract insights from text responses
-                    for r in response.responses[-new_count:]:
-                        if r.answer and len(r.answer) > 20:
-                            self.insights.append(f"[{tracked.category}] {r.answer[:100]}...")
+        return updates
 
-                tracked.status = response.status
+    def _release(self, index: int) -> None:
+        """Stop tracking an open question and make its template available again.
 
-            except AskHumanError:
-                pass  # Silently continue on errors
+        The question is swap-popped out of open_questions, so callers walking
+        the list must go backwards.
 
-        return updates
+        Args:
+            index: Position of the question in open_questions.
+        """
+        open_questions = self.open_questions
+        tracked = open_questions[index]
+        open_questions[index] = open_questions[-1]
+        open_questions.pop()
+        self._available.append(self._in_use.pop(tracked.question_id))
 
     def build_status_display(self) -> Table:
-        """Build a rich table showing current status."""
+        """Build a rich table showing current status.
+
+        The table is rebuilt only when one of its counters has changed.
+        """
+        key = (
+            self.total_submitted,
+            self.total_responses,
+            len(self.open_questions),
+            self.total_insights,
+        )
+        if key == self._status_key and self._status_table is not None:
+            return self._status_table
+
         table = Table(title="Question Seeder Status", expand=True)
 
         table.add_column("Metric", style="cyan")
@@ -331,9 +501,11 @@ class QuestionSeeder:
 
         table.add_row("Questions Submitted", str(self.total_submitted))
         table.add_row("Total Responses", str(self.total_responses))
-        table.add_row("Active Questions", str(sum(1 for q in self.tracked_questions if q.status == "OPEN")))
-        table.add_row("Insights Collected", str(len(self.insights)))
+        table.add_row("Active Questions", str(len(self.open_questions)))
+        table.add_row("Insights Collected", str(self.total_insights))
 
+        self._status_key = key
+        self._status_table = table
         return table
 
     def build_recent_activity(self, updates: list[tuple[TrackedQuestion, int]]) -> Panel | None:
@@ -343,21 +515,41 @@ class QuestionSeeder:
 
         lines = []
         for tracked, count in updates[-5:]:
-            lines.append(f"[green]+{count}[/green] response(s): {tracked.prompt[:50]}...")
+            lines.append(f"[green]+{count}[/green] response(s): {tracked.prompt_short}...")
 
         return Panel("\n".join(lines), title="Recent Responses", border_style="green")
 
     def build_insights_panel(self) -> Panel | None:
-        """Build a panel showing recent insights."""
+        """Build a panel showing recent insights.
+
+        The panel is rebuilt only when a new insight has arrived.
+        """
         if not self.insights:
             return None
+        if self.total_insights == self._insights_key and self._insights_panel is not None:
+            return self._insights_panel
+
+        recent = list(islice(self.insights, max(len(self.insights) - 3, 0), None))
+        self._insights_key = self.total_insights
+        self._insights_panel = Panel(
+            "\n".join(recent), title="Recent Human Insights", border_style="blue"
+        )
+        return self._insights_panel
 
-        recent = self.insights[-3:]
-        return Panel("\n".join(recent), title="Recent Human Insights", border_style="blue")
+    def build_live_display(self) -> Group:
+        """Build the status table and insights panel shown in the live display."""
+        panel = self.build_insights_panel()
+        if panel is None:
+            return Group(self.build_status_display())
+        return Group(self.build_status_display(), panel)
 
-    def run(self, interval: float = 10.0, max_questions: int | None = None) -> None:
+    async def run(self, interval: float = 10.0, max_questions: int | None = None) -> None:
         """Run the seeder loop.
 
+        Submitting and polling run as two concurrent loops, so new responses
+        show up within a fraction of the interval instead of waiting for the
+        next submission.
+
         Args:
             interval: Seconds between submitting new questions.
             max_questions: Maximum questions to submit (None for unlimited).
@@ -373,57 +565,88 @@ class QuestionSeeder:
         )
 
         try:
-            while True:
-                # Check if we've hit the limit
-                if max_questions and self.total_submitted >= max_questions:
-                    self.console.print("\n[yellow]Reached maximum questions. Monitoring only...[/yellow]")
-                    # Continue monitoring but don't submit new questions
-                    while any(q.status == "OPEN" for q in self.tracked_questions):
-                        updates = self.check_responses()
-                        self._print_update(updates)
-                        time.sleep(interval)
-                    break
-
-                # Submit a new question
-                tracked = self.submit_question()
-                if tracked:
-                    self.console.print(
-                        f"\n[cyan]📤 Submitted [{tracked.category}]:[/cyan] {tracked.prompt[:60]}..."
-                    )
-
-                # Check for responses on existing questions
-                updates = self.check_responses()
-                self._print_update(updates)
-
-                # Print status summary
-                self.console.print(self.build_status_display())
-
-                if self.insights:
-                    panel = self.build_insights_panel()
-                    if panel:
-                        self.console.print(panel)
-
-                # Wait for next iteration
-                self.console.print(f"\n[dim]Waiting {interval}s...[/dim]")
-                time.sleep(interval)
-
-        except KeyboardInterrupt:
+            submitting_done = asyncio.Event()
+            # Live redraws the status in place; console.print lines scroll above it
+            with Live(
+                self.build_live_display(), console=self.console, refresh_per_second=4
+            ) as live:
+                await asyncio.gather(
+                    self._submit_loop(interval, max_questions, submitting_done, live),
+                    self._poll_loop(poll_seconds(interval), submitting_done, live),
+                )
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Ctrl-C under asyncio.run() arrives as a cancellation
             self.console.print("\n[yellow]Interrupted by user[/yellow]")
         finally:
             self._print_summary()
             self.client.close()
 
+    async def _submit_loop(
+        self, interval: float, max_questions: int | None, done: asyncio.Event, live: Live
+    ) -> None:
+        """Submit a question every interval until max_questions is reached.
+
+        Intervals shorter than SUBMIT_FLUSH_SECONDS are coalesced: the
+        questions due within that window go out in one batched request, which
+        keeps the same average rate with fewer round-trips.
+
+        Args:
+            interval: Seconds between submitting new questions.
+            max_questions: Maximum questions to submit (None for unlimited).
+            done: Set once no more questions will be submitted.
+            live: Live display to update after each submission.
+        """
+        submit_batch_size = min(max(int(SUBMIT_FLUSH_SECONDS / interval), 1), MAX_SUBMIT_BATCH)
+
+        while not (max_questions and self.total_submitted >= max_questions):
+            if not self.templates_available:
+                # Every template is being asked; wait for a poll to finish one of them
+                await asyncio.sleep(poll_seconds(interval))
+                continue
+
+            count = submit_batch_size
+            if max_questions:
+                count = min(count, max_questions - self.total_submitted)
+
+            submitted = await self.submit_questions(count)
+            for tracked in submitted:
+                self.console.print(
+                    f"\n[cyan]📤 Submitted [{tracked.category}]:[/cyan] {tracked.prompt[:60]}..."
+                )
+
+            live.update(self.build_live_display())
+            await asyncio.sleep(interval * max(len(submitted), 1))
+        else:
+            self.console.print("\n[yellow]Reached maximum questions. Monitoring only...[/yellow]")
+        done.set()
+
+    async def _poll_loop(
+        self, poll_interval: float, submitting_done: asyncio.Event, live: Live
+    ) -> None:
+        """Poll open questions until submitting is done and none are left open.
+
+        Args:
+            poll_interval: Seconds between polls.
+            submitting_done: Set by the submit loop once it has stopped.
+            live: Live display to update after each poll.
+        """
+        while not (submitting_done.is_set() and not self.open_questions):
+            updates = await self.check_responses()
+            self._print_update(updates)
+            live.update(self.build_live_display())
+            await asyncio.sleep(poll_interval)
+
     def _print_update(self, updates: list[tuple[TrackedQuestion, int]]) -> None:
         """Print response updates."""
         for tracked, count in updates:
             self.console.print(
-                f"[green]📥 +{count} response(s)[/green] on: {tracked.prompt[:50]}..."
+                f"[green]📥 +{count} response(s)[/green] on: {tracked.prompt_short}..."
             )
 
             # Show the responses
             for resp in tracked.responses[-count:]:
-                if resp.get("answer"):
-                    self.console.print(f"   💬 \"{resp['answer'][:80]}...\"")
+                if resp["answer_short"]:
+                    self.console.print(f"   💬 \"{resp['answer_short']}...\"")
                 elif resp.get("selected_option") is not None:
                     self.console.print(f"   ✓ Selected option {resp['selected_option']}")
 
@@ -435,7 +658,7 @@ class QuestionSeeder:
                 f"[bold]Session Complete[/bold]\n\n"
                 f"Questions submitted: {self.total_submitted}\n"
                 f"Responses received: {self.total_responses}\n"
-                f"Insights collected: {len(self.insights)}",
+                f"Insights collected: {self.total_insights}",
                 title="Summary",
                 border_style="green",
             )
@@ -443,7 +666,7 @@ class QuestionSeeder:
 
         if self.insights:
             self.console.print("\n[bold]Sample Insights from Humans:[/bold]")
-            for insight in self.insights[:5]:
+            for insight in islice(self.insights, 5):
                 self.console.print(f"  • {insight}")
 
 
@@ -472,7 +695,9 @@ def main() -> None:
     args = parser.parse_args()
 
     seeder = QuestionSeeder(agent_id=args.agent_id)
-    seeder.run(interval=args.interval, max_questions=args.max_questions)
+    # run() reports the interrupt itself; asyncio.run() re-raises it afterwards
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(seeder.run(interval=args.interval, max_questions=args.max_questions))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,115 @@
+"""Tests for the question seeder's response tracking.
+
+Run with `python -m pytest` from this directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+from ask_a_human.exceptions import ServerError
+from ask_a_human.types import QuestionResponse
+from rich.console import Console
+
+from seeder import QUESTION_TIMEOUT_SECONDS, QuestionSeeder, TrackedQuestion
+
+
+class FakeClient:
+    """Stands in for AskHumanClient, answering polls from a fixed table."""
+
+    def __init__(self, statuses: dict[str, str], failing_ids: frozenset[str] = frozenset()) -> None:
+        self.statuses = statuses
+        self.failing_ids = failing_ids
+
+    def get_questions(self, question_ids: list[str]) -> dict[str, QuestionResponse]:
+        if self.failing_ids.intersection(question_ids):
+            raise ServerError("unavailable", status_code=503)
+        return {
+            question_id: QuestionResponse.model_validate(
+                _question_data(question_id, self.statuses[question_id])
+            )
+            for question_id in question_ids
+            if question_id in self.statuses
+        }
+
+    def close(self) -> None:
+        pass
+
+
+def _question_data(question_id: str, status: str) -> dict[str, Any]:
+    return {
+        "question_id": question_id,
+        "status": status,
+        "prompt": "Prompt",
+        "type": "text",
+        "required_responses": 3,
+        "current_responses": 0,
+        "expires_at": "2026-01-01T00:00:00Z",
+        "responses": [],
+    }
+
+
+def _track(seeder: QuestionSeeder, question_id: str, age_seconds: float = 0) -> TrackedQuestion:
+    """Take a template from the seeder and track a question for it, as submit_questions does."""
+    category, template = seeder._available.popleft()
+    tracked = TrackedQuestion(
+        question_id=question_id,
+        prompt=template["prompt"],
+        category=category,
+        submitted_at_ns=time.monotonic_ns() - int(age_seconds * 1e9),
+    )
+    seeder._in_use[question_id] = (category, template)
+    seeder.open_questions.append(tracked)
+    return tracked
+
+
+def _seeder(client: FakeClient) -> QuestionSeeder:
+    seeder = QuestionSeeder(console=Console(quiet=True))
+    seeder.client.close()
+    seeder.client = client  # type: ignore[assignment]
+    return seeder
+
+
+class TestCheckResponses:
+    """Tests for releasing templates of questions that will get no more responses."""
+
+    def test_question_past_its_timeout_is_expired(self) -> None:
+        """A question still OPEN after its timeout should be archived and free its template."""
+        seeder = _seeder(FakeClient({"q_old": "OPEN", "q_new": "OPEN"}))
+        available = seeder.templates_available
+        old = _track(seeder, "q_old", age_seconds=QUESTION_TIMEOUT_SECONDS + 1)
+        _track(seeder, "q_new")
+
+        asyncio.run(seeder.check_responses())
+
+        assert [tracked.question_id for tracked in seeder.open_questions] == ["q_new"]
+        assert list(seeder.closed_questions) == [old]
+        assert old.status == "EXPIRED"
+        assert "q_old" not in seeder._in_use
+        assert seeder.templates_available == available - 1
+
+    def test_question_missing_from_server_is_dropped(self) -> None:
+        """A question the server no longer returns should be dropped, unless its poll failed."""
+        seeder = _seeder(FakeClient({"q_kept": "OPEN"}))
+        available = seeder.templates_available
+        _track(seeder, "q_gone")
+        _track(seeder, "q_kept")
+
+        asyncio.run(seeder.check_responses())
+
+        assert [tracked.question_id for tracked in seeder.open_questions] == ["q_kept"]
+        assert not seeder.closed_questions
+        assert set(seeder._in_use) == {"q_kept"}
+        assert seeder.templates_available == available - 1
+
+    def test_question_in_failed_poll_is_kept(self) -> None:
+        """A question whose poll failed should stay tracked."""
+        seeder = _seeder(FakeClient({}, failing_ids=frozenset({"q_unknown"})))
+        _track(seeder, "q_unknown")
+
+        asyncio.run(seeder.check_responses())
+
+        assert [tracked.question_id for tracked in seeder.open_questions] == ["q_unknown"]
+        assert set(seeder._in_use) == {"q_unknown"}
@@ -115,6 +115,18 @@ resource "aws_apigatewayv2_route" "post_agent_questions" {
   target    = "integrations/${aws_apigatewayv2_integration.agent_questions.id}"
 }
 
+resource "aws_apigatewayv2_route" "post_agent_questions_batch" {
+  api_id    = aws_apigatewayv2_api.main.id
+  route_key = "POST /agent/questions/batch"
+  target    = "integrations/${aws_apigatewayv2_integration.agent_questions.id}"
+}
+
+resource "aws_apigatewayv2_route" "get_agent_questions" {
+  api_id    = aws_apigatewayv2_api.main.id
+  route_key = "GET /agent/questions"
+  target    = "integrations/${aws_apigatewayv2_integration.agent_questions.id}"
+}
+
 resource "aws_apigatewayv2_route" "get_agent_question" {
   api_id    = aws_apigatewayv2_api.main.id
   route_key = "GET /agent/questions/{question_id}"
@@ -36,6 +36,11 @@ resource "aws_dynamodb_table" "questions" {
     type = "S"
   }
 
+  attribute {
+    name = "accepting"
+    type = "S"
+  }
+
   # GSI: ByStatus - Fetch open questions for humans
   global_secondary_index {
     name            = "ByStatus"
@@ -44,6 +49,15 @@ resource "aws_dynamodb_table" "questions" {
     projection_type = "ALL"
   }
 
+  # GSI: ByAccepting - Sparse index of OPEN/PARTIAL questions for the human list.
+  # Only items carrying the "accepting" attribute are indexed; it is removed on close.
+  global_secondary_index {
+    name            = "ByAccepting"
+    hash_key        = "accepting"
+    range_key       = "created_at"
+    projection_type = "ALL"
+  }
+
   # GSI: ByAgentId - Agent fetches their questions
   global_secondary_index {
     name            = "ByAgentId"
@@ -52,9 +66,10 @@ resource "aws_dynamodb_table" "questions" {
     projection_type = "ALL"
   }
 
-  # TTL: Automatically deletes expired questions
+  # TTL: Automatically deletes questions a day after they expire.
+  # expires_at is an ISO string for the API; TTL needs the numeric ttl attribute.
   ttl {
-    attribute_name = "expires_at"
+    attribute_name = "ttl"
     enabled        = true
   }
 
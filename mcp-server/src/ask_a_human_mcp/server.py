@@ -8,23 +8,29 @@ from __future__ import annotations
 
 import os
 import sys
-from typing import Any
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, Any
 
 import anyio
 import click
 import mcp.types as types
 from mcp.server.lowlevel import Server
 
-from ask_a_human import AskHumanClient
+from ask_a_human import AsyncAskHumanClient
 
 from .tools import get_tool_definitions, handle_tool_call
 
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
 
-def create_server() -> tuple[Server, AskHumanClient]:
+
+def create_server() -> tuple[Server, AsyncAskHumanClient]:
     """Create and configure the MCP server.
 
     Returns:
-        Tuple of (Server, AskHumanClient).
+        Tuple of (Server, AsyncAskHumanClient). The client must be closed on
+        the event loop that serves the tool calls.
 
     Raises:
         ValueError: If ASK_A_HUMAN_AGENT_ID is not set.
@@ -39,8 +45,8 @@ def create_server() -> tuple[Server, AskHumanClient]:
 
     base_url = os.environ.get("ASK_A_HUMAN_BASE_URL", "https://api.ask-a-human.com")
 
-    # Create client
-    client = AskHumanClient(base_url=base_url, agent_id=agent_id)
+    # One client for the server's lifetime: every tool call reuses its connection pool
+    client = AsyncAskHumanClient(base_url=base_url, agent_id=agent_id)
 
     # Create server
     server = Server("ask-a-human")
@@ -58,6 +64,53 @@ def create_server() -> tuple[Server, AskHumanClient]:
     return server, client
 
 
+def create_sse_app(server: Server, client: AsyncAskHumanClient) -> Starlette:
+    """Build the ASGI app serving the MCP server over SSE.
+
+    The routes and transport are built once here, not per connection.
+    Requires the optional SSE dependencies.
+
+    Args:
+        server: The MCP server to expose.
+        client: The server's API client, closed when the app shuts down.
+
+    Returns:
+        The Starlette app.
+
+    Raises:
+        ImportError: If the SSE dependencies are not installed.
+    """
+    from mcp.server.sse import SseServerTransport
+    from starlette.applications import Starlette
+    from starlette.requests import Request
+    from starlette.responses import Response
+    from starlette.routing import Mount, Route
+
+    sse = SseServerTransport("/messages/")
+
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(
+            request.scope, request.receive, request._send  # type: ignore[reportPrivateUsage]
+        ) as streams:
+            await server.run(streams[0], streams[1], server.create_initialization_options())
+        return Response()
+
+    @asynccontextmanager
+    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+        yield
+        await client.aclose()
+
+    # debug=False: no traceback-rendering middleware around every request
+    return Starlette(
+        debug=False,
+        lifespan=lifespan,
+        routes=[
+            Route("/sse", endpoint=handle_sse, methods=["GET"]),
+            Mount("/messages/", app=sse.handle_post_message),
+        ],
+    )
+
+
 @click.command()
 @click.option("--port", default=8000, help="Port to listen on for SSE transport")
 @click.option(
@@ -83,57 +136,36 @@ def main(port: int, transport: str) -> int:
         click.echo(f"Error: {e}", err=True)
         return 1
 
-    try:
-        if transport == "sse":
-            # SSE transport for web-based clients
-            try:
-                from mcp.server.sse import SseServerTransport
-                from starlette.applications import Starlette
-                from starlette.requests import Request
-                from starlette.responses import Response
-                from starlette.routing import Mount, Route
-            except ImportError:
-                click.echo(
-                    "SSE transport requires additional dependencies. "
-                    "Install with: pip install ask-a-human-mcp[sse]",
-                    err=True,
-                )
-                return 1
-
-            sse = SseServerTransport("/messages/")
-
-            async def handle_sse(request: Request) -> Response:
-                async with sse.connect_sse(
-                    request.scope, request.receive, request._send  # type: ignore[reportPrivateUsage]
-                ) as streams:
-                    await server.run(streams[0], streams[1], server.create_initialization_options())
-                return Response()
-
-            starlette_app = Starlette(
-                debug=True,
-                routes=[
-                    Route("/sse", endpoint=handle_sse, methods=["GET"]),
-                    Mount("/messages/", app=sse.handle_post_message),
-                ],
-            )
-
+    # The async client is closed on the serving event loop: by the app's
+    # lifespan for SSE, at the end of arun() for stdio
+    if transport == "sse":
+        # SSE transport for web-based clients
+        try:
             import uvicorn
 
-            click.echo(f"Starting SSE server on http://127.0.0.1:{port}")
-            uvicorn.run(starlette_app, host="127.0.0.1", port=port)
+            starlette_app = create_sse_app(server, client)
+        except ImportError:
+            click.echo(
+                "SSE transport requires additional dependencies. "
+                "Install with: pip install ask-a-human-mcp[sse]",
+                err=True,
+            )
+            return 1
+
+        click.echo(f"Starting SSE server on http://127.0.0.1:{port}")
+        # No per-request access log lines; warnings and errors are still shown
+        uvicorn.run(starlette_app, host="127.0.0.1", port=port, access_log=False, log_level="warning")
 
-        else:
-            # Stdio transport (default)
-            from mcp.server.stdio import stdio_server
+    else:
+        # Stdio transport (default)
+        from mcp.server.stdio import stdio_server
 
-            async def arun() -> None:
+        async def arun() -> None:
+            async with client:
                 async with stdio_server() as streams:
                     await server.run(streams[0], streams[1], server.create_initialization_options())
 
-            anyio.run(arun)
-
-    finally:
-        client.close()
+        anyio.run(arun)
 
     return 0
 
@@ -8,9 +8,9 @@ from typing import Any
 
 import mcp.types as types
 
-from ask_a_human import AskHumanClient
+from ask_a_human import AsyncAskHumanClient
 from ask_a_human.exceptions import AskHumanError
-from ask_a_human.types import AudienceTag, QuestionType
+from ask_a_human.types import AudienceTag, QuestionResponse, QuestionType
 
 # Tool names
 ASK_HUMAN_TOOL = "ask_human"
@@ -79,7 +79,10 @@ def get_tool_definitions() -> list[types.Tool]:
         ),
         types.Tool(
             name=CHECK_RESPONSES_TOOL,
-            description="Check the status and responses for a previously submitted human question.",
+            description=(
+                "Check the status and responses for previously submitted human questions. "
+                "Pass question_id for one question, or question_ids to check several in one call."
+            ),
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -87,18 +90,22 @@ def get_tool_definitions() -> list[types.Tool]:
                         "type": "string",
                         "description": "The question_id returned from ask_human",
                     },
+                    "question_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Several question_ids returned from ask_human, checked together",
+                    },
                 },
-                "required": ["question_id"],
             },
         ),
     ]
 
 
-async def handle_ask_human(client: AskHumanClient, arguments: dict[str, Any]) -> list[types.ContentBlock]:
+async def handle_ask_human(client: AsyncAskHumanClient, arguments: dict[str, Any]) -> list[types.ContentBlock]:
     """Handle the ask_human tool call.
 
     Args:
-        client: The AskHumanClient to use.
+        client: The AsyncAskHumanClient to use.
         arguments: Tool arguments from MCP.
 
     Returns:
@@ -121,7 +128,7 @@ async def handle_ask_human(client: AskHumanClient, arguments: dict[str, Any]) ->
 
     try:
         # Submit the question
-        result = client.submit_question(
+        result = await client.submit_question(
             prompt=question,
             type=question_type,
             options=options,
@@ -147,83 +154,110 @@ Note: Humans will respond asynchronously. Check back in a few minutes to see res
         return [types.TextContent(type="text", text=f"Error: {e}")]
 
 
-async def handle_check_responses(client: AskHumanClient, arguments: dict[str, Any]) -> list[types.ContentBlock]:
+async def handle_check_responses(client: AsyncAskHumanClient, arguments: dict[str, Any]) -> list[types.ContentBlock]:
     """Handle the check_human_responses tool call.
 
+    Several question IDs are fetched with batched requests rather than one
+    request each.
+
     Args:
-        client: The AskHumanClient to use.
+        client: The AsyncAskHumanClient to use.
         arguments: Tool arguments from MCP.
 
     Returns:
         List of content blocks with the result.
     """
+    question_ids: list[str] | None = arguments.get("question_ids")
     question_id = arguments.get("question_id")
-    if not question_id:
-        return [types.TextContent(type="text", text="Error: 'question_id' is required")]
+    if not question_ids and not question_id:
+        return [types.TextContent(type="text", text="Error: 'question_id' or 'question_ids' is required")]
 
     try:
-        # Get question status
-        response = client.get_question(question_id)
-
-        # Format response based on question type
-        lines = [
-            f"**Question ID:** {response.question_id}",
-            f"**Status:** {response.status}",
-            f"**Question:** {response.prompt}",
-            f"**Type:** {response.type}",
-            f"**Responses:** {response.current_responses}/{response.required_responses}",
-            "",
-        ]
-
-        if response.options:
-            lines.append("**Options:**")
-            for i, opt in enumerate(response.options):
-                lines.append(f"  {i}. {opt}")
-            lines.append("")
-
-        if response.responses:
-            lines.append("**Human Responses:**")
-            for i, r in enumerate(response.responses, 1):
-                if r.answer:
-                    lines.append(f"  {i}. {r.answer}")
-                    if r.confidence:
-                        lines.append(f"     (Confidence: {r.confidence}/5)")
-                elif r.selected_option is not None and response.options:
-                    option_text = response.options[r.selected_option]
-                    lines.append(f"  {i}. Selected: {option_text}")
-                    if r.confidence:
-                        lines.append(f"     (Confidence: {r.confidence}/5)")
-            lines.append("")
-
-        if response.summary:
-            lines.append("**Vote Summary:**")
-            for option, count in response.summary.items():
-                lines.append(f"  {option}: {count} votes")
-            lines.append("")
-
-        # Add status-specific message
-        if response.status == "OPEN":
-            lines.append("_Waiting for responses. Check again later._")
-        elif response.status == "PARTIAL":
-            lines.append("_Some responses received. More may come. You can proceed with partial results or wait._")
-        elif response.status == "CLOSED":
-            lines.append("_All responses received. Question is complete._")
-        elif response.status == "EXPIRED":
-            lines.append("_Question expired before receiving enough responses._")
-
-        return [types.TextContent(type="text", text="\n".join(lines))]
+        if not question_ids:
+            # Get question status
+            response = await client.get_question(question_id)
+            return [types.TextContent(type="text", text=_format_question(response))]
+
+        responses = await client.get_questions(question_ids)
 
     except AskHumanError as e:
         return [types.TextContent(type="text", text=f"Error: {e}")]
 
+    sections = [
+        _format_question(responses[qid]) if qid in responses else f"**Question ID:** {qid}\n_Question not found._"
+        for qid in dict.fromkeys(question_ids)
+    ]
+    return [types.TextContent(type="text", text="\n\n---\n\n".join(sections))]
+
+
+def _format_question(response: QuestionResponse) -> str:
+    """Format a question's status and responses for the tool result.
+
+    Args:
+        response: The polled question.
+
+    Returns:
+        Markdown text describing the question.
+    """
+    # Format response based on question type
+    lines = [
+        f"**Question ID:** {response.question_id}",
+        f"**Status:** {response.status}",
+        f"**Question:** {response.prompt}",
+        f"**Type:** {response.type}",
+        f"**Responses:** {response.current_responses}/{response.required_responses}",
+        "",
+    ]
+
+    if response.options:
+        lines.append("**Options:**")
+        for i, opt in enumerate(response.options):
+            lines.append(f"  {i}. {opt}")
+        lines.append("")
+
+    if response.responses:
+        lines.append("**Human Responses:**")
+        for i, r in enumerate(response.responses, 1):
+            if r.answer:
+                lines.append(f"  {i}. {r.answer}")
+                if r.confidence:
+                    lines.append(f"     (Confidence: {r.confidence}/5)")
+            elif r.selected_option is not None and response.options:
+                option_text = response.options[r.selected_option]
+                lines.append(f"  {i}. Selected: {option_text}")
+                if r.confidence:
+                    lines.append(f"     (Confidence: {r.confidence}/5)")
+        lines.append("")
+
+    if response.summary:
+        lines.append("**Vote Summary:**")
+        for option, count in response.summary.items():
+            lines.append(f"  {option}: {count} votes")
+        lines.append("")
+
+    # Add status-specific message
+    if response.status == "OPEN":
+        lines.append("_Waiting for responses. Check again later._")
+    elif response.status == "PARTIAL":
+        lines.append("_Some responses received. More may come. You can proceed with partial results or wait._")
+    elif response.status == "CLOSED":
+        lines.append("_All responses received. Question is complete._")
+    elif response.status == "EXPIRED":
+        lines.append("_Question expired before receiving enough responses._")
+
+    return "\n".join(lines)
+
 
 async def handle_tool_call(
-    client: AskHumanClient, name: str, arguments: dict[str, Any]
+    client: AsyncAskHumanClient, name: str, arguments: dict[str, Any]
 ) -> list[types.ContentBlock]:
     """Route a tool call to the appropriate handler.
 
+    Handlers await the async client, so concurrent tool calls overlap their
+    HTTP round-trips on the event loop.
+
     Args:
-        client: The AskHumanClient to use.
+        client: The AsyncAskHumanClient to use.
         name: The tool name.
         arguments: Tool arguments.
 
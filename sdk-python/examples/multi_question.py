@@ -2,7 +2,7 @@
 """Multi-question example for Ask-a-Human SDK.
 
 This example demonstrates:
-- Submitting multiple questions at once
+- Submitting multiple questions at once with one batched request
 - Using the orchestrator for async workflows
 - Handling partial results
 - Processing multiple choice questions
@@ -12,7 +12,7 @@ Usage:
     python multi_question.py
 """
 
-from ask_a_human import AskHumanClient, AskHumanOrchestrator
+from ask_a_human import AskHumanClient, AskHumanOrchestrator, QuestionRequest
 from ask_a_human.exceptions import AskHumanError
 
 
@@ -30,50 +30,48 @@ def main() -> None:  # noqa: C901
         print("Submitting multiple questions to humans...")
         print()
 
-        # Submit multiple questions
-        questions = []
-
-        # Question 1: Text question about tone
-        q1 = orchestrator.submit(
-            prompt=(
-                "What tone should a payment failure notification use? "
-                "Consider the user just had their credit card declined."
-            ),
-            type="text",
-            audience=["product", "creative"],
-            min_responses=3,
-            timeout_seconds=1800,
+        # Submit all three questions with one batched request
+        names = ["Tone question", "Button label question", "Icon question"]
+        submissions = orchestrator.submit_many(
+            [
+                # Question 1: Text question about tone
+                QuestionRequest(
+                    prompt=(
+                        "What tone should a payment failure notification use? "
+                        "Consider the user just had their credit card declined."
+                    ),
+                    type="text",
+                    audience=["product", "creative"],
+                    min_responses=3,
+                    timeout_seconds=1800,
+                ),
+                # Question 2: Multiple choice about button label
+                QuestionRequest(
+                    prompt="Which button label is clearer for retrying a failed payment?",
+                    type="multiple_choice",
+                    options=["Try Again", "Retry Payment", "Retry", "Submit Again"],
+                    audience=["product"],
+                    min_responses=5,
+                    timeout_seconds=1800,
+                ),
+                # Question 3: Multiple choice about icon usage
+                QuestionRequest(
+                    prompt="Should payment error messages include a warning icon or just text?",
+                    type="multiple_choice",
+                    options=[
+                        "Warning icon with text",
+                        "Text only, no icon",
+                        "Subtle icon, text is primary",
+                    ],
+                    audience=["product", "creative"],
+                    min_responses=5,
+                    timeout_seconds=1800,
+                ),
+            ]
         )
-        questions.append(("Tone question", q1))
-        print(f"  Submitted tone question: {q1.question_id}")
-
-        # Question 2: Multiple choice about button label
-        q2 = orchestrator.submit(
-            prompt="Which button label is clearer for retrying a failed payment?",
-            type="multiple_choice",
-            options=["Try Again", "Retry Payment", "Retry", "Submit Again"],
-            audience=["product"],
-            min_responses=5,
-            timeout_seconds=1800,
-        )
-        questions.append(("Button label question", q2))
-        print(f"  Submitted button question: {q2.question_id}")
-
-        # Question 3: Multiple choice about icon usage
-        q3 = orchestrator.submit(
-            prompt="Should payment error messages include a warning icon or just text?",
-            type="multiple_choice",
-            options=[
-                "Warning icon with text",
-                "Text only, no icon",
-                "Subtle icon, text is primary",
-            ],
-            audience=["product", "creative"],
-            min_responses=5,
-            timeout_seconds=1800,
-        )
-        questions.append(("Icon question", q3))
-        print(f"  Submitted icon question: {q3.question_id}")
+        questions = list(zip(names, submissions, strict=True))
+        for name, submission in questions:
+            print(f"  Submitted {name.lower()}: {submission.question_id}")
 
         print()
         print("Waiting for responses (timeout: 5 minutes)...")
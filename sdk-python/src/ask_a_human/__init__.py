@@ -13,6 +13,7 @@ Example:
     >>> response = client.get_question(result.question_id)
 """
 
+from ask_a_human.async_client import AsyncAskHumanClient
 from ask_a_human.client import AskHumanClient
 from ask_a_human.exceptions import (
     AskHumanError,
@@ -24,22 +25,25 @@ from ask_a_human.exceptions import (
 from ask_a_human.orchestrator import AskHumanOrchestrator
 from ask_a_human.types import (
     HumanResponse,
+    QuestionRequest,
     QuestionResponse,
     QuestionStatus,
     QuestionSubmission,
     QuestionType,
 )
 
-__version__ = "0.1.0"
+__version__ = "0.2.0"
 
 __all__ = [
     # Client
     "AskHumanClient",
+    "AsyncAskHumanClient",
     # Orchestrator
     "AskHumanOrchestrator",
     # Types
     "QuestionType",
     "QuestionStatus",
+    "QuestionRequest",
     "QuestionSubmission",
     "QuestionResponse",
     "HumanResponse",
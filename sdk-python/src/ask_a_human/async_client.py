@@ -0,0 +1,258 @@
+"""Asyncio API client for Ask-a-Human.
+
+This module provides the AsyncAskHumanClient class, the awaitable
+counterpart of AskHumanClient. Use it from asyncio code such as MCP servers,
+where a blocking HTTP call would stall every other task on the event loop.
+
+Example:
+    >>> from ask_a_human import AsyncAskHumanClient
+    >>> async with AsyncAskHumanClient(agent_id="my-agent") as client:
+    ...     result = await client.submit_question(
+    ...         prompt="Should this error apologize?",
+    ...         type="text"
+    ...     )
+    ...     response = await client.get_question(result.question_id)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any
+
+import httpx
+
+from ask_a_human.client import (
+    DEFAULT_BASE_URL,
+    DEFAULT_LIMITS,
+    DEFAULT_TIMEOUT,
+    HTTP2_AVAILABLE,
+    MAX_POLL_IDS,
+    MAX_SUBMIT_BATCH,
+    _raise_for_error,
+)
+from ask_a_human.exceptions import QuestionNotFoundError
+from ask_a_human.types import (
+    AudienceTag,
+    QuestionBatchRequest,
+    QuestionBatchResponse,
+    QuestionRequest,
+    QuestionResponse,
+    QuestionSubmission,
+    QuestionType,
+)
+
+
+class AsyncAskHumanClient:
+    """Asyncio client for the Ask-a-Human API.
+
+    Mirrors AskHumanClient method for method, with every API call awaitable.
+    Concurrent calls share one pooled httpx.AsyncClient.
+
+    Attributes:
+        base_url: The API base URL.
+        agent_id: The agent identifier for rate limiting.
+        timeout: HTTP request timeout in seconds.
+
+    Example:
+        >>> client = AsyncAskHumanClient(agent_id="my-agent")
+        >>> try:
+        ...     results = await asyncio.gather(
+        ...         client.get_question("q_abc123"),
+        ...         client.get_question("q_def456"),
+        ...     )
+        ... finally:
+        ...     await client.aclose()
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        agent_id: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            base_url: API base URL. Defaults to ASK_A_HUMAN_BASE_URL env var
+                or https://api.ask-a-human.com.
+            agent_id: Agent identifier for rate limiting. Defaults to
+                ASK_A_HUMAN_AGENT_ID env var or 'default'.
+            timeout: HTTP request timeout in seconds. Defaults to 30.
+        """
+        self.base_url = base_url or os.environ.get("ASK_A_HUMAN_BASE_URL", DEFAULT_BASE_URL)
+        self.agent_id = agent_id or os.environ.get("ASK_A_HUMAN_AGENT_ID", "default")
+        self.timeout = timeout
+
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=timeout,
+            limits=DEFAULT_LIMITS,
+            http2=HTTP2_AVAILABLE,
+            headers={
+                "Content-Type": "application/json",
+                "X-Agent-Id": self.agent_id,
+            },
+        )
+
+    async def __aenter__(self) -> AsyncAskHumanClient:
+        """Enter async context manager."""
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Exit async context manager."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client.
+
+        Call this from the event loop the client was used on, or use the
+        client as an async context manager.
+        """
+        await self._client.aclose()
+
+    async def submit_question(
+        self,
+        prompt: str,
+        type: QuestionType,  # noqa: A002 - 'type' shadows builtin, but matches API
+        options: list[str] | None = None,
+        audience: list[AudienceTag] | None = None,
+        min_responses: int = 5,
+        timeout_seconds: int = 3600,
+        idempotency_key: str | None = None,
+    ) -> QuestionSubmission:
+        """Submit a question for humans to answer.
+
+        See AskHumanClient.submit_question for the arguments.
+
+        Returns:
+            QuestionSubmission with question_id, status, poll_url, and expires_at.
+
+        Raises:
+            ValidationError: If the request is invalid.
+            RateLimitError: If rate limit is exceeded.
+            QuotaExceededError: If too many concurrent questions.
+            ServerError: If the server returns a 5xx error.
+            AskHumanError: For other API errors.
+        """
+        request = QuestionRequest(
+            prompt=prompt,
+            type=type,
+            options=options,
+            audience=audience,
+            min_responses=min_responses,
+            timeout_seconds=timeout_seconds,
+            idempotency_key=idempotency_key,
+        )
+
+        response = await self._client.post(
+            "/agent/questions",
+            json=request.model_dump(exclude_none=True),
+        )
+
+        _raise_for_error(response)
+
+        return QuestionSubmission.model_validate(response.json())
+
+    async def submit_questions(self, questions: list[QuestionRequest]) -> list[QuestionSubmission]:
+        """Submit several questions for humans to answer.
+
+        Sends up to MAX_SUBMIT_BATCH questions per request. The server stores
+        each batch in one transaction, so a batch is either created in full or
+        not at all. Batches are sent one after another, so if a later batch
+        fails, only the questions from earlier batches have been created.
+
+        Args:
+            questions: The questions to submit.
+
+        Returns:
+            One QuestionSubmission per question, in the same order.
+
+        Raises:
+            ValidationError: If any question in a batch is invalid.
+            RateLimitError: If rate limit is exceeded.
+            QuotaExceededError: If too many concurrent questions.
+            ServerError: If the server returns a 5xx error.
+            AskHumanError: For other API errors.
+        """
+        results: list[QuestionSubmission] = []
+
+        for start in range(0, len(questions), MAX_SUBMIT_BATCH):
+            request = QuestionBatchRequest(questions=questions[start : start + MAX_SUBMIT_BATCH])
+            response = await self._client.post(
+                "/agent/questions/batch",
+                json=request.model_dump(exclude_none=True),
+            )
+
+            _raise_for_error(response)
+
+            results.extend(QuestionBatchResponse.model_validate(response.json()).questions)
+
+        return results
+
+    async def get_question(self, question_id: str) -> QuestionResponse:
+        """Get the current status and responses for a question.
+
+        Args:
+            question_id: The question ID to retrieve.
+
+        Returns:
+            QuestionResponse with status, responses, and metadata.
+
+        Raises:
+            QuestionNotFoundError: If the question doesn't exist.
+            RateLimitError: If rate limit is exceeded.
+            ServerError: If the server returns a 5xx error.
+            AskHumanError: For other API errors.
+        """
+        response = await self._client.get(f"/agent/questions/{question_id}")
+
+        # Handle 404 specially
+        if response.status_code == 404:
+            error_data = response.json().get("error", {})
+            raise QuestionNotFoundError(
+                message=error_data.get("message", "Question not found"),
+                question_id=question_id,
+                code=error_data.get("code"),
+                details=error_data.get("details"),
+            )
+
+        _raise_for_error(response)
+
+        return QuestionResponse.model_validate(response.json())
+
+    async def get_questions(self, question_ids: list[str]) -> dict[str, QuestionResponse]:
+        """Get the status and responses of several questions.
+
+        Polls up to MAX_POLL_IDS questions per request and sends the requests
+        concurrently.
+
+        Args:
+            question_ids: The question IDs to retrieve.
+
+        Returns:
+            Dictionary mapping question_id to QuestionResponse. Questions that
+            don't exist are left out.
+
+        Raises:
+            ValidationError: If the request is invalid.
+            RateLimitError: If rate limit is exceeded.
+            ServerError: If the server returns a 5xx error.
+            AskHumanError: For other API errors.
+        """
+        unique_ids = list(dict.fromkeys(question_ids))
+        batches = [unique_ids[start : start + MAX_POLL_IDS] for start in range(0, len(unique_ids), MAX_POLL_IDS)]
+
+        responses = await asyncio.gather(
+            *(self._client.get("/agent/questions", params={"ids": ",".join(batch)}) for batch in batches)
+        )
+
+        results: dict[str, QuestionResponse] = {}
+        for response in responses:
+            _raise_for_error(response)
+
+            for data in response.json()["questions"]:
+                question = QuestionResponse.model_validate(data)
+                results[question.question_id] = question
+
+        return results
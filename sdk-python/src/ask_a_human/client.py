@@ -17,7 +17,8 @@ Example:
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Any
+from importlib.util import find_spec
+from typing import Any
 
 import httpx
 
@@ -31,19 +32,26 @@ from ask_a_human.exceptions import (
 )
 from ask_a_human.types import (
     AudienceTag,
+    QuestionBatchRequest,
+    QuestionBatchResponse,
     QuestionRequest,
     QuestionResponse,
     QuestionSubmission,
     QuestionType,
 )
 
-if TYPE_CHECKING:
-    pass
-
-
 # Default configuration
 DEFAULT_BASE_URL = "https://api.ask-a-human.com"
 DEFAULT_TIMEOUT = 30.0
+MAX_POLL_IDS = 20  # Most question IDs the API accepts in one batched poll
+MAX_SUBMIT_BATCH = 20  # Most questions the API accepts in one batched submit
+
+# Connections kept open between calls. Sized for callers that poll from
+# several threads at once, e.g. the question seeder.
+DEFAULT_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# HTTP/2 needs the optional h2 package (pip install ask-a-human[http2])
+HTTP2_AVAILABLE = find_spec("h2") is not None
 
 
 class AskHumanClient:
@@ -102,10 +110,13 @@ class AskHumanClient:
         self.agent_id = agent_id or os.environ.get("ASK_A_HUMAN_AGENT_ID", "default")
         self.timeout = timeout
 
-        # Initialize HTTP client
+        # One pooled client for the lifetime of this object, so repeated calls
+        # reuse keep-alive connections instead of paying a new TLS handshake
         self._client = httpx.Client(
             base_url=self.base_url,
             timeout=timeout,
+            limits=DEFAULT_LIMITS,
+            http2=HTTP2_AVAILABLE,
             headers={
                 "Content-Type": "application/json",
                 "X-Agent-Id": self.agent_id,
@@ -206,12 +217,60 @@ class AskHumanClient:
         )
 
         # Handle response
-        self._handle_errors(response)
+        _raise_for_error(response)
 
         # Parse response
         data = response.json()
         return QuestionSubmission.model_validate(data)
 
+    def submit_questions(self, questions: list[QuestionRequest]) -> list[QuestionSubmission]:
+        """Submit several questions for humans to answer.
+
+        Sends up to MAX_SUBMIT_BATCH questions per request, so submitting many
+        questions costs one round-trip per batch instead of one per question.
+        The server stores each batch in one transaction, so a batch is either
+        created in full or not at all. Batches are sent one after another, so
+        if a later batch fails, only the questions from earlier batches have
+        been created.
+
+        Args:
+            questions: The questions to submit.
+
+        Returns:
+            One QuestionSubmission per question, in the same order.
+
+        Raises:
+            ValidationError: If any question in a batch is invalid.
+            RateLimitError: If rate limit is exceeded.
+            QuotaExceededError: If too many concurrent questions.
+            ServerError: If the server returns a 5xx error.
+            AskHumanError: For other API errors.
+
+        Example:
+            >>> from ask_a_human.types import QuestionRequest
+            >>> results = client.submit_questions([
+            ...     QuestionRequest(prompt="Which button label is clearer?", type="multiple_choice",
+            ...                     options=["Submit", "Send"]),
+            ...     QuestionRequest(prompt="Should error messages apologize to users?", type="text"),
+            ... ])
+            >>> question_ids = [result.question_id for result in results]
+        """
+        results: list[QuestionSubmission] = []
+
+        for start in range(0, len(questions), MAX_SUBMIT_BATCH):
+            batch = questions[start : start + MAX_SUBMIT_BATCH]
+            request = QuestionBatchRequest(questions=batch)
+            response = self._client.post(
+                "/agent/questions/batch",
+                json=request.model_dump(exclude_none=True),
+            )
+
+            _raise_for_error(response)
+
+            results.extend(QuestionBatchResponse.model_validate(response.json()).questions)
+
+        return results
+
     def get_question(self, question_id: str) -> QuestionResponse:
         """Get a question's status and responses.
 
@@ -246,66 +305,108 @@ class AskHumanClient:
                 details=error_data.get("details"),
             )
 
-        self._handle_errors(response)
+        _raise_for_error(response)
 
         data = response.json()
         return QuestionResponse.model_validate(data)
 
-    def _handle_errors(self, response: httpx.Response) -> None:
-        """Handle HTTP error responses.
+    def get_questions(self, question_ids: list[str]) -> dict[str, QuestionResponse]:
+        """Get the status and responses of several questions.
+
+        Polls up to MAX_POLL_IDS questions per request, so waiting on many
+        questions costs one round-trip per batch instead of one per question.
 
         Args:
-            response: The HTTP response to check.
+            question_ids: The question IDs to retrieve.
+
+        Returns:
+            Dictionary mapping question_id to QuestionResponse. Questions that
+            don't exist are left out.
 
         Raises:
-            ValidationError: For 400 errors.
-            QuotaExceededError: For 403 errors.
-            QuestionNotFoundError: For 404 errors.
-            RateLimitError: For 429 errors.
-            ServerError: For 5xx errors.
-            AskHumanError: For other errors.
+            ValidationError: If the request is invalid.
+            RateLimitError: If rate limit is exceeded.
+            ServerError: If the server returns a 5xx error.
+            AskHumanError: For other API errors.
+
+        Example:
+            >>> responses = client.get_questions(["q_abc123", "q_def456"])
+            >>> for question_id, response in responses.items():
+            ...     print(f"{question_id}: {response.status}")
         """
-        if response.is_success:
-            return
+        unique_ids = list(dict.fromkeys(question_ids))
+        results: dict[str, QuestionResponse] = {}
 
-        # Try to parse error response
-        try:
-            error_data = response.json().get("error", {})
-        except Exception:
-            error_data = {}
+        for start in range(0, len(unique_ids), MAX_POLL_IDS):
+            batch = unique_ids[start : start + MAX_POLL_IDS]
+            response = self._client.get("/agent/questions", params={"ids": ",".join(batch)})
 
-        message = error_data.get("message", f"HTTP {response.status_code}")
-        code = error_data.get("code")
-        details = error_data.get("details")
+            _raise_for_error(response)
 
-        if response.status_code == 400:
-            raise ValidationError(message, code, details)
+            for data in response.json()["questions"]:
+                question = QuestionResponse.model_validate(data)
+                results[question.question_id] = question
 
-        if response.status_code == 403:
-            raise QuotaExceededError(message, code, details)
+        return results
 
-        if response.status_code == 404:
-            raise QuestionNotFoundError(message, code=code, details=details)
-
-        if response.status_code == 429:
-            # Extract rate limit headers
-            retry_after = response.headers.get("Retry-After")
-            limit = response.headers.get("X-RateLimit-Limit")
-            remaining = response.headers.get("X-RateLimit-Remaining")
-            reset = response.headers.get("X-RateLimit-Reset")
-
-            raise RateLimitError(
-                message,
-                retry_after=int(retry_after) if retry_after else None,
-                limit=int(limit) if limit else None,
-                remaining=int(remaining) if remaining else None,
-                reset=int(reset) if reset else None,
-                code=code,
-                details=details,
-            )
 
-        if response.status_code >= 500:
-            raise ServerError(message, response.status_code, code, details)
+def _raise_for_error(response: httpx.Response) -> None:
+    """Raise the SDK exception matching an HTTP error response.
+
+    Shared by AskHumanClient and AsyncAskHumanClient.
+
+    Args:
+        response: The HTTP response to check.
+
+    Raises:
+        ValidationError: For 400 errors.
+        QuotaExceededError: For 403 errors.
+        QuestionNotFoundError: For 404 errors.
+        RateLimitError: For 429 errors.
+        ServerError: For 5xx errors.
+        AskHumanError: For other errors.
+    """
+    if response.is_success:
+        return
+
+    # Try to parse error response
+    try:
+        error_data = response.json().get("error", {})
+    except Exception:
+        error_data = {}
+
+    message = error_data.get("message", f"HTTP {response.status_code}")
+    code = error_data.get("code")
+    details = error_data.get("details")
+
+    if response.status_code == 400:
+        raise ValidationError(message, code, details)
+
+    if response.status_code == 403:
+        raise QuotaExceededError(message, code, details)
+
+    if response.status_code == 404:
+        raise QuestionNotFoundError(message, code=code, details=details)
+
+    if response.status_code == 429:
+        # Extract rate limit headers
+        retry_after = response.headers.get("Retry-After")
+        limit = response.headers.get("X-RateLimit-Limit")
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+
+        raise RateLimitError(
+            message,
+            retry_after=int(retry_after) if retry_after else None,
+            limit=int(limit) if limit else None,
+            remaining=int(remaining) if remaining else None,
+            reset=int(reset) if reset else None,
+            code=code,
+            details=details,
+        )
+
+    if response.status_code >= 500:
+        raise ServerError(message, response.status_code, code, details)
 
-        # Unknown error
-        raise AskHumanError(message, code, details)
+    # Unknown error
+    raise AskHumanError(message, code, details)
@@ -13,14 +13,16 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import TYPE_CHECKING
 
+from ask_a_human.exceptions import QuestionNotFoundError
 from ask_a_human.types import QuestionResponse, QuestionSubmission
 
 if TYPE_CHECKING:
     from ask_a_human.client import AskHumanClient
-    from ask_a_human.types import AudienceTag, QuestionType
+    from ask_a_human.types import AudienceTag, QuestionRequest, QuestionType
 
 
 # Default configuration
@@ -132,11 +134,34 @@ class AskHumanOrchestrator:
             idempotency_key=idempotency_key,
         )
 
+    def submit_many(self, questions: list[QuestionRequest]) -> list[QuestionSubmission]:
+        """Submit several questions with batched requests.
+
+        This is a convenience wrapper around client.submit_questions().
+
+        Args:
+            questions: The questions to submit.
+
+        Returns:
+            One QuestionSubmission per question, in the same order.
+
+        Example:
+            >>> from ask_a_human import QuestionRequest
+            >>> submissions = orchestrator.submit_many([
+            ...     QuestionRequest(prompt="Which headline is better?", type="multiple_choice",
+            ...                     options=["Option A", "Option B"]),
+            ...     QuestionRequest(prompt="What tone fits this announcement?", type="text"),
+            ... ])
+            >>> question_ids = [submission.question_id for submission in submissions]
+        """
+        return self.client.submit_questions(questions)
+
     def poll_once(self, question_ids: list[str]) -> dict[str, QuestionResponse]:
         """Poll for the current status of questions.
 
         This is a non-blocking call that returns immediately with the current
-        status of each question.
+        status of each question. The questions are fetched with batched
+        requests rather than one request each.
 
         Args:
             question_ids: List of question IDs to check.
@@ -144,14 +169,19 @@ class AskHumanOrchestrator:
         Returns:
             Dictionary mapping question_id to QuestionResponse.
 
+        Raises:
+            QuestionNotFoundError: If any of the questions does not exist.
+
         Example:
             >>> responses = orchestrator.poll_once(["q_abc123", "q_def456"])
             >>> for qid, response in responses.items():
             ...     print(f"{qid}: {response.status} ({response.current_responses} responses)")
         """
-        results: dict[str, QuestionResponse] = {}
+        results = self.client.get_questions(question_ids)
         for question_id in question_ids:
-            results[question_id] = self.client.get_question(question_id)
+            if question_id not in results:
+                msg = f"Question {question_id} not found"
+                raise QuestionNotFoundError(msg, question_id=question_id)
         return results
 
     def await_responses(
@@ -199,21 +229,7 @@ class AskHumanOrchestrator:
             # Poll all questions
             results = self.poll_once(question_ids)
 
-            # Check if all questions are done
-            all_done = True
-            for response in results.values():
-                # Question is done if:
-                # - It has enough responses
-                # - It's CLOSED
-                # - It's EXPIRED
-                if response.status in ("CLOSED", "EXPIRED"):
-                    continue
-                if response.current_responses >= min_responses:
-                    continue
-                all_done = False
-                break
-
-            if all_done:
+            if _all_done(results, min_responses):
                 return results
 
             # Check timeout
@@ -235,6 +251,56 @@ class AskHumanOrchestrator:
                 self.max_backoff,
             )
 
+    async def await_responses_async(
+        self,
+        question_ids: list[str],
+        min_responses: int = 1,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> dict[str, QuestionResponse]:
+        """Wait for responses to questions without blocking the event loop.
+
+        Same stopping rules and backoff as await_responses(), but each poll
+        runs in a worker thread and the wait between polls is an
+        asyncio.sleep(), so other coroutines keep running meanwhile.
+
+        Args:
+            question_ids: List of question IDs to wait for.
+            min_responses: Minimum responses needed per question. Defaults to 1.
+            timeout: Maximum time to wait in seconds. Defaults to 3600 (1 hour).
+
+        Returns:
+            Dictionary mapping question_id to QuestionResponse.
+            May return partial results if timeout is reached.
+
+        Example:
+            >>> responses = await orchestrator.await_responses_async(
+            ...     ["q_abc123", "q_def456"],
+            ...     min_responses=3,
+            ...     timeout=300
+            ... )
+        """
+        start_time = time.time()
+        current_interval = self.poll_interval
+
+        while True:
+            results = await asyncio.to_thread(self.poll_once, question_ids)
+
+            if _all_done(results, min_responses):
+                return results
+
+            elapsed = time.time() - start_time
+            if elapsed >= timeout:
+                return results
+
+            sleep_time = min(current_interval, timeout - elapsed)
+            if sleep_time > 0:
+                await asyncio.sleep(sleep_time)
+
+            current_interval = min(
+                current_interval * self.backoff_multiplier,
+                self.max_backoff,
+            )
+
     def submit_and_wait(
         self,
         prompt: str,
@@ -294,3 +360,15 @@ class AskHumanOrchestrator:
         )
 
         return results[submission.question_id]
+
+
+def _all_done(results: dict[str, QuestionResponse], min_responses: int) -> bool:
+    """Check whether every polled question needs no further waiting.
+
+    A question is done if it has enough responses, or if it is CLOSED or
+    EXPIRED and will not receive any more.
+    """
+    return all(
+        response.status in ("CLOSED", "EXPIRED") or response.current_responses >= min_responses
+        for response in results.values()
+    )
@@ -124,7 +124,8 @@ class QuestionResponse(BaseModel):
 class QuestionRequest(BaseModel):
     """Request body for submitting a question.
 
-    Used internally by AskHumanClient to construct API requests.
+    Built by AskHumanClient.submit_question, and passed directly to
+    AskHumanClient.submit_questions to submit several questions at once.
 
     Attributes:
         prompt: The question text (10-2000 characters).
@@ -143,3 +144,28 @@ class QuestionRequest(BaseModel):
     min_responses: int = Field(default=5, ge=1, le=50, description="Minimum responses needed")
     timeout_seconds: int = Field(default=3600, ge=60, le=86400, description="Expiration in seconds")
     idempotency_key: str | None = Field(default=None, description="Key to prevent duplicates")
+
+
+class QuestionBatchRequest(BaseModel):
+    """Request body for submitting several questions at once.
+
+    Sent to the POST /agent/questions/batch endpoint by
+    AskHumanClient.submit_questions, one chunk at a time.
+
+    Attributes:
+        questions: The questions to create, in order.
+    """
+
+    questions: list[QuestionRequest] = Field(..., min_length=1, description="Questions to create")
+
+
+class QuestionBatchResponse(BaseModel):
+    """Response from submitting several questions at once.
+
+    Returned by the POST /agent/questions/batch endpoint.
+
+    Attributes:
+        questions: One submission per requested question, in request order.
+    """
+
+    questions: list[QuestionSubmission] = Field(..., description="Created questions")
@@ -0,0 +1,126 @@
+"""Tests for AsyncAskHumanClient."""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from ask_a_human import AsyncAskHumanClient, QuestionRequest
+from ask_a_human.client import MAX_POLL_IDS
+from ask_a_human.exceptions import QuestionNotFoundError, ServerError
+
+T = TypeVar("T")
+
+
+def run_with_client(call: Callable[[AsyncAskHumanClient], Awaitable[T]]) -> T:
+    """Run one call against a fresh test client on its own event loop."""
+
+    async def main() -> T:
+        async with AsyncAskHumanClient(base_url="https://api.example.com", agent_id="test-agent") as client:
+            return await call(client)
+
+    return asyncio.run(main())
+
+
+class TestAsyncSubmitQuestion:
+    """Tests for the async submit_question method."""
+
+    def test_submit_text_question(
+        self,
+        httpx_mock: HTTPXMock,
+        question_submission_response: dict,
+    ) -> None:
+        """Test submitting a text question."""
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/agent/questions",
+            json=question_submission_response,
+            status_code=201,
+        )
+
+        result = run_with_client(lambda client: client.submit_question(prompt="Should this apologize?", type="text"))
+
+        assert result.question_id == "q_test123"
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["X-Agent-Id"] == "test-agent"
+
+    def test_submit_questions_batched(
+        self,
+        httpx_mock: HTTPXMock,
+        question_submission_response: dict,
+    ) -> None:
+        """Test several questions are submitted with one batched request."""
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/agent/questions/batch",
+            json={"questions": [question_submission_response, {**question_submission_response, "question_id": "q_2"}]},
+            status_code=201,
+        )
+
+        questions = [
+            QuestionRequest(prompt="Should this error apologize?", type="text"),
+            QuestionRequest(prompt="Which label is clearer?", type="multiple_choice", options=["A", "B"]),
+        ]
+        result = run_with_client(lambda client: client.submit_questions(questions))
+
+        assert [submission.question_id for submission in result] == ["q_test123", "q_2"]
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert len(json.loads(request.content)["questions"]) == 2
+
+    def test_submit_server_error(self, httpx_mock: HTTPXMock) -> None:
+        """Test 5xx responses raise ServerError."""
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/agent/questions",
+            json={"error": {"code": "SERVER_ERROR", "message": "Internal server error"}},
+            status_code=500,
+        )
+
+        with pytest.raises(ServerError):
+            run_with_client(lambda client: client.submit_question(prompt="Should this apologize?", type="text"))
+
+
+class TestAsyncGetQuestion:
+    """Tests for the async get_question and get_questions methods."""
+
+    def test_get_question(self, httpx_mock: HTTPXMock, question_response_partial: dict) -> None:
+        """Test getting a single question."""
+        httpx_mock.add_response(
+            method="GET",
+            url="https://api.example.com/agent/questions/q_test123",
+            json=question_response_partial,
+        )
+
+        result = run_with_client(lambda client: client.get_question("q_test123"))
+
+        assert result.status == "PARTIAL"
+        assert len(result.responses) == 3
+
+    def test_get_question_not_found(self, httpx_mock: HTTPXMock) -> None:
+        """Test a missing question raises QuestionNotFoundError with its ID."""
+        httpx_mock.add_response(
+            method="GET",
+            url="https://api.example.com/agent/questions/q_missing",
+            json={"error": {"code": "QUESTION_NOT_FOUND", "message": "Question not found"}},
+            status_code=404,
+        )
+
+        with pytest.raises(QuestionNotFoundError) as exc_info:
+            run_with_client(lambda client: client.get_question("q_missing"))
+
+        assert exc_info.value.question_id == "q_missing"
+
+    def test_get_questions_splits_large_batches(self, httpx_mock: HTTPXMock, question_response_open: dict) -> None:
+        """Test more IDs than one batch allows are split across concurrent requests."""
+        httpx_mock.add_response(method="GET", json={"questions": [question_response_open]}, is_reusable=True)
+
+        result = run_with_client(lambda client: client.get_questions([f"q_{i}" for i in range(MAX_POLL_IDS + 1)]))
+
+        assert set(result) == {"q_test123"}
+        sizes = sorted(len(request.url.params["ids"].split(",")) for request in httpx_mock.get_requests())
+        assert sizes == [1, MAX_POLL_IDS]
@@ -1,9 +1,13 @@
 """Tests for AskHumanClient."""
 
+import json
+
+import httpx
 import pytest
 from pytest_httpx import HTTPXMock
 
-from ask_a_human import AskHumanClient
+from ask_a_human import AskHumanClient, QuestionRequest
+from ask_a_human.client import MAX_POLL_IDS, MAX_SUBMIT_BATCH
 from ask_a_human.exceptions import (
     QuestionNotFoundError,
     QuotaExceededError,
@@ -222,6 +226,60 @@ class TestSubmitQuestion:
         assert exc_info.value.status_code == 500
 
 
+class TestSubmitQuestions:
+    """Tests for submit_questions method."""
+
+    def test_submit_questions_single_request(
+        self,
+        httpx_mock: HTTPXMock,
+        client: AskHumanClient,
+        question_submission_response: dict,
+    ) -> None:
+        """Test several questions are submitted with one batched request."""
+        httpx_mock.add_response(
+            method="POST",
+            url="https://api.example.com/agent/questions/batch",
+            json={"questions": [question_submission_response, {**question_submission_response, "question_id": "q_2"}]},
+            status_code=201,
+        )
+
+        result = client.submit_questions(
+            [
+                QuestionRequest(prompt="Should this error apologize?", type="text"),
+                QuestionRequest(prompt="Which label is clearer?", type="multiple_choice", options=["A", "B"]),
+            ]
+        )
+
+        assert [submission.question_id for submission in result] == ["q_test123", "q_2"]
+        request = httpx_mock.get_request()
+        assert request is not None
+        body = json.loads(request.content)
+        assert [question["type"] for question in body["questions"]] == ["text", "multiple_choice"]
+        assert "options" not in body["questions"][0]
+
+    def test_submit_questions_splits_large_batches(
+        self,
+        httpx_mock: HTTPXMock,
+        client: AskHumanClient,
+        question_submission_response: dict,
+    ) -> None:
+        """Test more questions than one batch allows are split across requests."""
+        httpx_mock.add_callback(
+            lambda request: httpx.Response(
+                201,
+                json={"questions": [question_submission_response] * len(json.loads(request.content)["questions"])},
+            ),
+            is_reusable=True,
+        )
+
+        questions = [QuestionRequest(prompt="Should this error apologize?", type="text")] * (MAX_SUBMIT_BATCH + 1)
+        result = client.submit_questions(questions)
+
+        assert len(result) == MAX_SUBMIT_BATCH + 1
+        sizes = [len(json.loads(request.content)["questions"]) for request in httpx_mock.get_requests()]
+        assert sizes == [MAX_SUBMIT_BATCH, 1]
+
+
 class TestGetQuestion:
     """Tests for get_question method."""
 
@@ -345,3 +403,44 @@ class TestGetQuestion:
 
         with pytest.raises(RateLimitError):
             client.get_question("q_test123")
+
+
+class TestGetQuestions:
+    """Tests for get_questions method."""
+
+    def test_get_questions_single_request(
+        self,
+        httpx_mock: HTTPXMock,
+        client: AskHumanClient,
+        question_response_open: dict,
+        question_response_partial: dict,
+    ) -> None:
+        """Test several questions are polled with one batched request."""
+        httpx_mock.add_response(
+            method="GET",
+            url="https://api.example.com/agent/questions?ids=q_test123%2Cq_test456%2Cq_missing",
+            json={"questions": [question_response_open, {**question_response_partial, "question_id": "q_test456"}]},
+        )
+
+        result = client.get_questions(["q_test123", "q_test456", "q_missing", "q_test123"])
+
+        assert set(result) == {"q_test123", "q_test456"}
+        assert result["q_test456"].status == "PARTIAL"
+
+    def test_get_questions_splits_large_batches(
+        self,
+        httpx_mock: HTTPXMock,
+        client: AskHumanClient,
+    ) -> None:
+        """Test more IDs than one batch allows are split across requests."""
+        httpx_mock.add_response(method="GET", json={"questions": []}, is_reusable=True)
+
+        result = client.get_questions([f"q_{i}" for i in range(MAX_POLL_IDS + 1)])
+
+        assert result == {}
+        requests = httpx_mock.get_requests()
+        assert [len(request.url.params["ids"].split(",")) for request in requests] == [MAX_POLL_IDS, 1]
+
+    def test_get_questions_empty(self, client: AskHumanClient) -> None:
+        """Test no request is made when there is nothing to poll."""
+        assert client.get_questions([]) == {}
@@ -1,11 +1,13 @@
 """Tests for AskHumanOrchestrator."""
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from ask_a_human import AskHumanClient, AskHumanOrchestrator
-from ask_a_human.types import HumanResponse, QuestionResponse, QuestionSubmission
+from ask_a_human.exceptions import QuestionNotFoundError
+from ask_a_human.types import HumanResponse, QuestionRequest, QuestionResponse, QuestionSubmission
 
 
 @pytest.fixture
@@ -138,6 +140,28 @@ class TestSubmit:
         )
 
 
+class TestSubmitMany:
+    """Tests for submit_many method."""
+
+    def test_submit_many_delegates_to_client(
+        self,
+        orchestrator: AskHumanOrchestrator,
+        mock_client: MagicMock,
+        sample_submission: QuestionSubmission,
+    ) -> None:
+        """Test that submit_many submits every question in one client call."""
+        mock_client.submit_questions.return_value = [sample_submission, sample_submission]
+        questions = [
+            QuestionRequest(prompt="First test question", type="text"),
+            QuestionRequest(prompt="Second test question", type="text"),
+        ]
+
+        result = orchestrator.submit_many(questions)
+
+        assert result == [sample_submission, sample_submission]
+        mock_client.submit_questions.assert_called_once_with(questions)
+
+
 class TestPollOnce:
     """Tests for poll_once method."""
 
@@ -148,13 +172,13 @@ class TestPollOnce:
         partial_response: QuestionResponse,
     ) -> None:
         """Test polling a single question."""
-        mock_client.get_question.return_value = partial_response
+        mock_client.get_questions.return_value = {"q_test123": partial_response}
 
         results = orchestrator.poll_once(["q_test123"])
 
         assert "q_test123" in results
         assert results["q_test123"].status == "PARTIAL"
-        mock_client.get_question.assert_called_once_with("q_test123")
+        mock_client.get_questions.assert_called_once_with(["q_test123"])
 
     @pytest.mark.usefixtures("partial_response")
     def test_poll_once_multiple_questions(
@@ -176,14 +200,28 @@ class TestPollOnce:
             responses=[],
         )
 
-        mock_client.get_question.side_effect = [open_response, second_response]
+        mock_client.get_questions.return_value = {"q_test123": open_response, "q_test456": second_response}
 
         results = orchestrator.poll_once(["q_test123", "q_test456"])
 
         assert len(results) == 2
         assert "q_test123" in results
         assert "q_test456" in results
-        assert mock_client.get_question.call_count == 2
+        mock_client.get_questions.assert_called_once_with(["q_test123", "q_test456"])
+
+    def test_poll_once_missing_question(
+        self,
+        orchestrator: AskHumanOrchestrator,
+        mock_client: MagicMock,
+        open_response: QuestionResponse,
+    ) -> None:
+        """Test a question missing from the batched poll raises not found."""
+        mock_client.get_questions.return_value = {"q_test123": open_response}
+
+        with pytest.raises(QuestionNotFoundError) as exc_info:
+            orchestrator.poll_once(["q_test123", "q_missing"])
+
+        assert exc_info.value.question_id == "q_missing"
 
 
 class TestAwaitResponses:
@@ -196,13 +234,13 @@ class TestAwaitResponses:
         closed_response: QuestionResponse,
     ) -> None:
         """Test that await_responses returns immediately for closed questions."""
-        mock_client.get_question.return_value = closed_response
+        mock_client.get_questions.return_value = {"q_test123": closed_response}
 
         results = orchestrator.await_responses(["q_test123"], min_responses=5)
 
         assert results["q_test123"].status == "CLOSED"
         # Should only poll once since question is already closed
-        assert mock_client.get_question.call_count == 1
+        assert mock_client.get_questions.call_count == 1
 
     def test_await_returns_when_min_responses_reached(
         self,
@@ -211,14 +249,14 @@ class TestAwaitResponses:
         partial_response: QuestionResponse,
     ) -> None:
         """Test await returns when min_responses is reached."""
-        mock_client.get_question.return_value = partial_response
+        mock_client.get_questions.return_value = {"q_test123": partial_response}
 
         # Wait for 3 responses (partial_response has 3)
         results = orchestrator.await_responses(["q_test123"], min_responses=3)
 
         assert results["q_test123"].current_responses == 3
         # Should return after first poll since we have 3 responses
-        assert mock_client.get_question.call_count == 1
+        assert mock_client.get_questions.call_count == 1
 
     @patch("ask_a_human.orchestrator.time.sleep")
     def test_await_polls_until_responses(
@@ -232,16 +270,16 @@ class TestAwaitResponses:
     ) -> None:
         """Test await polls until responses arrive."""
         # Simulate: OPEN -> PARTIAL -> CLOSED
-        mock_client.get_question.side_effect = [
-            open_response,
-            partial_response,
-            closed_response,
+        mock_client.get_questions.side_effect = [
+            {"q_test123": open_response},
+            {"q_test123": partial_response},
+            {"q_test123": closed_response},
         ]
 
         results = orchestrator.await_responses(["q_test123"], min_responses=5, timeout=10)
 
         assert results["q_test123"].status == "CLOSED"
-        assert mock_client.get_question.call_count == 3
+        assert mock_client.get_questions.call_count == 3
 
     @patch("ask_a_human.orchestrator.time.sleep")
     @patch("ask_a_human.orchestrator.time.time")
@@ -254,7 +292,7 @@ class TestAwaitResponses:
         open_response: QuestionResponse,
     ) -> None:
         """Test await respects timeout."""
-        mock_client.get_question.return_value = open_response
+        mock_client.get_questions.return_value = {"q_test123": open_response}
 
         # Simulate time passing
         mock_time.side_effect = [0, 0.5, 1.0, 1.5, 2.0]  # 2 seconds total
@@ -280,12 +318,49 @@ class TestAwaitResponses:
             expires_at="2026-02-02T15:00:00Z",
             responses=[],
         )
-        mock_client.get_question.return_value = expired_response
+        mock_client.get_questions.return_value = {"q_test123": expired_response}
 
         results = orchestrator.await_responses(["q_test123"], min_responses=5)
 
         assert results["q_test123"].status == "EXPIRED"
-        assert mock_client.get_question.call_count == 1
+        assert mock_client.get_questions.call_count == 1
+
+
+class TestAwaitResponsesAsync:
+    """Tests for await_responses_async method."""
+
+    def test_await_async_polls_until_responses(
+        self,
+        orchestrator: AskHumanOrchestrator,
+        mock_client: MagicMock,
+        open_response: QuestionResponse,
+        partial_response: QuestionResponse,
+        closed_response: QuestionResponse,
+    ) -> None:
+        """Test the async wait polls until the question is done."""
+        mock_client.get_questions.side_effect = [
+            {"q_test123": open_response},
+            {"q_test123": partial_response},
+            {"q_test123": closed_response},
+        ]
+
+        results = asyncio.run(orchestrator.await_responses_async(["q_test123"], min_responses=5, timeout=10))
+
+        assert results["q_test123"].status == "CLOSED"
+        assert mock_client.get_questions.call_count == 3
+
+    def test_await_async_returns_partial_on_timeout(
+        self,
+        orchestrator: AskHumanOrchestrator,
+        mock_client: MagicMock,
+        open_response: QuestionResponse,
+    ) -> None:
+        """Test the async wait returns the last poll once the timeout passes."""
+        mock_client.get_questions.return_value = {"q_test123": open_response}
+
+        results = asyncio.run(orchestrator.await_responses_async(["q_test123"], min_responses=5, timeout=0.03))
+
+        assert results["q_test123"].status == "OPEN"
 
 
 class TestSubmitAndWait:
@@ -300,7 +375,7 @@ class TestSubmitAndWait:
     ) -> None:
         """Test submit_and_wait combines submit and await."""
         mock_client.submit_question.return_value = sample_submission
-        mock_client.get_question.return_value = closed_response
+        mock_client.get_questions.return_value = {"q_test123": closed_response}
 
         result = orchestrator.submit_and_wait(
             prompt="Test question",
@@ -310,7 +385,7 @@ class TestSubmitAndWait:
 
         assert result.status == "CLOSED"
         mock_client.submit_question.assert_called_once()
-        mock_client.get_question.assert_called_once()
+        mock_client.get_questions.assert_called_once()
 
     def test_submit_and_wait_custom_timeout(
         self,
@@ -321,7 +396,7 @@ class TestSubmitAndWait:
     ) -> None:
         """Test submit_and_wait with custom wait timeout."""
         mock_client.submit_question.return_value = sample_submission
-        mock_client.get_question.return_value = closed_response
+        mock_client.get_questions.return_value = {"q_test123": closed_response}
 
         result = orchestrator.submit_and_wait(
             prompt="Test question",